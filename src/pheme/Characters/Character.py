@@ -1,22 +1,134 @@
+from array import array
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from .Emotions import Emotions
 from .Personality import Personality
+from ..Interactions.InteractionRegistry import InteractionRegistry, KnownInteractions
+from ..Universe.EventSink import acceptingSink
 
 if TYPE_CHECKING:
     from ..Interactions.Interaction import Interaction
 
 
 class Character:
-    """Représente un personnage avec un nom, une personality et des émotions."""
+    """Représente un personnage avec un nom, une personality, des émotions et une position optionnelle."""
+
+    def __init__(self, name: str, personality: Personality, emotions: Emotions, position=None):
+        """Init un character avec nom, personality, émotions et position 2D/3D (None si hors de l'espace)."""
+        self._store = None
+        self._row = None
+        self._name = name
+        self._personality = personality
+        self._emotions = emotions
+        self._position = self._toPosition(position)
+
+        # Ids des interactions connues, triés, dans le registre du graph (le sien hors graph)
+        self._knowledge = array('I')
+        self._registry = None
+
+    @classmethod
+    def _view(cls, store, row: int) -> 'Character':
+        """Crée un character directement rattaché à une ligne déjà remplie du WorldStore."""
+        character = cls(None, Personality._view(store, row), Emotions._view(store, row))
+        character._store = store
+        character._row = row
+        character._registry = store.interactions
+        return character
+
+    @property
+    def id(self):
+        """Identifiant entier dense du character dans son graph (None s'il n'est rattaché à aucun)."""
+        return self._row
+
+    @property
+    def name(self) -> str:
+        if self._store is not None:
+            return self._store.nodeNames[self._row]
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        if self._store is not None:
+            self._store.renameNodes({self._row: name})
+        else:
+            self._name = name
+
+    @staticmethod
+    def _toPosition(position):
+        if position is None:
+            return None
+        position = tuple(float(value) for value in position)
+        return position + (0.0,) * (3 - len(position))
+
+    @property
+    def position(self):
+        """Position (x, y, z) du character, None s'il n'est pas placé dans l'espace."""
+        if self._store is not None:
+            position = self._store.getPosition(self._row)
+            return None if position is None else tuple(position.tolist())
+        return self._position
+
+    @position.setter
+    def position(self, position):
+        if self._store is not None:
+            self._store.setPosition(self._row, position)
+        else:
+            self._position = self._toPosition(position)
+
+    @property
+    def personality(self) -> Personality:
+        return self._personality
 
-    def __init__(self, name: str, personality: Personality, emotions: Emotions):
-        """Init un character avec nom, personality et émotions."""
-        self.name = name
-        self.personality = personality
-        self.emotions = emotions
+    @personality.setter
+    def personality(self, personality: Personality):
+        if self._store is not None:
+            self._personality._unbind()
+            if personality._isBound():
+                personality = personality.detached()
+            personality._bind(self._store, self._row)
+        self._personality = personality
 
-        self.knownInteractions = set()
+    @property
+    def emotions(self) -> Emotions:
+        return self._emotions
+
+    @emotions.setter
+    def emotions(self, emotions: Emotions):
+        if self._store is not None:
+            self._emotions._unbind()
+            if emotions._isBound():
+                emotions = emotions.detached()
+            emotions._bind(self._store, self._row)
+        self._emotions = emotions
+
+    def _bind(self, store, row: int):
+        """Rattache le character (personnalité et émotions) à une ligne du WorldStore."""
+        if self._personality._isBound():
+            self._personality = self._personality.detached()
+        if self._emotions._isBound():
+            self._emotions = self._emotions.detached()
+        self._personality._bind(store, row)
+        self._emotions._bind(store, row)
+        store.setPosition(row, self._position)
+        self._store = store
+        self._row = row
+        # Connaissances renumérotées dans le registre du graph
+        known = list(self.knownInteractions)
+        self._registry = store.interactions
+        self.knownInteractions = known
+
+    def _unbind(self):
+        """Détache le character du WorldStore en conservant ses valeurs (et ses connaissances, dans le registre du graph)."""
+        if self._store is not None:
+            self._name = self.name
+            self._position = self.position
+            self._personality._unbind()
+            self._emotions._unbind()
+            self._store = None
+            self._row = None
 
     def __str__(self) -> str:
         return f"{self.name} | Personnalité : {self.personality} | Émotions : {self.emotions}"
@@ -25,20 +137,101 @@ class Character:
         return self.__str__()
 
     def changeEmotions(self, newEmotions: Emotions):
-        anciennes = self.emotions
+        """Remplace les émotions ; événement 'emotions' si un récepteur est branché (EventSink)."""
+        sink = acceptingSink()
+        anciennes = self.emotions.values.copy() if sink is not None else None
         self.emotions = newEmotions
-        print(f"{self.name} change d'émotions : '{anciennes}' → '{newEmotions}'")
+        if sink is not None:
+            sink.emit('emotions', character=self.name, id=self.id, before=anciennes,
+                      after=self.emotions.values.copy())
+
+    def setEmotionValues(self, values):
+        """
+        Met à jour les émotions en place depuis un vecteur (6,), clampé dans [0, 1], sans créer
+        d'objet Emotions ; événement 'emotions' si un récepteur est branché (EventSink).
+        """
+        sink = acceptingSink()
+        anciennes = self._emotions.values.copy() if sink is not None else None
+        self._emotions.setArray(np.clip(values, 0.0, 1.0))
+        if sink is not None:
+            sink.emit('emotions', character=self.name, id=self.id, before=anciennes,
+                      after=self._emotions.values.copy())
 
     def changePersonality(self, newPersonality: Personality):
-        ancienne = self.personality
+        """Remplace la personnalité ; événement 'personality' si un récepteur est branché (EventSink)."""
+        sink = acceptingSink()
+        ancienne = self.personality.values.copy() if sink is not None else None
         self.personality = newPersonality
-        print(f"{self.name} change de personnalité : '{ancienne}' → '{newPersonality}'")
+        if sink is not None:
+            sink.emit('personality', character=self.name, id=self.id, before=ancienne,
+                      after=self.personality.values.copy())
+
+    @property
+    def knownInteractions(self) -> KnownInteractions:
+        """Interactions connues (vue en lecture seule sur les ids triés)."""
+        return KnownInteractions(self)
+
+    @knownInteractions.setter
+    def knownInteractions(self, interactions):
+        registry = self._interactionRegistry()
+        self._knowledge = array('I', sorted({registry.idOf(interaction) for interaction in interactions}))
+        if self._store is not None:
+            for iid in self._knowledge:
+                registry.addKnower(iid, self._row)
+
+    def knows(self, interaction: 'Interaction') -> bool:
+        """Le character connaît-il l'interaction ? (recherche dichotomique, O(log k))"""
+        knowledge = self._knowledge
+        if not knowledge:
+            return False
+        # registry.idOf(interaction, register=False), sans appel de méthode (chemin chaud de la diffusion)
+        iid = self._registry._ids.get(interaction)
+        if iid is None:
+            return False
+        index = bisect_left(knowledge, iid)
+        return index < len(knowledge) and knowledge[index] == iid
+
+    def learnAboutInteraction(self, interaction: 'Interaction') -> bool:
+        """Ajoute l'interaction aux connaissances ; renvoie False si elle était déjà connue."""
+        iid = self._interactionRegistry().idOf(interaction)
+        knowledge = self._knowledge
+        index = bisect_left(knowledge, iid)
+        if index < len(knowledge) and knowledge[index] == iid:
+            return False
+        knowledge.insert(index, iid)
+        if self._store is not None:
+            self._registry.addKnower(iid, self._row)
+        return True
+
+    def _interactionRegistry(self) -> InteractionRegistry:
+        """Registre où sont numérotées ses connaissances (créé à la demande pour un character hors graph)."""
+        if self._registry is None:
+            self._registry = InteractionRegistry()
+        return self._registry
+
+    def _forget(self, iid: int):
+        """Retire l'interaction d'id iid des connaissances (appelé par MemoryExpiry, l'index du registre est filtré à la lecture)."""
+        knowledge = self._knowledge
+        index = bisect_left(knowledge, iid)
+        if index < len(knowledge) and knowledge[index] == iid:
+            del knowledge[index]
+
+    def knownInteractionIds(self) -> np.ndarray:
+        """Copie des ids des interactions connues, triés."""
+        return np.array(self._knowledge, dtype=np.uint32)
 
-    def learnAboutInteraction(self, interaction: 'Interaction'):
-        self.knownInteractions.add(interaction)
+    def knownInteractionsSince(self, timestamp: float) -> list:
+        """Interactions connues datées de timestamp ou après, par id croissant."""
+        if not self._knowledge:
+            return []
+        registry = self._registry
+        ids = self.knownInteractionIds()
+        ids = ids[registry.timestampsOf(ids) >= timestamp]
+        return [interaction for interaction in map(registry.get, ids.tolist()) if interaction is not None]
 
     def forgetInteractionsOlderThan(self, currentTimestamp: float, maxInteractionAge: float):
-        self.knownInteractions = {
-            interaction for interaction in self.knownInteractions
-            if interaction.timestamp >= (currentTimestamp - maxInteractionAge)
-        }
+        if not self._knowledge:
+            return
+        ids = self.knownInteractionIds()
+        keep = self._registry.timestampsOf(ids) >= (currentTimestamp - maxInteractionAge)
+        self._knowledge = array('I', ids[keep].tolist())
@@ -1,14 +1,18 @@
 import numpy as np
 
+from ..Universe.WorldStore import StoreView, StoreField
 
-class Emotions:
+
+class Emotions(StoreView):
     """Représente les émotions d'un character avec des valeurs float entre 0 et 1."""
-    happiness: float
-    sadness: float
-    anger: float
-    fear: float
-    surprise: float
-    disgust: float
+    _table = 'emotions'
+
+    happiness = StoreField(0)
+    sadness = StoreField(1)
+    anger = StoreField(2)
+    fear = StoreField(3)
+    surprise = StoreField(4)
+    disgust = StoreField(5)
 
     def __init__(self, happiness: float = 0.0,
                  sadness: float = 0.0,
@@ -17,12 +21,7 @@ class Emotions:
                  surprise: float = 0.0,
                  disgust: float = 0.0):
         """Init les émotions avec clamp [0,1]."""
-        self.happiness = max(0.0, min(1.0, happiness))
-        self.sadness = max(0.0, min(1.0, sadness))
-        self.anger = max(0.0, min(1.0, anger))
-        self.fear = max(0.0, min(1.0, fear))
-        self.surprise = max(0.0, min(1.0, surprise))
-        self.disgust = max(0.0, min(1.0, disgust))
+        self._initValues(np.clip([happiness, sadness, anger, fear, surprise, disgust], 0.0, 1.0))
 
     def updateEmotions(self, change):
         self.updateGoodEmotions(change)
@@ -48,13 +47,3 @@ class Emotions:
 
     def __str__(self):
         return self.__repr__()
-
-    def asArray(self):
-        return np.array([
-            self.happiness,
-            self.sadness,
-            self.anger,
-            self.fear,
-            self.surprise,
-            self.disgust
-        ])
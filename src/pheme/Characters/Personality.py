@@ -3,8 +3,10 @@ from typing import Optional
 
 import numpy as np
 
+from ..Universe.WorldStore import StoreView, StoreField
 
-class Personality:
+
+class Personality(StoreView):
     """
     Implémentation de la personality avec le modèle Big Five:
     - ouverture à l'expérience vs conformisme
@@ -16,11 +18,13 @@ class Personality:
     Chaque trait entre -1 et 1.
     https://fr.wikipedia.org/wiki/Mod%C3%A8le_des_Big_Five_(psychologie)
     """
-    openness: float
-    conscientiousness: float
-    extraversion: float
-    agreeableness: float
-    neuroticism: float
+    _table = 'personalities'
+
+    openness = StoreField(0)
+    conscientiousness = StoreField(1)
+    extraversion = StoreField(2)
+    agreeableness = StoreField(3)
+    neuroticism = StoreField(4)
 
     def __init__(self, openness: Optional[float] = None,
                  conscientiousness: Optional[float] = None,
@@ -28,11 +32,13 @@ class Personality:
                  agreeableness: Optional[float] = None,
                  neuroticism: Optional[float] = None):
         """Init la personality avec valeurs données ou random."""
-        self.openness = self._initialize_trait(openness)
-        self.conscientiousness = self._initialize_trait(conscientiousness)
-        self.extraversion = self._initialize_trait(extraversion)
-        self.agreeableness = self._initialize_trait(agreeableness)
-        self.neuroticism = self._initialize_trait(neuroticism)
+        self._initValues([
+            self._initialize_trait(openness),
+            self._initialize_trait(conscientiousness),
+            self._initialize_trait(extraversion),
+            self._initialize_trait(agreeableness),
+            self._initialize_trait(neuroticism)
+        ])
 
     @staticmethod
     def _initialize_trait(value: Optional[float]) -> float:
@@ -42,20 +48,8 @@ class Personality:
         return random() * 2 - 1  # Random entre -1 et 1
 
     def getMixPersonality(A, B):
-        personalityA = np.array([
-            A.openness,
-            A.conscientiousness,
-            A.extraversion,
-            A.agreeableness,
-            A.neuroticism
-        ])
-        personalityB = np.array([
-            B.openness,
-            B.conscientiousness,
-            B.extraversion,
-            B.agreeableness,
-            B.neuroticism
-        ])
+        personalityA = A.values
+        personalityB = B.values
 
         produit = np.dot(personalityA, personalityB)
         normeA = np.linalg.norm(personalityA)
@@ -75,12 +69,3 @@ class Personality:
 
     def __str__(self):
         return self.__repr__()
-
-    def asArray(self):
-        return np.array([
-            self.openness,
-            self.conscientiousness,
-            self.extraversion,
-            self.agreeableness,
-            self.neuroticism
-        ])
@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 from ..Characters.Personality import Personality
 from ..Relationships.TypeRelationship import TypeRelationship
 from ..Universe.Graph import Graph
@@ -8,11 +10,23 @@ from ..Universe.Graph import Graph
 class EvolutionManager:
     """Gère l'évolution automatique des relations et émotions dans le graph."""
 
-    def __init__(self, graph: Graph):
+    def __init__(self, graph: Graph, scope=None, rng: np.random.Generator = None):
+        """
+        Args:
+            graph: Le graph à faire évoluer
+            scope: ids des characters dont ce manager a la charge (tous si None), utilisé par les shards
+            rng: générateur numpy des tirages vectorisés (par défaut, graine tirée du module random,
+                pour que random.seed rende l'évolution reproductible)
+        """
         self.graph = graph
+        self.scope = scope
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
         self.probRelationship = 0.3
         self.decayEmotion = 0.05
 
+    def _inScope(self, nodeId) -> bool:
+        return self.scope is None or nodeId in self.scope
+
     def evolve(self):
         """Evolution complète : création relations + update relations + update émotions."""
         self.createRelationship()
@@ -24,6 +38,8 @@ class EvolutionManager:
         characters = self.graph.listNode
 
         for characterIntermediaire in characters:
+            if not self._inScope(characterIntermediaire.id):
+                continue
             relationship_characterIntermediaire = self.getListRelationship(characterIntermediaire.name)
             listRelationship = list(relationship_characterIntermediaire.items())
             for i, (nameA, relationshipA) in enumerate(listRelationship):
@@ -104,46 +120,85 @@ class EvolutionManager:
             characterA.emotions.updateEmotions(-1 * typeRelationship.getIntensity())
             characterB.emotions.updateEmotions(-1 * typeRelationship.getIntensity())
 
-    def updateRelationships(self):
-        for relationship in self.graph.listEdge:
-            source = self.graph.getNode(relationship.source)
-            target = self.graph.getNode(relationship.target)
-
-            personality = Personality.getMixPersonality(source.personality, target.personality)
-            personality = (personality - 0.5) * 0.1
-
-            relationship.typeRelationship.update(self.getMix(0, personality))
-
-    def updateEmotions(self):
-        for character in self.graph.listNode:
-            character.emotions.updateEmotions(self.decayEmotion)
-
-            averageRelationship = self.getAverageRelationship(character.name)
-
-            if averageRelationship > 0.3:
-                character.emotions.updateEmotions(averageRelationship)
-            elif averageRelationship < -0.2:
-                character.emotions.updateEmotions(averageRelationship)
+    def updateRelationships(self) -> np.ndarray:
+        """
+        Dérive de toutes les relations (entre characters, source dans le scope) en une passe sur
+        la table Sternberg (E×3) du WorldStore ; renvoie les lignes mises à jour.
+
+        Pour chaque relation, comme TypeRelationship.update(getMix(0, (similarité - 0.5) × 0.1)) :
+            s = cos(p_source, p_cible)  (0.5 si une personnalité est nulle, comme getMixPersonality)
+            c = clamp((s - 0.5) × 0.1 + u, -1, 1), u ~ U(-0.1, 0.1) tiré par self.rng
+            r = clamp(r - c × [0.1, 0.15, 0.1], -1, 1)
+        """
+        store = self.graph.store
+        rows = store.edgeRows()
+        sources = store.edgeSource[rows]
+        targets = store.edgeTarget[rows]
+        keep = store.nodeAlive[sources] & store.nodeAlive[targets]
+        if self.scope is not None:
+            keep &= np.isin(sources, np.fromiter(self.scope, dtype=np.int64))
+        rows, sources, targets = rows[keep], sources[keep], targets[keep]
+
+        personalitiesSource = store.personalities[sources]
+        personalitiesTarget = store.personalities[targets]
+        norms = np.linalg.norm(personalitiesSource, axis=1) * np.linalg.norm(personalitiesTarget, axis=1)
+        products = np.einsum('ij,ij->i', personalitiesSource, personalitiesTarget)
+        similarity = np.full(len(rows), 0.5)
+        np.divide(products, norms, out=similarity, where=norms != 0)
+
+        change = np.clip((similarity - 0.5) * 0.1 + self.rng.uniform(-0.1, 0.1, len(rows)), -1.0, 1.0)
+        relationships = store.relationships[rows] - change[:, None] * np.array([0.1, 0.15, 0.1])
+        store.writeRows('relationships', rows, np.clip(relationships, -1.0, 1.0))
+        return rows
+
+    def updateEmotions(self) -> np.ndarray:
+        """
+        Évolution des émotions de tous les characters (du scope) en une passe sur la table des
+        émotions (N×6) du WorldStore ; renvoie les ids mis à jour.
+
+        Comme Emotions.updateEmotions(decayEmotion) puis, si la moyenne m des relations du character
+        dépasse 0.3 ou passe sous -0.2, Emotions.updateEmotions(m) :
+            e = clamp(e ± change × [0.38, 0.35, 0.48, 0.41, 0.59, 0.54] / 2, 0, 1)
+        (+ pour joie et surprise, - pour les autres). Les moyennes sont lues dans les
+        RelationshipAggregates du graph, tenus à jour à chaque écriture de relation.
+        """
+        store = self.graph.store
+        ids = store.nodeRows()
+        if self.scope is not None:
+            ids = ids[np.isin(ids, np.fromiter(self.scope, dtype=np.int64))]
+
+        emotions = self._updatedEmotions(store.emotions[ids], np.full(len(ids), self.decayEmotion))
+        averages = self.graph.relationshipAggregates.averages(ids)
+        strong = (averages > 0.3) | (averages < -0.2)
+        emotions[strong] = self._updatedEmotions(emotions[strong], averages[strong])
+        store.writeRows('emotions', ids, emotions)
+        return ids
+
+    @staticmethod
+    def _updatedEmotions(emotions: np.ndarray, change: np.ndarray) -> np.ndarray:
+        """Emotions.updateEmotions(change) ligne par ligne (change : un coefficient par ligne)."""
+        signs = np.array([1.0, -1.0, -1.0, -1.0, 1.0, -1.0])
+        weights = np.array([0.38, 0.35, 0.48, 0.41, 0.59, 0.54])
+        return np.clip(emotions + signs * (change[:, None] * weights / 2), 0.0, 1.0)
 
     def getAverageRelationship(self, name):
-        listRelationships = []
-        for relationship in self.graph.listEdge:
-            if relationship.source == name or relationship.target == name:
-                listRelationships.append(relationship.typeRelationship.getAverage())
-        return sum(listRelationships) / len(listRelationships) if listRelationships else 0
+        """Moyenne des relations (sortantes et entrantes) du character, en O(1)."""
+        character = self.graph.getNode(name)
+        if character is None:
+            return 0
+        return self.graph.relationshipAggregates.average(character.id)
 
     def getListRelationship(self, name):
+        character = self.graph.getNode(name)
+        if character is None:
+            return {}
         listRelationships = {}
-        for relationship in self.graph.listEdge:
-            if relationship.source == name:
-                listRelationships[relationship.target] = relationship
-            elif relationship.target == name:
+        for relationship in self.graph.getOutEdges(character):
+            listRelationships[relationship.target] = relationship
+        for relationship in self.graph.getInEdges(character):
+            if relationship.sourceId != character.id:
                 listRelationships[relationship.source] = relationship
         return listRelationships
 
     def alreadyRelationship(self, nameA, nameB):
-        for relationship in self.graph.listEdge:
-            if ((relationship.source == nameA and relationship.target == nameB) or (
-                    relationship.target == nameA and relationship.source == nameB)):
-                return True
-        return False
+        return self.graph.getEdge(nameA, nameB) is not None or self.graph.getEdge(nameB, nameA) is not None
@@ -2,9 +2,18 @@ import numpy as np
 
 
 class EngineConfiguration:
-    """Config du système de relations sociales avec matrices et paramètres."""
+    """
+    Config du système de relations sociales avec matrices et paramètres.
+
+    Chaque affectation d'un paramètre sur une instance incrémente version, ce qui fait recompiler
+    les tables d'InteractionKernels du moteur ; après une modification en place d'une matrice,
+    appeler markChanged().
+    """
     alpha = 0.3
 
+    # Numéro de version des paramètres de l'instance
+    version = 0
+
     # === Émotions ===
 
     # Matrice transformation directe : Interaction (5D) -> Emotions (6D)
@@ -70,7 +79,30 @@ class EngineConfiguration:
     # Poids de la moyenne des personnalités pour les relations directes
     personality_compatibility_weight = 0.5
 
+    # === Diffusion (bouche-à-oreille) ===
+
+    # Une info relayée perd de sa force à chaque relais :
+    #   force_relayée = force × a × ((1 - w) + w × fiabilité), fiabilité = (confidence / 100 + intensité) / 2
+
+    # Atténuation à chaque relais (a)
+    propagation_hop_attenuation = 0.9
+
+    # Poids de la fiabilité de la relation dans l'atténuation (w)
+    propagation_trust_weight = 0.5
+
+    # Force minimale d'une info relayée : en dessous, elle n'est plus transmise
+    propagation_strength_threshold = 0.1
+
     # === Clamping ===
 
     relationship_min = -1.0
     relationship_max = 1.0
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != 'version':
+            object.__setattr__(self, 'version', self.version + 1)
+
+    def markChanged(self):
+        """Signale une modification en place (ex. d'une matrice) des paramètres."""
+        self.version += 1
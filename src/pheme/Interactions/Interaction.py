@@ -1,15 +1,17 @@
 from random import random
 from typing import Optional
 
-import numpy as np
-
 from ..Characters.Character import Character
+from ..Universe.WorldStore import StoreView, StoreField
 
 
-class Interaction:
+class Interaction(StoreView):
     """
     Interaction entre deux characters selon le modèle circomplexe interpersonnel.
     Définie par un vecteur à 5 dimensions.
+    Numérotée dans le registre du graph (WorldStore.interactions) des characters qui l'apprennent.
+    Les interactions du catalogue (Interactions.py) portent l'indice de leur type (kind), qui
+    sert d'entrée dans les tables précalculées d'InteractionKernels ; le modifier les en détache.
     """
 
     # Characters impliqués
@@ -17,13 +19,14 @@ class Interaction:
     target: Character  # character qui reçoit l'action
     description: str
     timestamp: float
+    kind: Optional[int] = None  # indice du type dans Interactions.CATALOGUE (None : vecteur libre)
 
-    # Dimensions de l'interaction
-    agency: float  # assertivité/dominance (-1 à +1)
-    communion: float  # prosocial vs antisocial (-1 à +1)
-    intensity: float  # niveau d'énergie/activation (0 à 1)
-    physical_contact: float  # contact physique vs verbal (0 à 1)
-    valence: float  # positif vs négatif pour la cible (-1 à +1)
+    # Dimensions de l'interaction (vecteur 5D, jamais rattaché au WorldStore)
+    agency = StoreField(0)  # assertivité/dominance (-1 à +1)
+    communion = StoreField(1)  # prosocial vs antisocial (-1 à +1)
+    intensity = StoreField(2)  # niveau d'énergie/activation (0 à 1)
+    physical_contact = StoreField(3)  # contact physique vs verbal (0 à 1)
+    valence = StoreField(4)  # positif vs négatif pour la cible (-1 à +1)
 
     def __init__(self, actor: Character, target: Character, description: str, timestamp: float,
                  agency: Optional[float] = None,
@@ -36,11 +39,21 @@ class Interaction:
         self.target = target
         self.description = description
         self.timestamp = timestamp
-        self.agency = self._initialize_bipolar_trait(agency)
-        self.communion = self._initialize_bipolar_trait(communion)
-        self.intensity = self._initialize_unipolar_trait(intensity)
-        self.physical_contact = self._initialize_unipolar_trait(physical_contact)
-        self.valence = self._initialize_bipolar_trait(valence)
+        self._initValues([
+            self._initialize_bipolar_trait(agency),
+            self._initialize_bipolar_trait(communion),
+            self._initialize_unipolar_trait(intensity),
+            self._initialize_unipolar_trait(physical_contact),
+            self._initialize_bipolar_trait(valence)
+        ])
+
+    def setArray(self, values):
+        self.kind = None
+        super().setArray(values)
+
+    def _setField(self, column: int, value: float):
+        self.kind = None
+        super()._setField(column, value)
 
     @staticmethod
     def _initialize_bipolar_trait(value: Optional[float]) -> float:
@@ -66,12 +79,3 @@ class Interaction:
 
     def __str__(self):
         return self.__repr__()
-
-    def asArray(self):
-        return np.array([
-            self.agency,
-            self.communion,
-            self.intensity,
-            self.physical_contact,
-            self.valence
-        ])
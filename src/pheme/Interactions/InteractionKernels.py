@@ -0,0 +1,91 @@
+import numpy as np
+
+from .EngineConfiguration import EngineConfiguration
+from .Interactions import CATALOGUE
+
+
+class InteractionKernels:
+    """
+    Effets précalculés des types d'interaction du catalogue pour une EngineConfiguration.
+
+    Pour chaque type (indice kind de Interactions.CATALOGUE) et chaque rôle, les changements bruts
+    avant modulation par la personnalité :
+        - cible directe : Δe = M_e @ i, Δr = M_r @ i, relations associées (M_r × β_r) @ i
+        - acteur direct : idem avec la valence atténuée (actor_valence_attenuation)
+        - observateur indirect : Δe = (M_e × β_e) @ i, Δr = (M_r × β_r) @ i
+    Traiter une interaction du catalogue revient alors à lire une ligne de table (multipliée par
+    la force de l'info reçue pour les effets indirects). Les interactions hors catalogue
+    (kind None) passent par les matrices atténuées, elles aussi précalculées.
+
+    Compilées pour une version de la configuration (config.version) : le moteur les reconstruit
+    quand elle change (voir InteractionsEngine.kernels).
+    """
+
+    TARGET = 0
+    ACTOR = 1
+
+    def __init__(self, config: EngineConfiguration, catalogue: dict = CATALOGUE):
+        self.config = config
+        self.version = config.version
+
+        emotion = config.interaction_to_emotion_direct
+        relationship = config.interaction_to_relationship_direct
+        self.emotionIndirect = emotion * config.indirect_emotion_attenuation
+        self.relationshipIndirect = relationship * config.indirect_relationship_attenuation
+        self.actorValenceAttenuation = config.actor_valence_attenuation
+
+        # Vecteurs des types par rôle : [cible, acteur] (mêmes opérations que le calcul direct)
+        vectors = [np.array(vector, dtype=float) for vector in catalogue.values()]
+        roles = (vectors, [self._actorVector(vector) for vector in vectors])
+
+        # Tables (rôle, type, dimension)
+        self.emotionTable = self._table(emotion, roles)
+        self.relationshipTable = self._table(relationship, roles)
+        self.relationshipIndirectTable = self._table(self.relationshipIndirect, roles)
+        # Observateur indirect : (type, dimension)
+        self.emotionIndirectTable = self._table(self.emotionIndirect, roles)[self.TARGET]
+
+    def _actorVector(self, interaction_vector: np.ndarray) -> np.ndarray:
+        vector = interaction_vector.copy()
+        vector[4] *= self.actorValenceAttenuation
+        return vector
+
+    @staticmethod
+    def _table(matrix: np.ndarray, roles) -> np.ndarray:
+        table = np.array([[matrix @ vector for vector in vectors] for vectors in roles],
+                         dtype=float).reshape(len(roles), len(roles[0]), matrix.shape[0])
+        table.flags.writeable = False
+        return table
+
+    def direct(self, interaction, is_actor: bool):
+        """
+        Changements bruts pour un participant : (Δe, Δr avec l'autre participant,
+        Δr avec les characters associés à l'autre participant).
+        """
+        kind = interaction.kind
+        if kind is not None:
+            role = self.ACTOR if is_actor else self.TARGET
+            return (self.emotionTable[role, kind], self.relationshipTable[role, kind],
+                    self.relationshipIndirectTable[role, kind])
+
+        interaction_vector = interaction.values
+        if is_actor:
+            interaction_vector = self._actorVector(interaction_vector)
+        return (self.config.interaction_to_emotion_direct @ interaction_vector,
+                self.config.interaction_to_relationship_direct @ interaction_vector,
+                self.relationshipIndirect @ interaction_vector)
+
+    def indirect(self, interaction, strength: float = 1.0):
+        """Changements bruts pour un observateur : (Δe, Δr avec les participants connus)."""
+        kind = interaction.kind
+        if kind is not None:
+            emotion_delta = self.emotionIndirectTable[kind]
+            relationship_delta = self.relationshipIndirectTable[self.TARGET, kind]
+        else:
+            emotion_delta = self.emotionIndirect @ interaction.values
+            relationship_delta = self.relationshipIndirect @ interaction.values
+        if strength != 1.0:
+            # Les changements indirects sont linéaires en i : Δ(s × i) = s × Δ(i)
+            emotion_delta = emotion_delta * strength
+            relationship_delta = relationship_delta * strength
+        return emotion_delta, relationship_delta
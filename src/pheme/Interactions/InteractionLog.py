@@ -0,0 +1,195 @@
+from array import array
+
+import numpy as np
+
+
+class InteractionLog:
+    """
+    Historique des interactions en colonnes (tableau structuré numpy), en ajout seul.
+
+    Une ligne par interaction, d'indice son id (InteractionRegistry) : acteur, cible (ids des
+    characters, -1 si hors graph), tick (Interaction.timestamp), code de description et vecteur
+    circomplexe 5D au moment de la création. Index par acteur et par cible (lignes en ordre
+    d'ajout) : quand l'id d'un character est libéré (forgetCharacter), ses lignes gardent l'id mais
+    passent dans l'index des anciens titulaires (requêtes avec released=True), pour qu'un character
+    qui réutilise l'id n'hérite pas de son historique. Tant que les ticks sont ajoutés dans
+    l'ordre, une plage de temps se trouve par dichotomie, sinon par un parcours vectorisé.
+
+    Exemple : actes hostiles de X sur les 1000 derniers ticks
+        rows = log.query(actor=x.id, start=now - 1000)
+        rows = rows[log.valences(rows) < 0]
+    """
+
+    DTYPE = np.dtype([('actor', np.int64), ('target', np.int64), ('tick', np.float64),
+                      ('description', np.int32), ('vector', np.float64, (5,))])
+
+    def __init__(self, capacity: int = 64):
+        self.records = np.zeros(max(1, capacity), dtype=self.DTYPE)
+        self.count = 0
+        # Interning des descriptions : code -> description et description -> code
+        self.descriptions = []
+        self.descriptionCodes = {}
+        # id character -> lignes (array('I')) où il est acteur / cible
+        self._byActor = {}
+        self._byTarget = {}
+        # Mêmes index pour les anciens titulaires des ids libérés, et libérations (id, lignes écrites alors)
+        self._releasedByActor = {}
+        self._releasedByTarget = {}
+        self.releases = []
+        # Ticks ajoutés en ordre croissant (plage de temps par dichotomie)
+        self._timeSorted = True
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Vue sur les lignes écrites."""
+        return self.records[:self.count]
+
+    def append(self, actorId: int, targetId: int, tick: float, description: str, vector) -> int:
+        """Ajoute une interaction en fin de journal ; renvoie sa ligne."""
+        return self.record(self.count, actorId, targetId, tick, description, vector)
+
+    def record(self, row: int, actorId: int, targetId: int, tick: float, description: str, vector) -> int:
+        """Écrit la ligne row (au-delà de la fin : les lignes sautées restent vides, tick NaN)."""
+        if row >= len(self.records):
+            grown = np.zeros(max(2 * len(self.records), row + 1), dtype=self.DTYPE)
+            grown[:self.count] = self.records[:self.count]
+            self.records = grown
+        if row >= self.count:
+            blank = self.records[self.count:row]
+            blank['actor'] = -1
+            blank['target'] = -1
+            blank['tick'] = np.nan
+            blank['description'] = -1
+            if row > self.count or tick != tick or (self.count and not self.records['tick'][self.count - 1] <= tick):
+                self._timeSorted = False
+            self.count = row + 1
+        else:
+            self._timeSorted = False
+
+        self.records[row] = (actorId, targetId, tick, self.descriptionCode(description, create=True), vector)
+        self._byActor.setdefault(actorId, array('I')).append(row)
+        self._byTarget.setdefault(targetId, array('I')).append(row)
+        return row
+
+    def forgetCharacter(self, characterId: int):
+        """
+        L'id characterId est libéré : ses lignes gardent l'id mais passent dans l'index des anciens
+        titulaires ; les lignes écrites ensuite avec cet id sont celles du character qui le réutilise.
+        """
+        self.releases.append((characterId, self.count))
+        for index, released in ((self._byActor, self._releasedByActor), (self._byTarget, self._releasedByTarget)):
+            rows = index.pop(characterId, None)
+            if rows:
+                released.setdefault(characterId, array('I')).extend(rows)
+
+    def descriptionCode(self, description: str, create: bool = False):
+        """Code d'une description (None si elle n'apparaît pas dans le journal)."""
+        code = self.descriptionCodes.get(description)
+        if code is None and create:
+            code = self.descriptionCodes[description] = len(self.descriptions)
+            self.descriptions.append(description)
+        return code
+
+    # === Requêtes ===
+
+    def byActor(self, actorId: int, released: bool = False) -> np.ndarray:
+        """Lignes où actorId est acteur (released : celles des anciens titulaires de l'id)."""
+        index = self._releasedByActor if released else self._byActor
+        return np.array(index.get(actorId, ()), dtype=np.int64)
+
+    def byTarget(self, targetId: int, released: bool = False) -> np.ndarray:
+        """Lignes où targetId est cible (released : celles des anciens titulaires de l'id)."""
+        index = self._releasedByTarget if released else self._byTarget
+        return np.array(index.get(targetId, ()), dtype=np.int64)
+
+    def inTimeRange(self, start=None, end=None) -> np.ndarray:
+        """Lignes dont le tick est dans [start, end] (bornes None : ouvertes)."""
+        ticks = self.records['tick'][:self.count]
+        if self._timeSorted:
+            first = 0 if start is None else int(np.searchsorted(ticks, start, side='left'))
+            last = self.count if end is None else int(np.searchsorted(ticks, end, side='right'))
+            return np.arange(first, last, dtype=np.int64)
+        mask = ~np.isnan(ticks)
+        if start is not None:
+            mask &= ticks >= start
+        if end is not None:
+            mask &= ticks <= end
+        return np.flatnonzero(mask)
+
+    def query(self, actor=None, target=None, start=None, end=None, description=None,
+              released: bool = False) -> np.ndarray:
+        """
+        Lignes (ids des interactions) qui vérifient tous les critères donnés, par ordre croissant.
+
+        Args:
+            actor, target: ids des characters
+            start, end: plage de ticks [start, end]
+            description: description exacte (ex. 'insulted')
+            released: actor (ou, sans actor, target) désigne les anciens titulaires d'un id libéré
+        """
+        if actor is not None:
+            rows = np.unique(self.byActor(actor, released))
+        elif target is not None:
+            rows = np.unique(self.byTarget(target, released))
+        else:
+            rows = self.inTimeRange(start, end)
+            start = end = None
+
+        records = self.records
+        if target is not None and actor is not None:
+            # Par l'index : les lignes des anciens titulaires de l'id target sont écartées
+            rows = np.intersect1d(rows, self.byTarget(target))
+        if start is not None:
+            rows = rows[records['tick'][rows] >= start]
+        if end is not None:
+            rows = rows[records['tick'][rows] <= end]
+        if description is not None:
+            code = self.descriptionCode(description)
+            if code is None:
+                return np.zeros(0, dtype=np.int64)
+            rows = rows[records['description'][rows] == code]
+        return rows
+
+    def ticks(self, rows: np.ndarray) -> np.ndarray:
+        return self.records['tick'][rows]
+
+    def vectors(self, rows: np.ndarray) -> np.ndarray:
+        """Vecteurs circomplexes [agency, communion, intensity, physical_contact, valence] des lignes."""
+        return self.records['vector'][rows]
+
+    def valences(self, rows: np.ndarray) -> np.ndarray:
+        return self.records['vector'][rows, 4]
+
+    def save(self, path: str):
+        """Écrit le journal (lignes et descriptions) dans un fichier .npz."""
+        np.savez(path, records=self.rows, descriptions=np.array(self.descriptions, dtype=object),
+                 releases=np.array(self.releases, dtype=np.int64).reshape(-1, 2))
+
+    @classmethod
+    def load(cls, path: str) -> 'InteractionLog':
+        """Relit un journal écrit par save."""
+        with np.load(path, allow_pickle=True) as data:
+            records = data['records']
+            descriptions = data['descriptions'].tolist()
+            releases = [tuple(release) for release in data['releases'].tolist()] if 'releases' in data else []
+        log = cls(len(records))
+        log.records[:len(records)] = records
+        log.count = len(records)
+        log.descriptions = descriptions
+        log.descriptionCodes = {description: code for code, description in enumerate(descriptions)}
+        ticks = records['tick']
+        log._timeSorted = not np.isnan(ticks).any() and bool(np.all(np.diff(ticks) >= 0))
+        log.releases = releases
+        # Lignes écrites avant la dernière libération d'un id : celles de ses anciens titulaires
+        lastRelease = dict(releases)
+        written = records['description'] >= 0
+        for row, actorId, targetId in zip(np.flatnonzero(written).tolist(), records['actor'][written].tolist(),
+                                          records['target'][written].tolist()):
+            index = log._releasedByActor if row < lastRelease.get(actorId, 0) else log._byActor
+            index.setdefault(actorId, array('I')).append(row)
+            index = log._releasedByTarget if row < lastRelease.get(targetId, 0) else log._byTarget
+            index.setdefault(targetId, array('I')).append(row)
+        return log
@@ -0,0 +1,141 @@
+from array import array
+
+import numpy as np
+
+from .InteractionLog import InteractionLog
+
+
+class InteractionRegistry:
+    """
+    Registre des interactions connues des characters d'un graph (WorldStore.interactions) : une
+    interaction y reçoit un id entier dense la première fois qu'un character du graph l'apprend,
+    ou que le moteur la traite (InteractionsEngine, ShardedSimulation), même si personne ne l'apprend.
+    Les connaissances des characters ne stockent que ces ids (4 octets chacun). Un character hors
+    de tout graph numérote ses connaissances dans son propre registre.
+
+    Le registre garde l'objet de chaque interaction jusqu'à ce que plus aucun character ne la
+    connaisse (release, appelé par MemoryExpiry) ; un id libéré n'est jamais réattribué. Il tient
+    aussi, par interaction, les ids des characters du graph qui l'ont apprise (index de
+    Graph.getKnowers et de MemoryExpiry) ; un id de character libéré ou réutilisé, ou une
+    connaissance oubliée depuis, y reste jusqu'à la prochaine lecture qui l'écarte (keepKnowers). Chaque
+    interaction enregistrée est inscrite dans l'historique en colonnes (log, ligne = id), qui
+    survit à la libération : acteur, cible, horodatage, description et vecteur, pour les requêtes
+    du type « ce que X sait depuis T » ou « actes de X sur une période ».
+    """
+
+    def __init__(self, store=None):
+        """
+        Args:
+            store: WorldStore du graph (les acteurs et cibles d'un autre graph sont journalisés à -1)
+        """
+        self._store = store
+        # id -> interaction (None une fois libérée) et interaction -> id
+        self._interactions = []
+        self._ids = {}
+        # id -> ids des characters du graph qui l'ont apprise (entrées périmées écartées à la lecture)
+        self._knowers = {}
+        self.log = InteractionLog()
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Horodatages indexés par id."""
+        return self.log.records['tick']
+
+    def __len__(self):
+        """Nombre d'interactions gardées (enregistrées et pas encore libérées)."""
+        return len(self._ids)
+
+    def idOf(self, interaction, register: bool = True):
+        """Id de l'interaction, attribué au besoin (None si elle n'est pas enregistrée et register est faux)."""
+        iid = self._ids.get(interaction)
+        if iid is None and register:
+            iid = self._ids[interaction] = len(self._interactions)
+            self._interactions.append(interaction)
+            self._record(iid, interaction)
+            # Suivie par l'oubli dès son enregistrement : libérée même si personne ne l'apprend
+            memory = self._store.memoryExpiry if self._store is not None else None
+            if memory is not None:
+                memory.watch(iid)
+        return iid
+
+    def register(self, interaction) -> int:
+        """Enregistre une interaction ; renvoie son id."""
+        return self.idOf(interaction)
+
+    def release(self, iid: int):
+        """Oublie l'objet de l'interaction iid (plus aucun character ne la connaît) ; sa ligne du journal reste."""
+        interaction = self._interactions[iid]
+        if interaction is not None:
+            self._interactions[iid] = None
+            del self._ids[interaction]
+            self._knowers.pop(iid, None)
+
+    def addKnower(self, iid: int, nodeId: int):
+        """Le character nodeId du graph a appris l'interaction iid."""
+        knowers = self._knowers.get(iid)
+        if knowers is None:
+            knowers = self._knowers[iid] = array('I')
+        knowers.append(nodeId)
+
+    def knowerIds(self, iid: int):
+        """Ids des characters qui ont appris l'interaction iid, dans l'ordre (peut contenir des entrées périmées)."""
+        return self._knowers.get(iid, ())
+
+    def keepKnowers(self, iid: int, nodeIds):
+        """Remplace les ids de ceux qui connaissent l'interaction iid (entrées périmées écartées)."""
+        if nodeIds:
+            self._knowers[iid] = array('I', nodeIds)
+        else:
+            self._knowers.pop(iid, None)
+
+    def get(self, iid: int):
+        """Interaction d'id iid (None si elle a été libérée)."""
+        return self._interactions[iid]
+
+    def timestampsOf(self, ids: np.ndarray) -> np.ndarray:
+        """Horodatages des interactions d'ids ids."""
+        return self.log.ticks(ids)
+
+    def _record(self, iid: int, interaction):
+        timestamp = getattr(interaction, 'timestamp', None)
+        self.log.record(iid, self._characterId(interaction.actor), self._characterId(interaction.target),
+                        float(timestamp) if timestamp is not None else float('nan'),
+                        interaction.description, interaction.values)
+
+    def _characterId(self, character) -> int:
+        """Id d'un character de ce graph, -1 pour un character d'ailleurs ou hors graph."""
+        if self._store is None or getattr(character, '_store', None) is not self._store:
+            return -1
+        return character.id
+
+
+class KnownInteractions:
+    """
+    Vue ensembliste (lecture seule) des interactions connues d'un character.
+    'interaction in vue' est une recherche dichotomique dans ses ids triés.
+    """
+
+    __slots__ = ('_character',)
+
+    def __init__(self, character):
+        self._character = character
+
+    def __contains__(self, interaction) -> bool:
+        return self._character.knows(interaction)
+
+    def __len__(self):
+        return len(self._character._knowledge)
+
+    def __iter__(self):
+        character = self._character
+        if not character._knowledge:
+            return iter(())
+        # Les ids libérés (interactions oubliées de tous) sont sautés
+        interactions = (character._registry.get(iid) for iid in character._knowledge)
+        return (interaction for interaction in interactions if interaction is not None)
+
+    def __bool__(self):
+        return len(self._character._knowledge) > 0
+
+    def __repr__(self):
+        return f"KnownInteractions({list(self._character._knowledge)})"
@@ -2,151 +2,119 @@ from .Interaction import Interaction
 from ..Characters.Character import Character
 
 
+# Catalogue des types d'interaction : description -> [agency, communion, intensity, physical_contact, valence]
+# Vecteurs fixes : InteractionKernels en précalcule les effets pour chaque type (indice = kind)
+CATALOGUE = {
+    "killed": (0.9, -0.9, 0.8, 0.9, -1.0),
+    "laughed at": (0.5, -0.4, 0.6, 0.1, -0.3),
+    "helped": (0.3, 0.8, 0.4, 0.2, 0.7),
+    "kissed": (
+        0.2,  # légèrement assertif
+        0.7,  # prosocial
+        0.6,  # énergie modérée à haute
+        0.9,  # contact physique intime
+        0.8,  # positif pour la cible
+    ),
+    "insulted": (
+        0.6,  # assertif
+        -0.7,  # antisocial
+        0.7,  # haute énergie
+        0.0,  # purement verbal
+        -0.6,  # négatif pour la cible
+    ),
+    "hugged": (
+        0.1,  # peu assertif
+        0.9,  # très prosocial
+        0.5,  # énergie modérée
+        0.8,  # contact physique
+        0.6,  # positif pour la cible
+    ),
+    "threatened": (
+        0.8,  # très assertif/dominant
+        -0.6,  # antisocial
+        0.7,  # haute énergie
+        0.2,  # surtout verbal avec possible intimidation physique
+        -0.7,  # négatif pour la cible
+    ),
+    "praised": (
+        0.2,  # légèrement assertif
+        0.6,  # prosocial
+        0.4,  # énergie modérée
+        0.0,  # purement verbal
+        0.5,  # positif pour la cible
+    ),
+    "ignored": (
+        -0.2,  # passif
+        -0.3,  # légèrement antisocial
+        0.1,  # très faible énergie
+        0.0,  # aucun contact
+        -0.2,  # légèrement négatif
+    ),
+    "comforted": (
+        0.1,  # peu assertif
+        0.8,  # très prosocial
+        0.3,  # faible énergie
+        0.4,  # contact physique modéré
+        0.7,  # positif pour la cible
+    ),
+}
+
+# description -> indice du type dans CATALOGUE
+KINDS = {description: kind for kind, description in enumerate(CATALOGUE)}
+
+
+def create(description: str, actor: Character, target: Character, timestamp: float) -> Interaction:
+    """Crée une interaction du catalogue (interaction.kind = indice de son type)."""
+    interaction = Interaction(actor, target, description, timestamp, *CATALOGUE[description])
+    interaction.kind = KINDS[description]
+    return interaction
+
+
 def killed(actor: Character, target: Character, timestamp: float) -> Interaction:
     """L'acteur tue la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="killed",
-        agency=0.9,
-        communion=-0.9,
-        intensity=0.8,
-        physical_contact=0.9,
-        valence=-1.0
-    )
+    return create("killed", actor, target, timestamp)
 
 
 def laughed_at(actor: Character, target: Character, timestamp: float) -> Interaction:
     """L'acteur se moque de la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="laughed at",
-        agency=0.5,
-        communion=-0.4,
-        intensity=0.6,
-        physical_contact=0.1,
-        valence=-0.3
-    )
+    return create("laughed at", actor, target, timestamp)
 
 
 def helped(actor: Character, target: Character, timestamp: float) -> Interaction:
     """L'acteur aide la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="helped",
-        agency=0.3,
-        communion=0.8,
-        intensity=0.4,
-        physical_contact=0.2,
-        valence=0.7
-    )
+    return create("helped", actor, target, timestamp)
 
 
 def kissed(actor: Character, target: Character, timestamp: float) -> Interaction:
     """L'acteur embrasse la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="kissed",
-        agency=0.2,  # légèrement assertif
-        communion=0.7,  # prosocial
-        intensity=0.6,  # énergie modérée à haute
-        physical_contact=0.9,  # contact physique intime
-        valence=0.8  # positif pour la cible
-    )
+    return create("kissed", actor, target, timestamp)
 
 
 def insulted(actor: Character, target: Character, timestamp: float) -> Interaction:
     """Interaction où l'acteur insulte la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="insulted",
-        agency=0.6,  # assertif
-        communion=-0.7,  # antisocial
-        intensity=0.7,  # haute énergie
-        physical_contact=0.0,  # purement verbal
-        valence=-0.6  # négatif pour la cible
-    )
+    return create("insulted", actor, target, timestamp)
 
 
 def hugged(actor: Character, target: Character, timestamp: float) -> Interaction:
     """Interaction où l'acteur serre la cible dans ses bras."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="hugged",
-        agency=0.1,  # peu assertif
-        communion=0.9,  # très prosocial
-        intensity=0.5,  # énergie modérée
-        physical_contact=0.8,  # contact physique
-        valence=0.6  # positif pour la cible
-    )
+    return create("hugged", actor, target, timestamp)
 
 
 def threatened(actor: Character, target: Character, timestamp: float) -> Interaction:
     """Interaction où l'acteur menace la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="threatened",
-        agency=0.8,  # très assertif/dominant
-        communion=-0.6,  # antisocial
-        intensity=0.7,  # haute énergie
-        physical_contact=0.2,  # surtout verbal avec possible intimidation physique
-        valence=-0.7  # négatif pour la cible
-    )
+    return create("threatened", actor, target, timestamp)
 
 
 def praised(actor: Character, target: Character, timestamp: float) -> Interaction:
     """Interaction où l'acteur complimente la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="praised",
-        agency=0.2,  # légèrement assertif
-        communion=0.6,  # prosocial
-        intensity=0.4,  # énergie modérée
-        physical_contact=0.0,  # purement verbal
-        valence=0.5  # positif pour la cible
-    )
+    return create("praised", actor, target, timestamp)
 
 
 def ignored(actor: Character, target: Character, timestamp: float) -> Interaction:
     """Interaction où l'acteur ignore la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="ignored",
-        agency=-0.2,  # passif
-        communion=-0.3,  # légèrement antisocial
-        intensity=0.1,  # très faible énergie
-        physical_contact=0.0,  # aucun contact
-        valence=-0.2  # légèrement négatif
-    )
+    return create("ignored", actor, target, timestamp)
 
 
 def comforted(actor: Character, target: Character, timestamp: float) -> Interaction:
     """Interaction où l'acteur console la cible."""
-    return Interaction(
-        actor=actor,
-        target=target,
-        timestamp=timestamp,
-        description="comforted",
-        agency=0.1,  # peu assertif
-        communion=0.8,  # très prosocial
-        intensity=0.3,  # faible énergie
-        physical_contact=0.4,  # contact physique modéré
-        valence=0.7  # positif pour la cible
-    )
+    return create("comforted", actor, target, timestamp)
@@ -3,11 +3,15 @@ from typing import Set, List, Tuple
 import numpy as np
 
 from .EngineConfiguration import EngineConfiguration
+from .InteractionKernels import InteractionKernels
+from .MemoryExpiry import MemoryExpiry
+from .PersonalityModulation import PersonalityModulation
+from .PropagationScheduler import PropagationScheduler
 from ..Characters.Character import Character
-from ..Characters.Emotions import Emotions
 from ..Interactions.Interaction import Interaction
 from ..Relationships.Relationship import Relationship
 from ..Relationships.TypeRelationship import TypeRelationship
+from ..Universe.EventSink import acceptingSink
 from ..Universe.Graph import Graph
 
 
@@ -21,64 +25,195 @@ class InteractionsEngine:
         """
         self.graph = graph
         self.config = EngineConfiguration()
-        # Liste des propagations en attente : (tick_arrivée, cible, interaction)
-        self.pending_propagations: List[Tuple[int, Character, Interaction]] = []
+        # Effets précalculés des types d'interaction (recompilés quand la config change)
+        self._kernels = None
+        # Modulations par la personnalité des characters (cache branché sur le store du graph)
+        self._personalityModulation = None
+        # Propagations en attente, rangées par tick d'arrivée
+        self.scheduler = PropagationScheduler()
+        # Interactions diffusées d'un coup par broadcastInteraction (pas de relais à l'arrivée),
+        # retirées après leur dernière arrivée
+        self._broadcasts = set()
+        # Oubli des interactions trop anciennes à chaque tick (enableMemoryExpiry)
+        self.memoryExpiry = None
+        self._memoryClock = None
+
+    @property
+    def pending_propagations(self) -> List[Tuple[int, Character, Interaction]]:
+        """Propagations en attente (tick_arrivée, cible, interaction), dans l'ordre de programmation."""
+        return [(arrival_tick, target, interaction) for arrival_tick, target, interaction, _ in self.scheduler.entries()]
+
+    @pending_propagations.setter
+    def pending_propagations(self, propagations: List[Tuple[int, Character, Interaction]]):
+        self.scheduler.clear()
+        for propagation in propagations:
+            self.scheduler.schedule(*propagation)
+
+    @property
+    def kernels(self) -> InteractionKernels:
+        """Tables d'effets des types d'interaction pour la configuration courante."""
+        kernels = self._kernels
+        if kernels is None or kernels.config is not self.config or kernels.version != self.config.version:
+            kernels = self._kernels = InteractionKernels(self.config)
+        return kernels
+
+    @property
+    def personalityModulation(self) -> PersonalityModulation:
+        """Cache des modulations par la personnalité pour la configuration et le store courants."""
+        modulation = self._personalityModulation
+        store = self.graph.store
+        if (modulation is None or store.personalityModulation is not modulation
+                or modulation.config is not self.config or modulation.version != self.config.version):
+            modulation = self._personalityModulation = PersonalityModulation(self.config, store)
+            store.personalityModulation = modulation
+        return modulation
+
+    @property
+    def queueDepth(self) -> int:
+        """Nombre de propagations en transit."""
+        return len(self.scheduler)
+
+    @property
+    def nextArrivalTick(self):
+        """Tick de la prochaine arrivée d'info (None si aucune n'est en transit)."""
+        return self.scheduler.nextArrival()
 
     def tick(self, current_tick: int):
         """
         Update la diffusion des infos à chaque tick.
-        Traite les infos dont le temps de trajet est écoulé.
+        Traite les infos dont le temps de trajet est écoulé (seules celles-ci sont parcourues).
         """
-        # Filtrer les événements arrivés (tick_arrivée <= current_tick)
-        remaining_propagations = []
-
-        for arrival_tick, target, interaction in self.pending_propagations:
-            if arrival_tick <= current_tick:
-                # L'info arrive au character cible
-                # Éviter les doublons
-                if interaction not in target.knownInteractions:
-                    target.learnAboutInteraction(interaction)
-                    # Le character réagit à cette nouvelle info
-                    self.processInteractionForCharacter(target, interaction)
+        delivered = set()
+        for target, interaction, strength in self.scheduler.popDue(current_tick):
+            # L'info arrive au character cible
+            # Éviter les doublons
+            if not target.knows(interaction):
+                target.learnAboutInteraction(interaction)
+                # Le character réagit à cette nouvelle info, selon la force avec laquelle elle arrive
+                self.processInteractionForCharacter(target, interaction, strength)
+
+                # Bouche-à-oreille (déjà programmé jusqu'au bout pour une info diffusée d'un coup)
+                if interaction not in self._broadcasts:
+                    self.diffuseInteraction(target, interaction, current_tick, strength=strength)
+                else:
+                    delivered.add(interaction)
+
+        # Annonces dont la dernière arrivée vient de passer
+        for interaction in delivered:
+            if not self.scheduler.hasPending(interaction):
+                self._broadcasts.discard(interaction)
+
+        # Oubli des interactions dont l'âge vient de dépasser la limite
+        if self.memoryExpiry is not None:
+            self.memoryExpiry.expire(self._memoryClock() if self._memoryClock is not None else current_tick)
+
+        # Fin du tick : publication des modifications (si le suivi est activé)
+        if self.graph.isTrackingChanges:
+            self.graph.commitChanges(current_tick)
+
+    def enableMemoryExpiry(self, maxInteractionAge: float, clock=None) -> MemoryExpiry:
+        """
+        Les characters oublient à chaque tick les interactions plus vieilles que maxInteractionAge.
 
-                    # Bouche-à-oreille
-                    self.diffuseInteraction(target, interaction, current_tick)
-            else:
-                # L'info est toujours en transit
-                remaining_propagations.append((arrival_tick, target, interaction))
+        Args:
+            maxInteractionAge: âge maximal, dans l'unité de Interaction.timestamp
+            clock: fonction donnant l'instant courant dans cette unité (par défaut le tick courant)
+        """
+        self.memoryExpiry = MemoryExpiry(maxInteractionAge, self.graph)
+        self.graph.store.memoryExpiry = self.memoryExpiry
+        self._memoryClock = clock
+        return self.memoryExpiry
 
-        self.pending_propagations = remaining_propagations
+    def disableMemoryExpiry(self):
+        self.memoryExpiry = None
+        self.graph.store.memoryExpiry = None
+        self._memoryClock = None
 
     def diffuseInteraction(self, source: Character, interaction: Interaction, current_tick: int,
-                           already_informed: Set[Character] = None):
+                           already_informed: Set[Character] = None, strength: float = 1.0):
         """
         Un Character diffuse une info sur une Interaction à ses voisins.
         La diffusion prend du temps selon la distance informationnelle.
+        Un voisin qui connaît déjà l'info est ignoré, et chaque voisin n'attend l'info qu'une
+        fois, à son arrivée la plus précoce (la file reste bornée par le nombre de characters).
+        L'info perd de sa force à chaque relais (_relay_strength) et n'est plus transmise sous
+        config.propagation_strength_threshold.
         """
         # Le propagateur apprend l'info immédiatement
-        if interaction not in source.knownInteractions:
+        if not source.knows(interaction):
             source.learnAboutInteraction(interaction)
 
-        neighbors = self.graph.getNeighbors(source)
+        for relationship in self.graph.getOutEdges(source):
+            neighbor = self.graph.getNodeById(relationship.targetId)
 
-        for neighbor in neighbors:
-            # Récupérer la relation pour connaître la distance
-            relationship = self.graph.getEdge(source.name, neighbor.name)
+            if neighbor is not None and not neighbor.knows(interaction):
+                # Force de l'info à son arrivée : trop faible, elle n'est pas transmise
+                relayed = self._relay_strength(relationship, strength)
+                if relayed < self.config.propagation_strength_threshold:
+                    continue
 
-            if relationship is not None:
                 # Calcul du moment d'arrivée de l'info
                 distance = relationship.informational_distance
                 arrival_tick = current_tick + distance
 
-                # Planifier l'arrivée de l'info
-                self.pending_propagations.append((arrival_tick, neighbor, interaction))
+                # Planifier l'arrivée de l'info (sauf si elle arrive déjà plus tôt par un autre chemin)
+                self.scheduler.scheduleEarliest(arrival_tick, neighbor, interaction, relayed)
+
+    def _relay_strength(self, relationship: Relationship, strength: float) -> float:
+        """
+        Force d'une info relayée par relationship.
+
+        Formule:
+            fiabilité = (confidence / 100 + intensité) / 2
+            force_relayée = force × a × ((1 - w) + w × fiabilité)
 
-    def processInteractionForCharacter(self, character: Character, interaction: Interaction):
+        Où a = propagation_hop_attenuation et w = propagation_trust_weight.
+        """
+        weight = self.config.propagation_trust_weight
+        factor = self.config.propagation_hop_attenuation
+        if weight:
+            trust = (relationship.newConfidence() / 100.0 + np.abs(relationship.values).sum() / 3.0) / 2.0
+            factor *= (1.0 - weight) + weight * trust
+        return strength * factor
+
+    def broadcastInteraction(self, source: Character, interaction: Interaction, current_tick: int):
+        """
+        Variante de diffuseInteraction qui programme en une fois l'arrivée de l'info chez tous les
+        characters atteignables, au tick donné par le graph.arrivalIndex, sans relais de proche en
+        proche. Les chemins sont ceux du moment de l'envoi, et un character qui connaissait déjà
+        l'info ne bloque pas son passage. L'info arrive partout à pleine force (annonce publique).
+        """
+        if not source.knows(interaction):
+            source.learnAboutInteraction(interaction)
+
+        for nodeId, delay in self.graph.arrivalIndex.delays(source.id).items():
+            character = self.graph.getNodeById(nodeId)
+            if delay > 0 and not character.knows(interaction):
+                self.scheduler.scheduleEarliest(current_tick + delay, character, interaction)
+        if self.scheduler.hasPending(interaction):
+            self._broadcasts.add(interaction)
+
+    def estimateArrivalTick(self, source: Character, character: Character, current_tick: int):
+        """
+        Tick auquel character apprendra une info que source diffuse à current_tick (None si jamais),
+        sans tenir compte de l'atténuation (l'info peut s'éteindre avant).
+        """
+        delay = self.graph.getInformationDelay(source, character)
+        return None if delay is None else current_tick + delay
+
+    def whoKnowsBy(self, source: Character, current_tick: int, tick: int) -> list[Character]:
+        """Characters informés au plus tard à tick d'une info que source diffuse à current_tick."""
+        return self.graph.getInformedWithin(source, tick - current_tick)
+
+    def processInteractionForCharacter(self, character: Character, interaction: Interaction,
+                                       strength: float = 1.0):
         """
         Un Character traite une Interaction.
         - Si impliqué directement : changements directs
-        - Si relation avec participant : changements indirects
+        - Si relation avec participant : changements indirects, proportionnels à la force de l'info reçue
         """
+        self._record(interaction)
+
         # Vérifier si le personnage est directement impliqué
         is_actor = (character == interaction.actor)
         is_target = (character == interaction.target)
@@ -91,9 +226,14 @@ class InteractionsEngine:
                 character,
                 interaction,
                 self._has_relationship(character, interaction.actor),
-                self._has_relationship(character, interaction.target)
+                self._has_relationship(character, interaction.target),
+                strength
             )
 
+    def _record(self, interaction: Interaction):
+        """Inscrit l'interaction traitée au journal du graph (une seule ligne par interaction, même si personne ne l'apprend)."""
+        self.graph.store.interactions.register(interaction)
+
     def _process_direct_interaction(self, character: Character, interaction: Interaction, is_actor: bool):
         """
         Traite une interaction directe (character impliqué).
@@ -102,137 +242,312 @@ class InteractionsEngine:
         # Déterminer l'autre character
         other_character = interaction.target if is_actor else interaction.actor
 
-        # Vecteurs pour les calculs matriciels
-        interaction_vector = interaction.asArray()
-        personality_vector = character.personality.asArray()
-        current_emotions = character.emotions.asArray()
-
-        # Inverser la valence si c'est l'acteur
-        if is_actor:
-            interaction_vector = interaction_vector.copy()
-            interaction_vector[4] *= self.config.actor_valence_attenuation
+        # Changements bruts précalculés (valence atténuée si c'est l'acteur)
+        emotion_delta, relationship_delta, associated_delta = self.kernels.direct(interaction, is_actor)
+        current_emotions = character.emotions.values
 
         # === 1. Update des émotions ===
         new_emotions_array = self._apply_emotion_change_direct(
-            current_emotions, interaction_vector, personality_vector
+            current_emotions, None, None, emotion_delta=emotion_delta,
+            personality_mod=self.personalityModulation.emotion(character)
         )
         self._update_character_emotions(character, new_emotions_array)
 
+        # L'autre participant a été supprimé du graph (info encore en route) : plus de relation à suivre
+        if self.graph.getNodeById(other_character.id) is not other_character:
+            return
+
         # === 2. Update de la relation directe ===
-        relationship = self.graph.getEdge(character.name, other_character.name)
+        relationship = self.graph.getEdgeById(character.id, other_character.id)
 
         # Créer relation neutre si n'existe pas
         if relationship is None:
             new_type = TypeRelationship(0.0, 0.0, 0.0)
-            self.graph.addEdge(character.name, other_character.name, new_type)
-            relationship = self.graph.getEdge(character.name, other_character.name)
+            self.graph.addEdgeById(character.id, other_character.id, new_type)
+            relationship = self.graph.getEdgeById(character.id, other_character.id)
 
-        self._update_relationship_direct(character, other_character, relationship, interaction_vector)
+        self._update_relationship_direct(character, other_character, relationship, relationship_delta)
 
         # === 3. Propagation : Update des relations associées ===
         neighbors = self.graph.getNeighbors(other_character)
         for neighbor in neighbors:
-            if neighbor.name == character.name:
+            if neighbor is character:
                 continue
 
-            rel_with_neighbor = self.graph.getEdge(character.name, neighbor.name)
+            rel_with_neighbor = self.graph.getEdgeById(character.id, neighbor.id)
 
             if rel_with_neighbor is not None:
-                self._update_relationship_indirect(character, rel_with_neighbor, interaction_vector)
+                self._update_relationship_indirect(character, rel_with_neighbor, associated_delta)
 
     def _process_indirect_interaction(self, character: Character, interaction: Interaction,
-                                      has_relation_with_actor: bool, has_relation_with_target: bool):
+                                      has_relation_with_actor: bool, has_relation_with_target: bool,
+                                      strength: float = 1.0):
         """
         Traite une interaction indirecte (character connaît un participant).
-        Changements atténués.
+        Changements atténués, et proportionnels à la force de l'info reçue.
         """
         if not (has_relation_with_actor or has_relation_with_target):
             return
 
-        # Vecteurs pour les calculs
-        interaction_vector = interaction.asArray()
-        personality_vector = character.personality.asArray()
-        current_emotions = character.emotions.asArray()
+        # Changements bruts précalculés, proportionnels à la force de l'info
+        emotion_delta, relationship_delta = self.kernels.indirect(interaction, strength)
+        current_emotions = character.emotions.values
 
         # Update des émotions (impact indirect)
         new_emotions_array = self._apply_emotion_change_indirect(
-            current_emotions, interaction_vector, personality_vector
+            current_emotions, None, None, emotion_delta=emotion_delta,
+            personality_mod=self.personalityModulation.emotion(character)
         )
         self._update_character_emotions(character, new_emotions_array)
 
         # Update des relations avec les participants connus
         if has_relation_with_actor:
-            relationship = self.graph.getEdge(character.name, interaction.actor.name)
+            relationship = self.graph.getEdgeById(character.id, interaction.actor.id)
             if relationship is not None:
-                self._update_relationship_indirect(character, relationship, interaction_vector)
+                self._update_relationship_indirect(character, relationship, relationship_delta)
 
         if has_relation_with_target:
-            relationship = self.graph.getEdge(character.name, interaction.target.name)
+            relationship = self.graph.getEdgeById(character.id, interaction.target.id)
             if relationship is not None:
-                self._update_relationship_indirect(character, relationship, interaction_vector)
+                self._update_relationship_indirect(character, relationship, relationship_delta)
 
     def _update_character_emotions(self, character: Character, new_emotions_array: np.ndarray):
-        """Update les émotions d'un character depuis un vecteur numpy."""
-        new_emotions = Emotions(
-            happiness=float(new_emotions_array[0]),
-            sadness=float(new_emotions_array[1]),
-            anger=float(new_emotions_array[2]),
-            fear=float(new_emotions_array[3]),
-            surprise=float(new_emotions_array[4]),
-            disgust=float(new_emotions_array[5])
-        )
-        character.changeEmotions(new_emotions)
+        """Update en place les émotions d'un character depuis un vecteur numpy (clamp [0, 1])."""
+        character.setEmotionValues(new_emotions_array)
 
     def _update_relationship_direct(self, source: Character, target: Character,
-                                    relationship: Relationship, interaction_vector: np.ndarray):
-        """Update une relation de manière directe."""
-        current_relationship_array = relationship.asArray()
-        personality_source = source.personality.asArray()
-        personality_target = target.personality.asArray()
+                                    relationship: Relationship, relationship_delta: np.ndarray):
+        """Update une relation de manière directe (Δr brut précalculé, voir InteractionKernels)."""
+        current_relationship_array = relationship.values
 
         new_relationship_array = self._apply_relationship_change_direct(
-            current_relationship_array, interaction_vector,
-            personality_source, personality_target
+            current_relationship_array, None,
+            None, None, relationship_delta=relationship_delta,
+            personality_mod=self.personalityModulation.compatibility(source, target)
         )
 
-        relationship.typeRelationship.privacy = float(new_relationship_array[0])
-        relationship.typeRelationship.commitment = float(new_relationship_array[1])
-        relationship.typeRelationship.passion = float(new_relationship_array[2])
-        relationship.typeRelationship.nom = relationship.typeRelationship.identifyName()
+        relationship.typeRelationship.setArray(new_relationship_array)
 
     def _update_relationship_indirect(self, observer: Character, relationship: Relationship,
-                                      interaction_vector: np.ndarray):
-        """Update une relation de manière indirecte."""
-        current_relationship_array = relationship.asArray()
-        personality_observer = observer.personality.asArray()
+                                      relationship_delta: np.ndarray):
+        """Update une relation de manière indirecte (Δr brut précalculé, voir InteractionKernels)."""
+        current_relationship_array = relationship.values
 
         new_relationship_array = self._apply_relationship_change_indirect(
-            current_relationship_array, interaction_vector, personality_observer
+            current_relationship_array, None, None, relationship_delta=relationship_delta,
+            personality_mod=self.personalityModulation.relationship(observer)
         )
 
-        relationship.typeRelationship.privacy = float(new_relationship_array[0])
-        relationship.typeRelationship.commitment = float(new_relationship_array[1])
-        relationship.typeRelationship.passion = float(new_relationship_array[2])
-        relationship.typeRelationship.nom = relationship.typeRelationship.identifyName()
+        relationship.typeRelationship.setArray(new_relationship_array)
 
     def _has_relationship(self, character1: Character, character2: Character) -> bool:
         """Vérifie si deux characters ont une relation."""
-        return self.graph.getEdge(character1.name, character2.name) is not None
+        return self.graph.getEdgeById(character1.id, character2.id) is not None
 
     def processInteractionForGroup(self, group: list[Character], interaction: Interaction):
-        """Traite une interaction par tout un ensemble de characters."""
+        """
+        Traite une interaction par tout un ensemble de characters.
+        Seuls les participants et les observateurs (Graph.getObservers) du groupe sont traités :
+        pour les autres, l'interaction est sans effet.
+        """
+        self._record(interaction)
+        concerned = {character.id for character in self.graph.getObservers(interaction)}
         for character in group:
-            self.processInteractionForCharacter(character, interaction)
+            if character is interaction.actor or character is interaction.target or character.id in concerned:
+                self.processInteractionForCharacter(character, interaction)
 
     def processInteractionForAll(self, interaction: Interaction):
-        """Traite une interaction pour tous les characters du graph."""
-        self.processInteractionForGroup(self.graph.listNode, interaction)
+        """
+        Traite une interaction pour tous les characters du graph.
+        Seuls les participants et les characters en relation avec eux sont concernés : les
+        participants sont traités un par un, les observateurs en bloc (_processObservers), avec
+        les mêmes résultats que processInteractionForCharacter appelé pour chaque character.
+        """
+        self._record(interaction)
+        actor, target = interaction.actor, interaction.target
+        if actor is target:
+            self.processInteractionForGroup(self.graph.listNode, interaction)
+            return
+
+        for participant in (actor, target):
+            if self.graph.getNodeById(participant.id) is participant:
+                self.processInteractionForCharacter(participant, interaction)
+        self._processObservers(interaction)
+
+    def _processObservers(self, interaction: Interaction, strength: float = 1.0):
+        """
+        Effets indirects d'une interaction sur tous les characters (hors participants) qui ont une
+        relation vers l'acteur ou la cible, en une passe numpy : émotions des observateurs en un
+        bloc (observateurs × 6), puis relations vers les participants (lignes du WorldStore).
+        Mêmes formules que _apply_emotion_change_indirect et _apply_relationship_change_indirect.
+        """
+        sources, rows = self._observerEdges(interaction)
+        if len(sources) == 0:
+            return
+
+        store = self.graph.store
+        modulation = self.personalityModulation
+        emotion_delta, relationship_delta = self.kernels.indirect(interaction, strength)
+
+        # Émotions : chaque observateur une seule fois
+        observers = np.unique(sources)
+        new_emotions = store.emotions[observers] + emotion_delta * (
+                1.0 + modulation.emotionRows(observers) * self.config.personality_emotion_modulation_indirect
+        )
+        new_emotions = np.clip(new_emotions, 0.0, 1.0)
+        _emitEmotions(store, observers, new_emotions)
+        store.writeRows('emotions', observers, new_emotions)
+
+        # Relations observateur -> participant
+        new_relationships = store.relationships[rows] + relationship_delta * (
+                1.0 + modulation.relationshipRows(sources) * self.config.personality_relationship_modulation_indirect
+        )
+        store.writeRows('relationships', rows, np.clip(new_relationships, self.config.relationship_min,
+                                                       self.config.relationship_max))
+
+    def _observerEdges(self, interaction: Interaction):
+        """
+        Relations des observateurs vers les participants : (ids des observateurs, lignes des
+        relations), celles vers l'acteur puis celles vers la cible.
+        """
+        participants = [interaction.actor.id, interaction.target.id]
+        sources = []
+        rows = []
+        for participant in (interaction.actor, interaction.target):
+            participant_sources, participant_rows = self.graph.getInEdgeRows(participant)
+            observed = ~np.isin(participant_sources, participants)
+            sources.append(participant_sources[observed])
+            rows.append(participant_rows[observed])
+        return np.concatenate(sources), np.concatenate(rows)
+
+    def processInteractions(self, interactions: List[Interaction], strengths=None):
+        """
+        Traite un lot d'interactions d'un même tick (combat, fête, foule...) : pour chacune, mêmes
+        effets que processInteractionForAll, appliqués en une passe vectorisée.
+
+        Les effets sont regroupés par character et par relation touchés : un bloc de contributions
+        Δ × (1 + m_p × coefficient) est calculé pour tout le lot, puis ajouté aux émotions et aux
+        relations avec np.add.at.
+
+        Ordre garanti : les contributions à une même émotion ou relation s'ajoutent dans l'ordre
+        des interactions de la liste, puis le clamp est appliqué une seule fois, en fin de lot.
+        Le résultat est donc reproductible, et identique à processInteractionForAll appelé pour
+        chaque interaction dans l'ordre tant qu'aucune valeur n'atteint ses bornes en cours de lot.
+        Les relations manquantes entre participants sont créées dans l'ordre des interactions.
+
+        Args:
+            interactions: interactions du tick, dans l'ordre où elles ont eu lieu
+            strengths: forces des infos reçues par les observateurs (1.0 par défaut)
+        """
+        modulation = self.personalityModulation
+        config = self.config
+        emotion_ids, emotion_deltas, emotion_mods, emotion_coefficients = [], [], [], []
+        relationship_rows, relationship_deltas, relationship_mods, relationship_coefficients = [], [], [], []
+
+        def add_emotions(ids, deltas, mods, coefficient):
+            emotion_ids.append(ids)
+            emotion_deltas.append(np.broadcast_to(deltas, mods.shape))
+            emotion_mods.append(mods)
+            emotion_coefficients.append(np.full(len(ids), coefficient))
+
+        def add_relationships(rows, deltas, mods, coefficient):
+            relationship_rows.append(rows)
+            relationship_deltas.append(np.broadcast_to(deltas, mods.shape))
+            relationship_mods.append(mods)
+            relationship_coefficients.append(np.full(len(rows), coefficient))
+
+        for index, interaction in enumerate(interactions):
+            self._record(interaction)
+            strength = 1.0 if strengths is None else strengths[index]
+            actor, target = interaction.actor, interaction.target
+
+            # Participants : effets directs
+            for participant in ([actor] if actor is target else [actor, target]):
+                if self.graph.getNodeById(participant.id) is not participant:
+                    continue
+                is_actor = participant is actor
+                other = target if is_actor else actor
+                emotion_delta, relationship_delta, associated_delta = self.kernels.direct(interaction, is_actor)
+                add_emotions([participant.id], emotion_delta, modulation.emotion(participant)[None],
+                             config.personality_emotion_modulation_direct)
+                if self.graph.getNodeById(other.id) is not other:
+                    continue
+
+                relationship = self.graph.getEdgeById(participant.id, other.id)
+                if relationship is None:
+                    self.graph.addEdgeById(participant.id, other.id, TypeRelationship(0.0, 0.0, 0.0))
+                    relationship = self.graph.getEdgeById(participant.id, other.id)
+                add_relationships([relationship._row], relationship_delta,
+                                  modulation.compatibility(participant, other)[None],
+                                  config.personality_relationship_modulation_direct)
+
+                associated = [self.graph.getEdgeById(participant.id, neighbor.id)
+                              for neighbor in self.graph.getNeighbors(other) if neighbor is not participant]
+                associated = [relationship._row for relationship in associated if relationship is not None]
+                if associated:
+                    add_relationships(associated, associated_delta,
+                                      np.tile(modulation.relationship(participant), (len(associated), 1)),
+                                      config.personality_relationship_modulation_indirect)
+
+            # Observateurs : effets indirects
+            sources, rows = self._observerEdges(interaction)
+            if len(sources):
+                emotion_delta, relationship_delta = self.kernels.indirect(interaction, strength)
+                observers = np.unique(sources)
+                add_emotions(observers, emotion_delta, modulation.emotionRows(observers),
+                             config.personality_emotion_modulation_indirect)
+                add_relationships(rows, relationship_delta, modulation.relationshipRows(sources),
+                                  config.personality_relationship_modulation_indirect)
+
+        store = self.graph.store
+        if emotion_ids:
+            self._accumulate(store, 'emotions', emotion_ids, emotion_deltas, emotion_mods, emotion_coefficients,
+                             0.0, 1.0)
+        if relationship_rows:
+            self._accumulate(store, 'relationships', relationship_rows, relationship_deltas, relationship_mods,
+                             relationship_coefficients, config.relationship_min, config.relationship_max)
+
+    @staticmethod
+    def _accumulate(store, table: str, rows, deltas, mods, coefficients, minimum: float, maximum: float):
+        """Ajoute les contributions Δ × (1 + m_p × coefficient) aux lignes d'une table, dans l'ordre, puis clampe."""
+        rows = np.concatenate([np.asarray(part, dtype=np.int64) for part in rows])
+        contributions = np.concatenate(deltas) * (1.0 + np.concatenate(mods) * np.concatenate(coefficients)[:, None])
+        touched = np.unique(rows)
+        values = getattr(store, table)[touched].copy()
+        np.add.at(values, np.searchsorted(touched, rows), contributions)
+        values = np.clip(values, minimum, maximum)
+        if table == 'emotions':
+            _emitEmotions(store, touched, values)
+        store.writeRows(table, touched, values)
+
+    def getBystanders(self, interaction: Interaction, radius: float) -> list[Character]:
+        """Characters (hors participants) à moins de radius de l'acteur ou de la cible."""
+        participants = {interaction.actor.id, interaction.target.id}
+        bystanders = {}
+        for participant in (interaction.actor, interaction.target):
+            for character in self.graph.getNodesInRadius(participant, radius):
+                if character.id not in participants:
+                    bystanders[character.id] = character
+        return list(bystanders.values())
+
+    def witnessInteraction(self, interaction: Interaction, radius: float, current_tick: int):
+        """
+        Les témoins physiquement proches apprennent l'interaction immédiatement,
+        y réagissent puis la diffusent à leurs voisins.
+        """
+        for bystander in self.getBystanders(interaction, radius):
+            if not bystander.knows(interaction):
+                bystander.learnAboutInteraction(interaction)
+                self.processInteractionForCharacter(bystander, interaction)
+                self.diffuseInteraction(bystander, interaction, current_tick)
 
     # === Calculs matriciels pour l'update des vecteurs ===
 
     def _apply_emotion_change_direct(self, current_emotions: np.ndarray,
                                      interaction_vector: np.ndarray,
-                                     personality_vector: np.ndarray) -> np.ndarray:
+                                     personality_vector: np.ndarray,
+                                     emotion_delta: np.ndarray = None,
+                                     personality_mod: np.ndarray = None) -> np.ndarray:
         """
         Applique un changement d'émotion direct pour un personnage impliqué dans une interaction.
 
@@ -254,15 +569,19 @@ class InteractionsEngine:
             current_emotions: vecteur numpy (6,) des émotions actuelles
             interaction_vector: vecteur numpy (5,) représentant l'interaction
             personality_vector: vecteur numpy (5,) de la personnalité
+            emotion_delta: Δe déjà calculé (InteractionKernels), interaction_vector est alors ignoré
+            personality_mod: m_p déjà calculé (PersonalityModulation), personality_vector est alors ignoré
 
         Returns:
             vecteur numpy (6,) des nouvelles émotions clampées dans [e_min, e_max]
         """
         # Calcul du changement d'émotion basé sur l'interaction
-        emotion_delta = self.config.interaction_to_emotion_direct @ interaction_vector
+        if emotion_delta is None:
+            emotion_delta = self.config.interaction_to_emotion_direct @ interaction_vector
 
         # Modulation par la personnalité
-        personality_mod = self.config.personality_modulation @ personality_vector
+        if personality_mod is None:
+            personality_mod = self.config.personality_modulation @ personality_vector
 
         # Application du changement modulé
         new_emotions = current_emotions + emotion_delta * (
@@ -274,7 +593,9 @@ class InteractionsEngine:
     def _apply_relationship_change_direct(self, current_relationship: np.ndarray,
                                           interaction_vector: np.ndarray,
                                           personality_source: np.ndarray,
-                                          personality_target: np.ndarray) -> np.ndarray:
+                                          personality_target: np.ndarray,
+                                          relationship_delta: np.ndarray = None,
+                                          personality_mod: np.ndarray = None) -> np.ndarray:
         """
         Applique un changement de relation direct.
 
@@ -300,18 +621,23 @@ class InteractionsEngine:
             interaction_vector: vecteur numpy (5,) représentant l'interaction
             personality_source: vecteur numpy (5,) personnalité de la source
             personality_target: vecteur numpy (5,) personnalité de la cible
+            relationship_delta: Δr déjà calculé (InteractionKernels), interaction_vector est alors ignoré
+            personality_mod: m_p déjà calculé (PersonalityModulation.compatibility), les personnalités
+                sont alors ignorées
 
         Returns:
             vecteur numpy (3,) de la nouvelle relation clampée dans [r_min, r_max]
         """
         # Changement basé sur l'interaction
-        relationship_delta = self.config.interaction_to_relationship_direct @ interaction_vector
+        if relationship_delta is None:
+            relationship_delta = self.config.interaction_to_relationship_direct @ interaction_vector
 
         # Compatibilité des personnalités (moyenne des deux influences)
-        personality_mod_source = self.config.personality_to_relationship @ personality_source
-        personality_mod_target = self.config.personality_to_relationship @ personality_target
-        personality_mod = (
-                                  personality_mod_source + personality_mod_target) * self.config.personality_compatibility_weight
+        if personality_mod is None:
+            personality_mod_source = self.config.personality_to_relationship @ personality_source
+            personality_mod_target = self.config.personality_to_relationship @ personality_target
+            personality_mod = (
+                                      personality_mod_source + personality_mod_target) * self.config.personality_compatibility_weight
 
         # Application du changement modulé
         new_relationship = current_relationship + relationship_delta * (
@@ -322,7 +648,9 @@ class InteractionsEngine:
 
     def _apply_emotion_change_indirect(self, current_emotions: np.ndarray,
                                        interaction_vector: np.ndarray,
-                                       personality_vector: np.ndarray) -> np.ndarray:
+                                       personality_vector: np.ndarray,
+                                       emotion_delta: np.ndarray = None,
+                                       personality_mod: np.ndarray = None) -> np.ndarray:
         """
         Applique un changement d'émotion indirect (le personnage a une relation avec un personnage impliqué).
 
@@ -345,16 +673,19 @@ class InteractionsEngine:
             current_emotions: vecteur numpy (6,) des émotions actuelles
             interaction_vector: vecteur numpy (5,) représentant l'interaction
             personality_vector: vecteur numpy (5,) de la personnalité
+            emotion_delta: Δe déjà calculé (InteractionKernels), interaction_vector est alors ignoré
+            personality_mod: m_p déjà calculé (PersonalityModulation), personality_vector est alors ignoré
 
         Returns:
             vecteur numpy (6,) des nouvelles émotions clampées dans [e_min, e_max]
         """
-        # Changement atténué
-        emotion_delta = (self.config.interaction_to_emotion_direct *
-                         self.config.indirect_emotion_attenuation) @ interaction_vector
+        # Changement atténué (matrice atténuée précalculée)
+        if emotion_delta is None:
+            emotion_delta = self.kernels.emotionIndirect @ interaction_vector
 
         # Modulation par la personnalité (encore plus atténuée)
-        personality_mod = self.config.personality_modulation @ personality_vector
+        if personality_mod is None:
+            personality_mod = self.config.personality_modulation @ personality_vector
 
         # Application du changement modulé
         new_emotions = current_emotions + emotion_delta * (
@@ -365,7 +696,9 @@ class InteractionsEngine:
 
     def _apply_relationship_change_indirect(self, current_relationship: np.ndarray,
                                             interaction_vector: np.ndarray,
-                                            personality_observer: np.ndarray) -> np.ndarray:
+                                            personality_observer: np.ndarray,
+                                            relationship_delta: np.ndarray = None,
+                                            personality_mod: np.ndarray = None) -> np.ndarray:
         """
         Applique un changement de relation indirect (observer une interaction entre autres).
 
@@ -388,16 +721,19 @@ class InteractionsEngine:
             current_relationship: vecteur numpy (3,) [privacy, commitment, passion]
             interaction_vector: vecteur numpy (5,) représentant l'interaction
             personality_observer: vecteur numpy (5,) personnalité de l'observateur
+            relationship_delta: Δr déjà calculé (InteractionKernels), interaction_vector est alors ignoré
+            personality_mod: m_p déjà calculé (PersonalityModulation), personality_observer est alors ignoré
 
         Returns:
             vecteur numpy (3,) de la nouvelle relation clampée dans [r_min, r_max]
         """
-        # Changement atténué
-        relationship_delta = (self.config.interaction_to_relationship_direct *
-                              self.config.indirect_relationship_attenuation) @ interaction_vector
+        # Changement atténué (matrice atténuée précalculée)
+        if relationship_delta is None:
+            relationship_delta = self.kernels.relationshipIndirect @ interaction_vector
 
         # Modulation par la personnalité de l'observateur
-        personality_mod = self.config.personality_to_relationship @ personality_observer
+        if personality_mod is None:
+            personality_mod = self.config.personality_to_relationship @ personality_observer
 
         # Application du changement modulé
         new_relationship = current_relationship + relationship_delta * (
@@ -405,3 +741,10 @@ class InteractionsEngine:
         )
 
         return np.clip(new_relationship, self.config.relationship_min, self.config.relationship_max)
+
+
+def _emitEmotions(store, ids: np.ndarray, new_emotions: np.ndarray):
+    """Événement 'emotions' groupé (ids, avant, après) des mises à jour en bloc, si un récepteur est branché."""
+    sink = acceptingSink()
+    if sink is not None:
+        sink.emit('emotions', ids=ids, before=store.emotions[ids], after=new_emotions.copy())
@@ -0,0 +1,78 @@
+import heapq
+import math
+
+
+class MemoryExpiry:
+    """
+    Oubli des interactions trop anciennes, ordonné dans le temps.
+
+    Un tas des interactions enregistrées par horodatage, et pour chacune les ids des characters du
+    graph qui la connaissent (index du registre, InteractionRegistry.knowerIds) : expire(now) ne
+    parcourt que les interactions dont l'âge vient de dépasser maxInteractionAge, en
+    O(interactions expirées × characters qui les connaissaient). Mêmes règles que
+    Character.forgetInteractionsOlderThan (une interaction datée de now - maxInteractionAge est
+    gardée). Une interaction oubliée de tous ses characters est libérée de leur registre
+    (InteractionRegistry.release).
+
+    Branché sur un WorldStore (store.memoryExpiry), il est prévenu par le registre de chaque
+    interaction enregistrée. Appelable avec le tick courant, il peut servir de callback de
+    TimeManager quand les interactions sont datées en ticks.
+    """
+
+    def __init__(self, maxInteractionAge: float, graph):
+        """
+        Args:
+            maxInteractionAge: âge maximal d'une interaction connue (unité de Interaction.timestamp)
+            graph: graph dont les characters oublient (leurs connaissances actuelles sont suivies)
+        """
+        self.maxInteractionAge = maxInteractionAge
+        self.graph = graph
+        # Tas (horodatage, id interaction) et ids des interactions suivies. Un id de character libéré
+        # puis réattribué n'est pas gênant : le nouveau character n'oublie que ce qu'il connaît.
+        self._heap = []
+        self._watched = set()
+        # Interactions déjà enregistrées, connues ou non
+        for iid in graph.store.interactions._ids.values():
+            self.watch(iid)
+
+    def __len__(self):
+        """Nombre d'interactions suivies."""
+        return len(self._watched)
+
+    def __call__(self, now: float) -> int:
+        return self.expire(now)
+
+    def watch(self, iid: int):
+        """
+        Suit l'interaction iid, même sans character qui la connaisse : elle sera oubliée de ceux
+        qui la connaissent puis libérée du registre une fois trop vieille.
+        """
+        if iid in self._watched:
+            return
+        timestamp = float(self.graph.store.interactions.timestamps[iid])
+        if math.isnan(timestamp):
+            # Interaction non datée : jamais oubliée
+            return
+        self._watched.add(iid)
+        heapq.heappush(self._heap, (timestamp, iid))
+
+    def nextExpiry(self):
+        """Horodatage à partir duquel la prochaine interaction sera oubliée (None si aucune n'est suivie)."""
+        return self._heap[0][0] + self.maxInteractionAge if self._heap else None
+
+    def expire(self, now: float) -> int:
+        """Fait oublier les interactions datées d'avant now - maxInteractionAge ; renvoie leur nombre."""
+        cutoff = now - self.maxInteractionAge
+        registry = self.graph.store.interactions
+        expired = 0
+        while self._heap and self._heap[0][0] < cutoff:
+            _, iid = heapq.heappop(self._heap)
+            self._watched.discard(iid)
+            for nodeId in registry.knowerIds(iid):
+                # Character supprimé du graph depuis : sauté
+                character = self.graph.getNodeById(nodeId)
+                if character is not None:
+                    character._forget(iid)
+            registry.release(iid)
+            expired += 1
+        return expired
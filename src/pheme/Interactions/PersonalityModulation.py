@@ -0,0 +1,118 @@
+import numpy as np
+
+from .EngineConfiguration import EngineConfiguration
+
+
+class PersonalityModulation:
+    """
+    Cache des modulations par la personnalité des characters d'un WorldStore, pour une
+    EngineConfiguration :
+        - émotions (6D) : M_personality @ p
+        - relations (3D) : M_personality_rel @ p
+        - compatibilité d'une paire (3D) : (M_personality_rel @ p_source + M_personality_rel @ p_target) × ω
+    Chaque vecteur est calculé au premier besoin puis réutilisé tant que la personnalité ne change pas.
+
+    Les vecteurs sont calculés par modulate, qui donne le même résultat pour un character seul
+    ou pour un bloc de characters (rows, voir InteractionsEngine.processInteractionForAll).
+
+    Branché sur le store (store.personalityModulation), il est prévenu de toute écriture dans la
+    table des personnalités (changePersonality, modification d'un trait, addNodes, ...) et oublie
+    les vecteurs des lignes concernées ; les compatibilités sont alors toutes oubliées.
+    """
+
+    def __init__(self, config: EngineConfiguration, store=None):
+        self.config = config
+        self.version = config.version
+        self.store = store
+        capacity = len(store.personalities) if store is not None else 0
+        self._emotion = np.zeros((capacity, config.personality_modulation.shape[0]))
+        self._relationship = np.zeros((capacity, config.personality_to_relationship.shape[0]))
+        self._valid = np.zeros(capacity, dtype=bool)
+        # (id source, id cible) -> terme de compatibilité
+        self._compatibility = {}
+
+    def invalidate(self, rows):
+        """Oublie les vecteurs des lignes rows (une ligne ou un tableau de lignes)."""
+        if len(self._valid) < len(self.store.personalities):
+            self._grow(len(self.store.personalities))
+        self._valid[rows] = False
+        self._compatibility.clear()
+
+    def _row(self, character) -> int:
+        """Ligne du character dans le cache (calculée si besoin), None s'il n'est pas dans le store."""
+        if self.store is None or character._store is not self.store:
+            return None
+        row = character._row
+        if row >= len(self._valid):
+            self._grow(len(self.store.personalities))
+        if not self._valid[row]:
+            personality = self.store.personalities[row]
+            self._emotion[row] = modulate(self.config.personality_modulation, personality)
+            self._relationship[row] = modulate(self.config.personality_to_relationship, personality)
+            self._valid[row] = True
+        return row
+
+    def _rows(self, rows: np.ndarray):
+        """Calcule en bloc les vecteurs manquants des lignes rows (characters du store)."""
+        if len(self._valid) < len(self.store.personalities):
+            self._grow(len(self.store.personalities))
+        missing = rows[~self._valid[rows]]
+        if len(missing):
+            personalities = self.store.personalities[missing]
+            self._emotion[missing] = modulate(self.config.personality_modulation, personalities)
+            self._relationship[missing] = modulate(self.config.personality_to_relationship, personalities)
+            self._valid[missing] = True
+
+    def _grow(self, capacity: int):
+        count = len(self._valid)
+        self._emotion = np.concatenate([self._emotion, np.zeros((capacity - count, self._emotion.shape[1]))])
+        self._relationship = np.concatenate([self._relationship,
+                                             np.zeros((capacity - count, self._relationship.shape[1]))])
+        self._valid = np.concatenate([self._valid, np.zeros(capacity - count, dtype=bool)])
+
+    def emotion(self, character) -> np.ndarray:
+        """Modulation des émotions du character : M_personality @ p."""
+        row = self._row(character)
+        if row is None:
+            return modulate(self.config.personality_modulation, character.personality.values)
+        return self._emotion[row]
+
+    def relationship(self, character) -> np.ndarray:
+        """Modulation des relations du character : M_personality_rel @ p."""
+        row = self._row(character)
+        if row is None:
+            return modulate(self.config.personality_to_relationship, character.personality.values)
+        return self._relationship[row]
+
+    def emotionRows(self, rows: np.ndarray) -> np.ndarray:
+        """Modulations des émotions (len(rows) × 6) des characters du store d'ids rows."""
+        self._rows(rows)
+        return self._emotion[rows]
+
+    def relationshipRows(self, rows: np.ndarray) -> np.ndarray:
+        """Modulations des relations (len(rows) × 3) des characters du store d'ids rows."""
+        self._rows(rows)
+        return self._relationship[rows]
+
+    def compatibility(self, source, target) -> np.ndarray:
+        """Compatibilité des personnalités des deux characters d'une relation directe."""
+        cached = self.store is not None and source._store is self.store and target._store is self.store
+        key = (source._row, target._row)
+        compatibility = self._compatibility.get(key) if cached else None
+        if compatibility is None:
+            compatibility = ((self.relationship(source) + self.relationship(target))
+                             * self.config.personality_compatibility_weight)
+            if cached:
+                self._compatibility[key] = compatibility
+        return compatibility
+
+
+def modulate(matrix: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    matrix @ v pour un vecteur v (5,) ou chaque ligne d'un bloc (N × 5), sommé colonne par colonne
+    dans un ordre fixe : le résultat d'une ligne ne dépend pas de la taille du bloc.
+    """
+    result = vectors[..., 0:1] * matrix[:, 0]
+    for column in range(1, matrix.shape[1]):
+        result = result + vectors[..., column:column + 1] * matrix[:, column]
+    return result
@@ -0,0 +1,129 @@
+import heapq
+
+
+class PropagationScheduler:
+    """
+    File des propagations en attente, rangées par tick d'arrivée.
+
+    Un seau (liste FIFO) par tick d'arrivée et un tas des ticks non vides : programmer une
+    propagation coûte O(1) (O(log T) pour un nouveau tick) et un tick ne touche que les
+    propagations qui arrivent à ce tick. L'ordre de traitement est l'ordre de programmation.
+
+    Chaque propagation porte la force de l'info à son arrivée (1.0 : pleine force).
+
+    scheduleEarliest tient en plus une frontière par interaction, à la Dijkstra : chaque cible
+    n'y est programmée qu'une fois, à son arrivée la plus précoce (la plus forte en cas d'égalité).
+    Une programmation remplacée est annulée et ignorée au dépilement.
+    """
+
+    def __init__(self):
+        # tick d'arrivée -> [(numéro d'ordre, cible, interaction)]
+        self._buckets = {}
+        # Tas des ticks d'arrivée ayant un seau
+        self._ticks = []
+        self._size = 0
+        self._sequence = 0
+        # Frontière : interaction -> {cible: (tick d'arrivée, numéro d'ordre, force)}
+        self._frontier = {}
+        # Numéros d'ordre des programmations annulées, encore présentes dans leur seau
+        self._cancelled = set()
+
+    def __len__(self):
+        return self._size
+
+    def schedule(self, arrival_tick: int, target, interaction, strength: float = 1.0):
+        """Programme l'arrivée de l'info interaction chez target au tick arrival_tick."""
+        bucket = self._buckets.get(arrival_tick)
+        if bucket is None:
+            bucket = self._buckets[arrival_tick] = []
+            heapq.heappush(self._ticks, arrival_tick)
+        bucket.append((self._sequence, target, interaction, strength))
+        self._sequence += 1
+        self._size += 1
+
+    def scheduleEarliest(self, arrival_tick: int, target, interaction, strength: float = 1.0) -> bool:
+        """
+        Programme l'arrivée de interaction chez target sauf si elle y arrive déjà plus tôt, ou au même
+        tick avec au moins la même force. Une arrivée déjà programmée est sinon remplacée.
+        Renvoie True si l'arrivée a été programmée.
+        """
+        frontier = self._frontier.get(interaction)
+        if frontier is None:
+            frontier = self._frontier[interaction] = {}
+        scheduled = frontier.get(target)
+        if scheduled is not None:
+            if scheduled[0] < arrival_tick or (scheduled[0] == arrival_tick and scheduled[2] >= strength):
+                return False
+            self._cancelled.add(scheduled[1])
+            self._size -= 1
+        frontier[target] = (arrival_tick, self._sequence, strength)
+        self.schedule(arrival_tick, target, interaction, strength)
+        return True
+
+    def scheduledArrival(self, target, interaction):
+        """Tick d'arrivée programmé de interaction chez target par scheduleEarliest (None sinon)."""
+        scheduled = self._frontier.get(interaction, {}).get(target)
+        return scheduled[0] if scheduled is not None else None
+
+    def hasPending(self, interaction) -> bool:
+        """Reste-t-il une arrivée de interaction programmée par scheduleEarliest ?"""
+        return interaction in self._frontier
+
+    def nextArrival(self):
+        """Tick de la prochaine arrivée (None si la file est vide)."""
+        return self._ticks[0] if self._ticks else None
+
+    def popDue(self, current_tick: int) -> list:
+        """Retire et renvoie les (cible, interaction, force) arrivés au plus tard à current_tick, dans l'ordre de programmation."""
+        due = []
+        while self._ticks and self._ticks[0] <= current_tick:
+            due.append(self._buckets.pop(heapq.heappop(self._ticks)))
+        if not due:
+            return []
+        # Plusieurs ticks échus d'un coup (ticks sautés) : fusion selon l'ordre de programmation
+        entries = due[0] if len(due) == 1 else list(heapq.merge(*due))
+        if self._frontier or self._cancelled:
+            entries = [entry for entry in entries if self._arrive(*entry)]
+        self._size -= len(entries)
+        return [(target, interaction, strength) for _, target, interaction, strength in entries]
+
+    def _arrive(self, sequence: int, target, interaction, strength: float) -> bool:
+        """Retire de la frontière une programmation dépilée ; False si elle avait été annulée."""
+        if sequence in self._cancelled:
+            self._cancelled.discard(sequence)
+            return False
+        frontier = self._frontier.get(interaction)
+        if frontier is not None and frontier.get(target, (None, None, None))[1] == sequence:
+            del frontier[target]
+            if not frontier:
+                del self._frontier[interaction]
+        return True
+
+    def cancelTargets(self, targets):
+        """Annule toutes les propagations en attente vers les cibles targets (en O(taille de la file))."""
+        targets = set(targets)
+        for bucket in self._buckets.values():
+            for sequence, target, interaction, _ in bucket:
+                if target in targets and sequence not in self._cancelled:
+                    self._cancelled.add(sequence)
+                    self._size -= 1
+                    frontier = self._frontier.get(interaction)
+                    if frontier is not None and frontier.get(target, (None, None, None))[1] == sequence:
+                        del frontier[target]
+                        if not frontier:
+                            del self._frontier[interaction]
+
+    def entries(self) -> list:
+        """Toutes les propagations en attente (tick d'arrivée, cible, interaction, force), dans l'ordre de programmation."""
+        entries = sorted((sequence, tick, target, interaction, strength)
+                         for tick, bucket in self._buckets.items()
+                         for sequence, target, interaction, strength in bucket
+                         if sequence not in self._cancelled)
+        return [entry[1:] for entry in entries]
+
+    def clear(self):
+        self._buckets = {}
+        self._ticks = []
+        self._size = 0
+        self._frontier = {}
+        self._cancelled = set()
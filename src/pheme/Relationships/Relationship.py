@@ -16,13 +16,97 @@ class Relationship:
             typeRelationship: Type de relation
             informational_distance: Temps en ticks pour qu'une info traverse cette relation
         """
-        self.source = source
-        self.target = target
-        self.typeRelationship = typeRelationship
-        self.informational_distance = max(1, int(informational_distance))  # Minimum 1 tick
+        self._store = None
+        self._row = None
+        self.sourceId = None
+        self.targetId = None
+        self._source = source
+        self._target = target
+        self._typeRelationship = typeRelationship
+        self._informational_distance = max(1, int(informational_distance))  # Minimum 1 tick
         self.intensity = typeRelationship.getIntensity()
         self.confidence = self.newConfidence()
 
+    @classmethod
+    def _view(cls, store, row: int, intensity: float, confidence: float) -> 'Relationship':
+        """Crée une relation directement rattachée à une ligne déjà remplie du WorldStore."""
+        relationship = cls.__new__(cls)
+        relationship._store = store
+        relationship._row = row
+        relationship.sourceId = int(store.edgeSource[row])
+        relationship.targetId = int(store.edgeTarget[row])
+        relationship._source = None
+        relationship._target = None
+        relationship._typeRelationship = TypeRelationship._view(store, row)
+        relationship._informational_distance = None
+        relationship.intensity = intensity
+        relationship.confidence = confidence
+        return relationship
+
+    @property
+    def source(self):
+        """Nom du character source (suit les renommages une fois rattachée au graph)."""
+        if self._store is not None:
+            return self._store.nodeNames[self.sourceId]
+        return self._source
+
+    @property
+    def target(self):
+        """Nom du character cible (suit les renommages une fois rattachée au graph)."""
+        if self._store is not None:
+            return self._store.nodeNames[self.targetId]
+        return self._target
+
+    @property
+    def typeRelationship(self) -> TypeRelationship:
+        return self._typeRelationship
+
+    @typeRelationship.setter
+    def typeRelationship(self, typeRelationship: TypeRelationship):
+        if self._store is not None:
+            self._typeRelationship._unbind()
+            if typeRelationship._isBound():
+                typeRelationship = typeRelationship.detached()
+            typeRelationship._bind(self._store, self._row)
+        self._typeRelationship = typeRelationship
+
+    @property
+    def informational_distance(self) -> int:
+        if self._store is not None:
+            return int(self._store.informationalDistances[self._row])
+        return self._informational_distance
+
+    @informational_distance.setter
+    def informational_distance(self, informational_distance: int):
+        informational_distance = max(1, int(informational_distance))
+        if self._store is not None:
+            self._store.setInformationalDistance(self._row, informational_distance)
+        else:
+            self._informational_distance = informational_distance
+
+    def _bind(self, store, row: int):
+        """Rattache la relation à une ligne du WorldStore (extrémités déjà renseignées dans le store)."""
+        if self._typeRelationship._isBound():
+            self._typeRelationship = self._typeRelationship.detached()
+        self._typeRelationship._bind(store, row)
+        store.write('informationalDistances', row, self._informational_distance)
+        self._store = store
+        self._row = row
+        self.sourceId = int(store.edgeSource[row])
+        self.targetId = int(store.edgeTarget[row])
+
+    def _unbind(self):
+        """Détache la relation du WorldStore en conservant ses valeurs."""
+        if self._store is not None:
+            self._source = self.source
+            self._target = self.target
+            self._informational_distance = self.informational_distance
+            self._typeRelationship._unbind()
+            self._store = None
+            self._row = None
+            self.sourceId = None
+            self.targetId = None
+
     def newConfidence(self):
         """Calcule la confiance basée sur engagement et passion."""
 
@@ -35,12 +119,22 @@ class Relationship:
 
         return max(0, min(100, confidence))
 
+    @staticmethod
+    def newConfidences(sternberg: np.ndarray) -> np.ndarray:
+        """Version vectorisée de newConfidence pour un tableau E×3 [privacy, commitment, passion]."""
+        baseConfidence = (sternberg[:, 0] + sternberg[:, 1]) / 2
+        confidence = np.where(baseConfidence < 0,
+                              np.maximum(0, 20 + baseConfidence * 20),
+                              20 + baseConfidence * 80)
+        return np.clip(confidence, 0, 100)
+
     def updateRelationship(self, newPrivacy=None, newCommitment=None, newPassion=None):
         """Met à jour la relation (intimité, engagement et passion)."""
 
+    @property
+    def values(self) -> np.ndarray:
+        """Vue (sans copie) sur [privacy, commitment, passion]."""
+        return self._typeRelationship.values
+
     def asArray(self):
-        return np.array([
-            self.typeRelationship.privacy,
-            self.typeRelationship.commitment,
-            self.typeRelationship.passion
-        ])
+        return self._typeRelationship.asArray()
@@ -1,5 +1,15 @@
-class TypeRelationship:
+import numpy as np
+
+from ..Universe.WorldStore import StoreView, StoreField
+
+
+class TypeRelationship(StoreView):
     """Type de relation basé sur la théorie de Sternberg (intimité, engagement, passion)."""
+    _table = 'relationships'
+
+    privacy = StoreField(0)
+    commitment = StoreField(1)
+    passion = StoreField(2)
 
     def __init__(self, privacy, commitment, passion):
         """
@@ -8,10 +18,11 @@ class TypeRelationship:
             commitment: Niveau d'engagement (-1 à 1)
             passion: Niveau de passion (-1 à 1)
         """
-        self.privacy = max(-1.0, min(1.0, privacy))
-        self.commitment = max(-1.0, min(1.0, commitment))
-        self.passion = max(-1.0, min(1.0, passion))
-        self.nom = self.identifyName()
+        self._initValues(np.clip([privacy, commitment, passion], -1.0, 1.0))
+
+    @property
+    def nom(self):
+        return self.identifyName()
 
     def identifyName(self):
         """Détermine le nom du type basé sur intimité, engagement et passion."""
@@ -51,8 +62,6 @@ class TypeRelationship:
         self.commitment = max(-1.0, min(1.0, self.commitment - change * 0.15))
         self.passion = max(-1.0, min(1.0, self.passion - change * 0.1))
 
-        self.nom = self.identifyName()
-
     def getAverage(self):
         return (self.privacy + self.commitment + self.passion) / 3.0
 
@@ -0,0 +1,120 @@
+import bisect
+import heapq
+import math
+
+
+class ArrivalIndex:
+    """
+    Temps d'arrivée des infos : plus courts chemins pondérés par Relationship.informational_distance.
+
+    delay(source, cible) est le nombre de ticks qu'une info partie de source met à atteindre cible
+    par bouche-à-oreille (chaque character la relayant dès réception), comme le fait
+    InteractionsEngine.diffuseInteraction. Seuls les characters du graph relaient (pas les ids réservés).
+
+    Les distances depuis une source sont calculées une fois (Dijkstra) à la première requête puis
+    gardées en cache. Le Graph prévient l'index de chaque changement de topologie : un ajout de
+    relation (ou un raccourcissement) est propagé incrémentalement dans les caches concernés ; une
+    suppression (ou un allongement) n'invalide que les sources dont un plus court chemin l'empruntait.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        # id source -> {id cible: délai en ticks} (cibles atteignables seulement)
+        self._delays = {}
+        # id source -> (délais triés, ids dans le même ordre), reconstruit à la demande
+        self._sorted = {}
+
+    # === Requêtes ===
+
+    def delays(self, sourceId: int) -> dict:
+        """Délais d'arrivée depuis sourceId vers tous les characters atteignables ({id: ticks})."""
+        delays = self._delays.get(sourceId)
+        if delays is None:
+            delays = self._delays[sourceId] = self._dijkstra(sourceId)
+        return delays
+
+    def delay(self, sourceId: int, targetId: int):
+        """Délai d'arrivée en ticks de sourceId vers targetId (None si l'info ne l'atteint jamais)."""
+        return self.delays(sourceId).get(targetId)
+
+    def reachedWithin(self, sourceId: int, ticks: int) -> list:
+        """Ids atteints au plus tard ticks ticks après le départ de sourceId, par ordre d'arrivée (O(log n))."""
+        ordered = self._sorted.get(sourceId)
+        if ordered is None:
+            entries = sorted((delay, nodeId) for nodeId, delay in self.delays(sourceId).items())
+            ordered = self._sorted[sourceId] = ([delay for delay, _ in entries], [nodeId for _, nodeId in entries])
+        delays, ids = ordered
+        return ids[:bisect.bisect_right(delays, ticks)]
+
+    def clear(self):
+        self._delays = {}
+        self._sorted = {}
+
+    # === Mises à jour (appelées par le Graph et le WorldStore) ===
+
+    def edgeAdded(self, sourceId: int, targetId: int, distance: int):
+        if targetId not in self.graph._characters:
+            return
+        for origin, delays in self._delays.items():
+            reached = delays.get(sourceId)
+            if reached is not None and reached + distance < delays.get(targetId, math.inf):
+                self._relax(origin, delays, [(reached + distance, targetId)])
+
+    def edgeRemoved(self, sourceId: int, targetId: int, distance: int):
+        for origin in [origin for origin, delays in self._delays.items() if self._onShortestPath(delays, sourceId, targetId, distance)]:
+            del self._delays[origin]
+            self._sorted.pop(origin, None)
+
+    def edgeDistanceChanged(self, sourceId: int, targetId: int, old: int, new: int):
+        if new < old:
+            self.edgeAdded(sourceId, targetId, new)
+        elif new > old:
+            self.edgeRemoved(sourceId, targetId, old)
+
+    def nodeAttached(self, nodeId: int):
+        """Un id réservé devient un character : ses relations entrantes comptent désormais."""
+        for sourceId, relationship in self.graph._inEdges.get(nodeId, {}).items():
+            self.edgeAdded(sourceId, nodeId, relationship.informational_distance)
+
+    def nodeDetached(self, nodeId: int):
+        """Un character quitte le graph (ses relations restent, il ne relaie plus)."""
+        self._delays.pop(nodeId, None)
+        self._sorted.pop(nodeId, None)
+        for origin in [origin for origin, delays in self._delays.items() if nodeId in delays]:
+            del self._delays[origin]
+            self._sorted.pop(origin, None)
+
+    # === Calcul ===
+
+    @staticmethod
+    def _onShortestPath(delays: dict, sourceId: int, targetId: int, distance: int) -> bool:
+        reached = delays.get(sourceId)
+        return reached is not None and reached + distance == delays.get(targetId)
+
+    def _dijkstra(self, sourceId: int) -> dict:
+        if sourceId not in self.graph._characters:
+            return {}
+        delays = {sourceId: 0}
+        self._relax(sourceId, delays, [(0, sourceId)], initial=True)
+        return delays
+
+    def _relax(self, origin: int, delays: dict, heap: list, initial: bool = False):
+        """Dijkstra depuis les (délai, id) de heap, en ne gardant que les améliorations de delays."""
+        characters = self.graph._characters
+        outEdges = self.graph._outEdges
+        if not initial:
+            for delay, nodeId in heap:
+                delays[nodeId] = delay
+            self._sorted.pop(origin, None)
+        heapq.heapify(heap)
+        while heap:
+            delay, nodeId = heapq.heappop(heap)
+            if delay > delays[nodeId]:
+                continue
+            for targetId, relationship in outEdges.get(nodeId, {}).items():
+                if targetId not in characters:
+                    continue
+                arrival = delay + relationship.informational_distance
+                if arrival < delays.get(targetId, math.inf):
+                    delays[targetId] = arrival
+                    heapq.heappush(heap, (arrival, targetId))
@@ -0,0 +1,34 @@
+class ChangeSet:
+    """
+    Modifications du monde entre deux commits (typiquement un tick), avec anciennes et nouvelles valeurs.
+
+    Attributs :
+        tick: tick du commit
+        nodes: {id: {champ: (ancienne, nouvelle)}} pour les characters ajoutés (ancienne = None) ou
+            modifiés ; champs 'emotions', 'personality', 'position'
+        edges: {(id source, id cible): {champ: (ancienne, nouvelle)}} pour les relations ajoutées ou
+            modifiées ; champs 'relationship' (Sternberg) et 'informational_distance'
+        addedNodes, removedNodes: ids ajoutés / supprimés
+        renamedNodes: {id: (ancien nom, nouveau nom)}
+        addedEdges, removedEdges: couples d'ids ajoutés / supprimés
+        names: {id: nom} pour tous les ids cités (ancien nom pour les characters supprimés)
+    """
+
+    def __init__(self, tick=None):
+        self.tick = tick
+        self.nodes = {}
+        self.edges = {}
+        self.addedNodes = []
+        self.removedNodes = []
+        self.renamedNodes = {}
+        self.addedEdges = []
+        self.removedEdges = []
+        self.names = {}
+
+    def isEmpty(self) -> bool:
+        return not (self.nodes or self.edges or self.removedNodes or self.removedEdges or self.renamedNodes)
+
+    def __repr__(self):
+        return (f"ChangeSet(tick={self.tick}, nodes={len(self.nodes)}, edges={len(self.edges)}, "
+                f"+nodes={len(self.addedNodes)}, -nodes={len(self.removedNodes)}, "
+                f"+edges={len(self.addedEdges)}, -edges={len(self.removedEdges)})")
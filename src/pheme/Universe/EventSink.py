@@ -0,0 +1,84 @@
+import random
+from collections import deque
+
+import numpy as np
+
+
+class EventSink:
+    """
+    Récepteur d'événements structurés de la simulation (changements d'émotions, de personnalité...).
+
+    Désactivé par défaut : tant qu'aucun récepteur n'est branché (setEventSink), les characters et
+    le moteur ne construisent aucun événement. Un récepteur ne garde que les événements de niveau
+    au moins level, et n'en échantillonne qu'une fraction sampling. Chaque événement est un dict
+    {'kind', 'level', ...champs} (valeurs numpy, sans mise en forme) transmis à handler, ou gardé
+    dans events (les capacity derniers) si aucun handler n'est donné.
+
+    Exemple : afficher un changement d'émotions sur cent
+        setEventSink(EventSink(sampling=0.01, handler=printEvent))
+    """
+
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+
+    def __init__(self, level: int = INFO, sampling: float = 1.0, handler=None, capacity: int = 10000,
+                 seed=None):
+        """
+        Args:
+            level: niveau minimal des événements gardés
+            sampling: fraction (0 à 1) des événements gardés
+            handler: fonction appelée avec chaque événement gardé
+            capacity: nombre d'événements conservés dans events (sans handler)
+            seed: graine de l'échantillonnage
+        """
+        self.level = level
+        self.sampling = sampling
+        self.handler = handler
+        self.events = deque(maxlen=capacity)
+        self._random = random.Random(seed)
+
+    def accepts(self, level: int = INFO) -> bool:
+        """Indique si un événement de ce niveau doit être construit (niveau et échantillonnage)."""
+        if level < self.level:
+            return False
+        return self.sampling >= 1.0 or self._random.random() < self.sampling
+
+    def emit(self, kind: str, level: int = INFO, **fields):
+        """Transmet un événement (à n'appeler qu'après accepts)."""
+        event = {'kind': kind, 'level': level, **fields}
+        if self.handler is None:
+            self.events.append(event)
+        else:
+            self.handler(event)
+
+
+# Récepteur courant (None : aucun événement)
+_sink = None
+
+
+def setEventSink(sink):
+    """Branche un récepteur d'événements (None pour le débrancher) ; renvoie le précédent."""
+    global _sink
+    previous = _sink
+    _sink = sink
+    return previous
+
+
+def getEventSink():
+    return _sink
+
+
+def acceptingSink(level: int = EventSink.INFO):
+    """Récepteur courant s'il accepte un événement de ce niveau, None sinon."""
+    sink = _sink
+    if sink is not None and sink.accepts(level):
+        return sink
+    return None
+
+
+def printEvent(event: dict):
+    """Handler qui affiche les événements dans la console (mise en forme à la réception)."""
+    fields = ', '.join(f"{name}={np.round(value, 2).tolist() if isinstance(value, np.ndarray) else value}"
+                       for name, value in event.items() if name not in ('kind', 'level'))
+    print(f"[{event['kind']}] {fields}")
@@ -1,86 +1,666 @@
-import networkx as nx
+import math
+
+import numpy as np
 
 from ..Characters.Character import Character
 from ..Relationships.Relationship import Relationship
+from .ArrivalIndex import ArrivalIndex
+from .ChangeSet import ChangeSet
+from .RelationshipAggregates import RelationshipAggregates
+from .SpatialIndex import SpatialIndex
+from .WorldSnapshot import WorldSnapshot
+from .WorldStore import WorldStore
 
 
 class Graph:
-    """Représente le graph de relations entre characters."""
+    """
+    Représente le graph de relations entre characters.
+
+    Les characters sont identifiés en interne par un id entier dense (leur ligne dans le WorldStore) ;
+    les méthodes publiques acceptent les noms, les variantes *ById les ids.
+
+    Les characters positionnés sont indexés dans une grille uniforme (cellSize) pour les requêtes
+    de proximité géographique (rayon, k plus proches voisins).
+
+    Les délais d'arrivée des infos (plus courts chemins pondérés par la distance informationnelle)
+    sont tenus par un ArrivalIndex créé à la première requête puis mis à jour à chaque changement
+    de topologie ; les moyennes des relations de chaque character par un RelationshipAggregates,
+    créé de même puis mis à jour à chaque écriture de relation.
+    """
+
+    def __init__(self, cellSize: float = 10.0):
+
+        # Miroir networkx optionnel : construit par toNetworkx() puis tenu à jour par un journal
+        # de mutations rejoué à la demande. Tant que personne ne le lit, rien n'est journalisé.
+        self._nxGraph = None
+        self._nxChanges = []
+        # Journal des changements de topologie à rejouer sur des répliques (enableTopologyLog)
+        self._topologyLog = None
+
+        # État numérique (personnalités, émotions, relations) stocké en colonnes + table nom <-> id
+        self.store = WorldStore()
+        self.spatialIndex = SpatialIndex(cellSize)
+        self.store.spatialIndex = self.spatialIndex
+
+        # Index des délais d'arrivée des infos, créé à la première requête
+        self._arrivalIndex = None
+        # Moyennes des relations par character, créées à la première requête
+        self._relationshipAggregates = None
+
+        # Flux des modifications par tick : abonnés et ChangeSet non encore lus
+        self._changeSubscribers = []
+        self._unpulledChanges = None
+
+        # Index : id -> Character et (id source, id cible) -> Relationship (ordre d'insertion conservé)
+        self._characters = {}
+        self._edges = {}
+        # Adjacence : id -> {id voisin: Relationship} (sortante et entrante)
+        self._outEdges = {}
+        self._inEdges = {}
+
+    def __getstate__(self):
+        # Les abonnés (fonctions quelconques) et l'historique des modifications ne sont pas copiés
+        state = self.__dict__.copy()
+        state['_changeSubscribers'] = []
+        state['_unpulledChanges'] = None
+        state['_arrivalIndex'] = None
+        state['_relationshipAggregates'] = None
+        state['_topologyLog'] = None
+        return state
+
+    @property
+    def listNode(self):
+        return list(self._characters.values())
+
+    @property
+    def listEdge(self):
+        return list(self._edges.values())
+
+    @classmethod
+    def fromColumns(cls, names, personalities, emotions, sources, targets, sternberg,
+                    informational_distances=None, validated=False, positions=None) -> 'Graph':
+        """
+        Construit un monde complet depuis des colonnes.
+
+        Args:
+            names: N noms de characters
+            personalities: tableau N×5 (Big Five)
+            emotions: tableau N×6
+            sources, targets: indices (dans names) des extrémités des E relations
+            sternberg: tableau E×3 [privacy, commitment, passion]
+            informational_distances: E distances (1 par défaut)
+            validated: True si les valeurs sont déjà dans leurs bornes (pas de clamp)
+            positions: tableau N×2 ou N×3 des positions (optionnel)
+        """
+        graph = cls()
+        ids = graph.addNodes(names, personalities, emotions, validated=validated, positions=positions)
+        graph.addEdges(ids[np.asarray(sources, dtype=np.int64)], ids[np.asarray(targets, dtype=np.int64)],
+                       sternberg, informational_distances, validated=validated)
+        return graph
+
+    # === Modifications par tick ===
+
+    def enableChangeTracking(self, keepHistory: bool = True):
+        """
+        Active l'enregistrement des modifications du monde. Chaque commitChanges (appelé par
+        InteractionsEngine.tick) produit un ChangeSet transmis aux abonnés et, si keepHistory,
+        conservé jusqu'au prochain pullChanges.
+        """
+        self.store.enableChangeTracking()
+        if keepHistory and self._unpulledChanges is None:
+            self._unpulledChanges = []
+
+    def disableChangeTracking(self):
+        self.store.disableChangeTracking()
+        self._unpulledChanges = None
+
+    @property
+    def isTrackingChanges(self) -> bool:
+        return self.store._changeLog is not None
+
+    def subscribeChanges(self, callback):
+        """Enregistre une fonction appelée avec chaque ChangeSet (active le suivi si besoin)."""
+        if not self.isTrackingChanges:
+            self.enableChangeTracking(keepHistory=False)
+        if callback not in self._changeSubscribers:
+            self._changeSubscribers.append(callback)
+
+    def unsubscribeChanges(self, callback):
+        if callback in self._changeSubscribers:
+            self._changeSubscribers.remove(callback)
+
+    def commitChanges(self, tick=None) -> ChangeSet:
+        """Clôt la période courante : ChangeSet des modifications depuis le commit précédent."""
+        changes = self.store.collectChanges(tick)
+        if self._unpulledChanges is not None:
+            self._unpulledChanges.append(changes)
+        for callback in self._changeSubscribers:
+            callback(changes)
+        return changes
+
+    def pullChanges(self) -> list:
+        """ChangeSet commités depuis le dernier appel (du plus ancien au plus récent)."""
+        if not self._unpulledChanges:
+            return []
+        changes, self._unpulledChanges = self._unpulledChanges, []
+        return changes
 
-    def __init__(self):
+    def snapshot(self, tick=None) -> WorldSnapshot:
+        """
+        Instantané en lecture seule du monde, pris en O(1) (copie sur écriture) : les lecteurs
+        (affichage, serveurs, analyses) peuvent le parcourir pendant que la simulation continue.
+        """
+        return WorldSnapshot(self.store.snapshot(), tick)
 
-        self.listNode = []
-        self.listEdge = []
-        self.nxGraph = nx.DiGraph()
+    # === Characters ===
 
-    def addNode(self, name, personality, emotions):
-        newCharacter = Character(name, personality, emotions)
-        self.listNode.append(newCharacter)
+    def addNode(self, name, personality, emotions, position=None):
+        """Ajoute un character (remplace celui du même nom en gardant son id et ses relations)."""
+        nodeId = self.store.allocateNode(name)
+        self._detachNode(nodeId)
+
+        newCharacter = Character(name, personality, emotions, position)
+        newCharacter._bind(self.store, nodeId)
+        self._attachNode(newCharacter)
 
         info = {'personality': personality, 'emotions': emotions}
-        self.nxGraph.add_node(name, **info)
+        self._logNetworkxChange('add_node', name, info)
+        self._logTopology('addNode', name, newCharacter.personality.detached(), newCharacter.emotions.detached(),
+                          position)
+
+    def addNodes(self, names, personalities=None, emotions=None, validated=False, positions=None) -> np.ndarray:
+        """
+        Ajoute N characters en une passe depuis des colonnes.
+
+        Args:
+            names: N noms
+            personalities: tableau N×5 (aléatoire dans [-1, 1] si None)
+            emotions: tableau N×6 (nulles si None)
+            validated: True si les valeurs sont déjà dans leurs bornes (pas de clamp)
+            positions: tableau N×2 ou N×3 (characters non positionnés si None)
+
+        Returns:
+            Les ids des characters créés (utilisables par addEdges)
+        """
+        names = list(names)
+        count = len(names)
+        if personalities is None:
+            personalities = np.random.uniform(-1.0, 1.0, (count, self.store.PERSONALITY_SIZE))
+        if emotions is None:
+            emotions = np.zeros((count, self.store.EMOTIONS_SIZE))
+        personalities = np.asarray(personalities, dtype=float).reshape(count, self.store.PERSONALITY_SIZE)
+        emotions = np.asarray(emotions, dtype=float).reshape(count, self.store.EMOTIONS_SIZE)
+        if not validated:
+            personalities = np.clip(personalities, -1.0, 1.0)
+            emotions = np.clip(emotions, 0.0, 1.0)
+
+        ids = self.store.allocateNodes(names)
+        for nodeId in ids.tolist():
+            self._detachNode(nodeId)
+        # Nom en double dans la même colonne : la dernière occurrence l'emporte
+        self.store.writeRows('personalities', ids, personalities)
+        self.store.writeRows('emotions', ids, emotions)
+        for nodeId in ids.tolist():
+            self.store.setPosition(nodeId, None)
+        if positions is not None:
+            self.store.setPositions(ids, positions)
+        for nodeId in ids.tolist():
+            if nodeId not in self._characters:
+                self._attachNode(Character._view(self.store, nodeId))
+
+        self.dropNetworkx()
+        self._logTopology('addNodes', names, personalities.copy(), emotions.copy(), True,
+                          None if positions is None else np.array(positions, dtype=float))
+        return ids
+
+    def _detachNode(self, nodeId: int):
+        """Détache le character remplacé par un autre du même nom (son id et ses relations sont conservés)."""
+        old = self._characters.pop(nodeId, None)
+        if old is not None:
+            old._unbind()
+
+    def _attachNode(self, character: Character):
+        nodeId = character.id
+        self._characters[nodeId] = character
+        self._outEdges.setdefault(nodeId, {})
+        self._inEdges.setdefault(nodeId, {})
+        if self._arrivalIndex is not None:
+            self._arrivalIndex.nodeAttached(nodeId)
 
     def removeNode(self, character):
-        self.listNode = [node for node in self.listNode if node != character]
-        self.listEdge = [edge for edge in self.listEdge if
-                         edge.source != character.name and edge.target != character.name]
-        self.nxGraph.remove_node(character.name)
+        """Supprime un character et ses relations en O(degré)."""
+        self.removeNodes([character])
+
+    def removeNodes(self, characters):
+        """Supprime plusieurs characters et leurs relations en une passe, en O(somme des degrés)."""
+        names = []
+        removed = []
+        for character in characters:
+            nodeId = character.id
+            if nodeId is None or self._characters.get(nodeId) is not character:
+                continue
+            names.append(character.name)
+            removed.append(nodeId)
+
+            for targetId in list(self._outEdges[nodeId]):
+                self._removeEdgeById(nodeId, targetId)
+            for sourceId in list(self._inEdges[nodeId]):
+                self._removeEdgeById(sourceId, nodeId)
+
+            del self._characters[nodeId]
+            del self._outEdges[nodeId]
+            del self._inEdges[nodeId]
+            if self._arrivalIndex is not None:
+                self._arrivalIndex.nodeDetached(nodeId)
+            character._unbind()
+            self.store.releaseNode(nodeId)
+
+        self._logNetworkxChange('remove_nodes', names)
+        if removed:
+            self._logTopology('removeNodesById', removed)
+
+    def removeNodesById(self, ids):
+        """Supprime les characters d'ids ids (les ids libres sont ignorés)."""
+        self.removeNodes([self._characters[nodeId] for nodeId in ids if nodeId in self._characters])
 
     def updateNode(self, oldName, newName, personality, emotions):
+        """
+        Renomme le character oldName en newName et remplace sa personnalité et ses émotions.
+        ValueError si oldName n'existe pas ou si newName est déjà pris (rien n'est modifié).
+        """
+        if self.getNode(oldName) is None:
+            raise ValueError(f"Aucun character nommé {oldName!r}")
+        if oldName != newName and newName in self.store.nodeIds:
+            raise ValueError(f"Le nom {newName!r} est déjà pris")
         if oldName != newName:
-            self.addNode(newName, personality, emotions)
-            for edge in self.listEdge:
-                if edge.source == oldName:
-                    self.addEdge(newName, edge.target, edge.typeRelationship)
-                    self.removeEdge(edge.source, edge.target)
-                elif edge.target == oldName:
-                    self.addEdge(edge.source, newName, edge.typeRelationship)
-                    self.removeEdge(edge.source, edge.target)
-            self.removeNode(self.getNode(oldName))
-            return
+            self.renameNodes({oldName: newName})
 
-        node = self.getNode(oldName)
+        node = self.getNode(newName)
         node.personality = personality
         node.emotions = emotions
+        self._logNetworkxChange('add_node', newName, {'personality': personality, 'emotions': emotions})
+
+    def renameNodes(self, mapping):
+        """
+        Renomme plusieurs characters en une passe ({ancien nom: nouveau nom}).
+        Seule la table nom <-> id change : O(1) par character, relations et ids inchangés.
+        """
+        nodeIds = self.store.nodeIds
+        mapping = {old: new for old, new in mapping.items()
+                   if old != new and self.getNode(old) is not None and (new not in nodeIds or new in mapping)}
+        if not mapping:
+            return
+
+        self.store.renameNodes({nodeIds[old]: new for old, new in mapping.items()})
+        self._logNetworkxChange('relabel', mapping)
+        self._logTopology('renameNodes', mapping)
 
     def getNode(self, name):
-        for node in self.listNode:
-            if node.name == name:
-                return node
-        return None
+        nodeId = self.store.nodeIds.get(name)
+        if nodeId is None:
+            return None
+        return self._characters.get(nodeId)
+
+    def getNodeById(self, nodeId: int):
+        return self._characters.get(nodeId)
 
     def getNodeNames(self):
-        return [node.name for node in self.listNode]
+        return [character.name for character in self._characters.values()]
+
+    def getNodeId(self, name):
+        """Id du character nommé name (None s'il n'existe pas)."""
+        character = self.getNode(name)
+        return character.id if character is not None else None
+
+    # === Proximité géographique ===
+
+    def _spatialCenter(self, center):
+        """(position, id à exclure) d'un centre donné par un character, un nom ou des coordonnées."""
+        if isinstance(center, str):
+            center = self.getNode(center)
+        if isinstance(center, Character):
+            return center.position, center.id
+        return center, None
+
+    def getNodesInRadius(self, center, radius: float) -> list:
+        """
+        Characters à une distance <= radius de center, du plus proche au plus lointain.
+
+        Args:
+            center: Character, nom ou position 2D/3D (un character n'est pas son propre voisin)
+            radius: rayon de recherche
+        """
+        position, exclude = self._spatialCenter(center)
+        if position is None:
+            return []
+        return [self._characters[nodeId] for nodeId in self.spatialIndex.queryRadius(position, radius)
+                if nodeId != exclude]
+
+    def getNearestNodes(self, center, k: int) -> list:
+        """Les k characters positionnés les plus proches de center (Character, nom ou position)."""
+        position, exclude = self._spatialCenter(center)
+        if position is None:
+            return []
+        return [self._characters[nodeId] for nodeId in self.spatialIndex.queryNearest(position, k, exclude)]
+
+    def getPhysicalDistance(self, characterA: Character, characterB: Character):
+        """Distance euclidienne entre deux characters (None si l'un n'est pas positionné)."""
+        positionA, positionB = characterA.position, characterB.position
+        if positionA is None or positionB is None:
+            return None
+        return math.dist(positionA, positionB)
+
+    def getSpatialInformationalDistance(self, characterA: Character, characterB: Character, speed: float = 1.0):
+        """
+        Distance informationnelle (en ticks) déduite de la distance physique : une info parcourt
+        speed unités par tick (1 tick minimum, None si l'un des characters n'est pas positionné).
+        """
+        distance = self.getPhysicalDistance(characterA, characterB)
+        if distance is None:
+            return None
+        return max(1, math.ceil(distance / speed))
+
+    # === Relations ===
 
     def addEdge(self, source, target, typeRelationship, informational_distance=1):
-        newRelationship = Relationship(source, target, typeRelationship, informational_distance)
-        self.listEdge.append(newRelationship)
+        """Ajoute une relation source -> cible (remplace la relation existante s'il y en a une)."""
+        self._addEdgeById(self.store.internNode(source), self.store.internNode(target),
+                          typeRelationship, informational_distance)
+        self._logTopology('addEdge', source, target, typeRelationship.detached(), informational_distance)
+
+    def addEdgeById(self, sourceId: int, targetId: int, typeRelationship, informational_distance=1):
+        self._addEdgeById(sourceId, targetId, typeRelationship, informational_distance)
+        self._logTopology('addEdgeById', sourceId, targetId, typeRelationship.detached(), informational_distance)
+
+    def _addEdgeById(self, sourceId: int, targetId: int, typeRelationship, informational_distance=1):
+        if (sourceId, targetId) in self._edges:
+            self._removeEdgeById(sourceId, targetId)
+
+        names = self.store.nodeNames
+        newRelationship = Relationship(names[sourceId], names[targetId], typeRelationship, informational_distance)
+        newRelationship._bind(self.store, self.store.allocateEdge(sourceId, targetId))
+        self._indexEdge(newRelationship)
 
         info = {'typeRelationship': typeRelationship, 'informational_distance': informational_distance}
-        self.nxGraph.add_edge(source, target, **info)
+        self._logNetworkxChange('add_edge', names[sourceId], names[targetId], info)
+
+    def addEdges(self, sources, targets, sternberg, informational_distances=None, validated=False):
+        """
+        Ajoute E relations en une passe depuis des colonnes.
+
+        Args:
+            sources, targets: ids (retournés par addNodes) ou noms des extrémités
+            sternberg: tableau E×3 [privacy, commitment, passion]
+            informational_distances: E distances en ticks (1 par défaut)
+            validated: True si les valeurs sont déjà dans leurs bornes (pas de clamp)
+        """
+        sourceIds = self._resolveNodes(sources)
+        targetIds = self._resolveNodes(targets)
+        count = len(sourceIds)
+        sternberg = np.asarray(sternberg, dtype=float).reshape(count, self.store.RELATIONSHIP_SIZE)
+        if informational_distances is None:
+            informational_distances = np.ones(count, dtype=np.int64)
+        informational_distances = np.asarray(informational_distances).reshape(count)
+        if not validated:
+            sternberg = np.clip(sternberg, -1.0, 1.0)
+            informational_distances = np.maximum(1, informational_distances.astype(np.int64))
+
+        intensities = (np.abs(sternberg).sum(axis=1) / 3.0).tolist()
+        confidences = Relationship.newConfidences(sternberg).tolist()
+
+        rows = self.store.allocateEdges(sourceIds, targetIds, informational_distances)
+        self.store.writeRows('relationships', rows, sternberg)
+        for row, intensity, confidence in zip(rows.tolist(), intensities, confidences):
+            relationship = Relationship._view(self.store, row, intensity, confidence)
+            if (relationship.sourceId, relationship.targetId) in self._edges:
+                self._removeEdgeById(relationship.sourceId, relationship.targetId)
+            self._indexEdge(relationship)
+
+        self.dropNetworkx()
+        self._logTopology('addEdges', list(sources), list(targets), sternberg.copy(), informational_distances.copy(), True)
+
+    def _resolveNodes(self, nodes) -> np.ndarray:
+        """Ids d'une colonne de characters (ids entiers ou noms, internés au besoin)."""
+        array = np.asarray(nodes)
+        if array.dtype.kind in 'iu':
+            return array.astype(np.int64)
+        return np.fromiter((self.store.internNode(name) for name in nodes), dtype=np.int64, count=len(array))
+
+    def _indexEdge(self, relationship: Relationship):
+        sourceId, targetId = relationship.sourceId, relationship.targetId
+        for nodeId in (sourceId, targetId):
+            if nodeId not in self._outEdges:
+                self._outEdges[nodeId] = {}
+                self._inEdges[nodeId] = {}
+        self._edges[(sourceId, targetId)] = relationship
+        self._outEdges[sourceId][targetId] = relationship
+        self._inEdges[targetId][sourceId] = relationship
+        if self._arrivalIndex is not None:
+            self._arrivalIndex.edgeAdded(sourceId, targetId, relationship.informational_distance)
 
     def removeEdge(self, source, target):
-        self.listEdge = [edge for edge in self.listEdge if not (edge.source == source and edge.target == target)]
-        self.nxGraph.remove_edge(source, target)
+        sourceId = self.store.nodeIds.get(source)
+        targetId = self.store.nodeIds.get(target)
+        if (sourceId, targetId) in self._edges:
+            self._removeEdgeById(sourceId, targetId)
+        self._logNetworkxChange('remove_edge', source, target)
+        self._logTopology('removeEdge', source, target)
+
+    def removeEdgeById(self, sourceId: int, targetId: int):
+        names = self.store.nodeNames
+        self._logNetworkxChange('remove_edge', names[sourceId], names[targetId])
+        self._removeEdgeById(sourceId, targetId)
+        self._logTopology('removeEdgeById', sourceId, targetId)
+
+    def _removeEdgeById(self, sourceId: int, targetId: int):
+        relationship = self._edges.pop((sourceId, targetId))
+        del self._outEdges[sourceId][targetId]
+        del self._inEdges[targetId][sourceId]
+        if self._arrivalIndex is not None:
+            self._arrivalIndex.edgeRemoved(sourceId, targetId, relationship.informational_distance)
+        row = relationship._row
+        relationship._unbind()
+        self.store.releaseEdge(row)
+
+        # Un id réservé (nom jamais ajouté comme character) disparaît avec sa dernière relation
+        for nodeId in (sourceId, targetId):
+            if nodeId not in self._characters and nodeId in self._outEdges \
+                    and not self._outEdges[nodeId] and not self._inEdges[nodeId]:
+                del self._outEdges[nodeId]
+                del self._inEdges[nodeId]
+                self.store.releaseNode(nodeId)
 
     def updateEdge(self, source, target, typeRelationship):
         self.removeEdge(source, target)
         self.addEdge(source, target, typeRelationship)
 
     def getEdge(self, source, target):
-        for edge in self.listEdge:
-            if edge.source == source and edge.target == target:
-                return edge
-        return None
+        nodeIds = self.store.nodeIds
+        return self._edges.get((nodeIds.get(source), nodeIds.get(target)))
+
+    def getEdgeById(self, sourceId: int, targetId: int):
+        return self._edges.get((sourceId, targetId))
+
+    def getOutEdges(self, character: Character) -> list:
+        """Relations sortantes de character, en O(degré)."""
+        return list(self._outEdges.get(character.id, {}).values())
+
+    def getInEdges(self, character: Character) -> list:
+        """Relations entrantes de character, en O(degré entrant)."""
+        return list(self._inEdges.get(character.id, {}).values())
 
     def getNeighbors(self, character: Character) -> list:
+        """Characters vers lesquels character a une relation sortante, en O(degré)."""
+        neighbors = []
+        for targetId in self._outEdges.get(character.id, {}):
+            target_character = self._characters.get(targetId)
+            if target_character is not None:
+                neighbors.append(target_character)
+        return neighbors
+
+    def getInNeighbors(self, character: Character) -> list:
+        """Characters qui ont une relation vers character, en O(degré entrant)."""
         neighbors = []
-        for edge in self.listEdge:
-            if edge.source == character.name:
-                target_character = self.getNode(edge.target)
-                if target_character is not None:
-                    neighbors.append(target_character)
+        for sourceId in self._inEdges.get(character.id, {}):
+            source_character = self._characters.get(sourceId)
+            if source_character is not None:
+                neighbors.append(source_character)
         return neighbors
 
+    def getInEdgeRows(self, character: Character):
+        """
+        Relations entrantes de character venant de characters du graph, en O(degré entrant) :
+        (ids des sources, lignes des relations dans le WorldStore), tableaux numpy.
+        """
+        sources = []
+        rows = []
+        for sourceId, relationship in self._inEdges.get(character.id, {}).items():
+            if sourceId in self._characters:
+                sources.append(sourceId)
+                rows.append(relationship._row)
+        return np.array(sources, dtype=np.int64), np.array(rows, dtype=np.int64)
+
+    def getObservers(self, interaction) -> list:
+        """
+        Characters indirectement concernés par interaction : ceux (hors participants) qui ont une
+        relation vers l'acteur ou la cible, par l'index des relations entrantes, en O(degré entrant).
+        """
+        actor, target = interaction.actor, interaction.target
+        observers = {}
+        for participant in (actor, target):
+            for character in self.getInNeighbors(participant):
+                if character is not actor and character is not target:
+                    observers[character.id] = character
+        return list(observers.values())
+
+    def getKnowers(self, interaction) -> list:
+        """
+        Characters qui connaissent interaction, dans l'ordre où ils l'ont apprise, par l'index du
+        registre en O(knowers × log k). Les entrées périmées (character supprimé, id réutilisé,
+        interaction oubliée) sont écartées et retirées de l'index.
+        """
+        registry = self.store.interactions
+        iid = registry.idOf(interaction, register=False)
+        if iid is None:
+            return []
+        knowers = {}
+        for nodeId in registry.knowerIds(iid):
+            character = self._characters.get(nodeId)
+            if character is not None and nodeId not in knowers and character.knows(interaction):
+                knowers[nodeId] = character
+        registry.keepKnowers(iid, list(knowers))
+        return list(knowers.values())
+
+    # === Délais d'arrivée des infos ===
+
+    @property
+    def arrivalIndex(self) -> ArrivalIndex:
+        if self._arrivalIndex is None:
+            self._arrivalIndex = ArrivalIndex(self)
+            self.store.arrivalIndex = self._arrivalIndex
+        return self._arrivalIndex
+
+    def getInformationDelay(self, source: Character, target: Character):
+        """Nombre de ticks pour qu'une info partie de source atteigne target (None si jamais)."""
+        return self.arrivalIndex.delay(source.id, target.id)
+
+    def getInformedWithin(self, source: Character, ticks: int) -> list:
+        """Characters qu'une info partie de source atteint en au plus ticks ticks, par ordre d'arrivée."""
+        return [self._characters[nodeId] for nodeId in self.arrivalIndex.reachedWithin(source.id, ticks)]
+
+    # === Moyennes des relations ===
+
+    @property
+    def relationshipAggregates(self) -> RelationshipAggregates:
+        if self._relationshipAggregates is None:
+            self._relationshipAggregates = RelationshipAggregates(self.store)
+            self.store.relationshipAggregates = self._relationshipAggregates
+        return self._relationshipAggregates
+
+    # === Journal de topologie (répliques) ===
+
+    def enableTopologyLog(self):
+        """
+        Commence à journaliser, dans l'ordre, les ajouts, suppressions et renommages de characters
+        et de relations. Une réplique partie d'une copie du graph qui rejoue ce journal
+        (applyTopologyChanges) retrouve les mêmes ids et le même ordre des relations.
+        """
+        if self._topologyLog is None:
+            self._topologyLog = []
+
+    def disableTopologyLog(self):
+        self._topologyLog = None
+
+    def pullTopologyChanges(self) -> list:
+        """Changements de topologie journalisés depuis le dernier appel (du plus ancien au plus récent)."""
+        if not self._topologyLog:
+            return []
+        changes, self._topologyLog = self._topologyLog, []
+        return changes
+
+    def applyTopologyChanges(self, changes):
+        """Rejoue des changements journalisés (pullTopologyChanges) d'un graph dont celui-ci est la copie."""
+        for method, *arguments in changes:
+            getattr(self, method)(*arguments)
+
+    def _logTopology(self, *change):
+        if self._topologyLog is not None:
+            self._topologyLog.append(change)
+
+    # === Miroir networkx (optionnel, importé seulement à la demande) ===
+
+    @property
+    def nxGraph(self):
+        return self.toNetworkx()
+
     def toNetworkx(self):
-        return self.nxGraph
+        """Retourne le networkx.DiGraph du graph, construit ou resynchronisé à la demande."""
+        import networkx as nx
+
+        if self._nxGraph is None:
+            self._nxGraph = self._buildNetworkx(nx)
+        else:
+            for change in self._nxChanges:
+                self._applyNetworkxChange(nx, change)
+        self._nxChanges = []
+        return self._nxGraph
+
+    def dropNetworkx(self):
+        """Libère le miroir networkx (il sera reconstruit au prochain toNetworkx)."""
+        self._nxGraph = None
+        self._nxChanges = []
+
+    def _logNetworkxChange(self, *change):
+        if self._nxGraph is None:
+            return
+        self._nxChanges.append(change)
+        # Au-delà d'une reconstruction complète, rejouer le journal ne vaut plus le coup
+        if len(self._nxChanges) > len(self._characters) + len(self._edges):
+            self.dropNetworkx()
+
+    def _buildNetworkx(self, nx):
+        nxGraph = nx.DiGraph()
+        for character in self._characters.values():
+            nxGraph.add_node(character.name, personality=character.personality, emotions=character.emotions)
+        for relationship in self._edges.values():
+            nxGraph.add_edge(relationship.source, relationship.target, typeRelationship=relationship.typeRelationship,
+                             informational_distance=relationship.informational_distance)
+        return nxGraph
+
+    def _applyNetworkxChange(self, nx, change):
+        kind = change[0]
+        if kind == 'add_node':
+            self._nxGraph.add_node(change[1], **change[2])
+        elif kind == 'remove_nodes':
+            self._nxGraph.remove_nodes_from(change[1])
+        elif kind == 'add_edge':
+            self._nxGraph.add_edge(change[1], change[2], **change[3])
+        elif kind == 'remove_edge':
+            if self._nxGraph.has_edge(change[1], change[2]):
+                self._nxGraph.remove_edge(change[1], change[2])
+        elif kind == 'relabel':
+            try:
+                nx.relabel_nodes(self._nxGraph, change[1], copy=False)
+            except nx.NetworkXUnfeasible:
+                # Permutation circulaire de noms : networkx ne sait pas renommer en place
+                self._nxGraph = nx.relabel_nodes(self._nxGraph, change[1], copy=True)
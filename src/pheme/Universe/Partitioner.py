@@ -0,0 +1,152 @@
+import heapq
+import math
+
+import numpy as np
+
+
+class Partitioner:
+    """
+    Découpe le monde d'un graph en shards équilibrés en limitant les relations entre shards.
+
+    Deux stratégies :
+        - 'community' : croissance gloutonne de régions du graph de relations depuis des graines
+          de fort degré, puis raffinement local (chaque character rejoint le shard où il a le plus
+          de relations tant que l'équilibre est respecté) ;
+        - 'region' : bissection récursive des positions selon l'axe le plus étendu
+          (les characters sans position sont ensuite placés comme en 'community').
+
+    Le résultat est un tableau indexé par id de character (-1 pour les ids libres ou réservés).
+    """
+
+    def __init__(self, graph, imbalance: float = 1.05, refinementPasses: int = 4):
+        """
+        Args:
+            graph: Le graph à découper
+            imbalance: taille maximale d'un shard relative à la taille moyenne
+            refinementPasses: nombre de passes de raffinement local
+        """
+        self.graph = graph
+        self.imbalance = imbalance
+        self.refinementPasses = refinementPasses
+
+    def partition(self, shardCount: int, method: str = 'community') -> np.ndarray:
+        """Shard de chaque character (tableau indexé par id)."""
+        store = self.graph.store
+        assignment = np.full(store.nodeCount, -1, dtype=np.int64)
+        ids = store.nodeRows()
+        if len(ids) == 0:
+            return assignment
+        shardCount = max(1, min(shardCount, len(ids)))
+        neighbors = self._undirectedNeighbors(ids)
+        capacity = math.ceil(len(ids) / shardCount * self.imbalance)
+
+        if method == 'region':
+            positioned = ids[store.hasPosition[ids]]
+            self._bisect(assignment, positioned, store.positions, 0, shardCount)
+        self._grow(assignment, ids, neighbors, shardCount, capacity)
+        self._refine(assignment, ids, neighbors, shardCount, capacity)
+        return assignment
+
+    def cutSize(self, assignment: np.ndarray) -> int:
+        """Nombre de relations dont la source et la cible sont sur des shards différents."""
+        store = self.graph.store
+        rows = store.edgeRows()
+        sources = store.edgeSource[rows]
+        targets = store.edgeTarget[rows]
+        alive = store.nodeAlive[sources] & store.nodeAlive[targets]
+        return int(np.count_nonzero(assignment[sources[alive]] != assignment[targets[alive]]))
+
+    # === Stratégies ===
+
+    def _undirectedNeighbors(self, ids: np.ndarray) -> dict:
+        graph = self.graph
+        neighbors = {}
+        for nodeId in ids.tolist():
+            linked = set(graph._outEdges.get(nodeId, ()))
+            linked.update(graph._inEdges.get(nodeId, ()))
+            linked.discard(nodeId)
+            neighbors[nodeId] = [other for other in linked if other in graph._characters]
+        return neighbors
+
+    def _bisect(self, assignment: np.ndarray, ids: np.ndarray, positions: np.ndarray, first: int, count: int):
+        """Bissection récursive des ids positionnés en count shards numérotés à partir de first."""
+        if len(ids) == 0:
+            return
+        if count == 1:
+            assignment[ids] = first
+            return
+        points = positions[ids]
+        axis = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+        order = ids[np.argsort(points[:, axis], kind='stable')]
+        leftCount = count // 2
+        split = len(order) * leftCount // count
+        self._bisect(assignment, order[:split], positions, first, leftCount)
+        self._bisect(assignment, order[split:], positions, first + leftCount, count - leftCount)
+
+    def _grow(self, assignment: np.ndarray, ids: np.ndarray, neighbors: dict, shardCount: int, capacity: int):
+        """Place les characters non assignés en faisant croître chaque shard depuis une graine."""
+        sizes = np.bincount(assignment[ids][assignment[ids] >= 0], minlength=shardCount)
+        unassigned = [nodeId for nodeId in ids.tolist() if assignment[nodeId] < 0]
+        # Graines : characters de plus fort degré d'abord
+        seeds = sorted(unassigned, key=lambda nodeId: -len(neighbors[nodeId]))
+        seedIndex = 0
+
+        for shard in range(shardCount):
+            # Les characters restants sont répartis sur les shards restants
+            remaining = sum(1 for nodeId in unassigned if assignment[nodeId] < 0)
+            target = min(capacity, sizes[shard] + math.ceil(remaining / (shardCount - shard)))
+            frontier = []
+            gains = {}
+
+            def push(nodeId):
+                for other in neighbors[nodeId]:
+                    if assignment[other] < 0:
+                        gains[other] = gains.get(other, 0) + 1
+                        heapq.heappush(frontier, (-gains[other], other))
+
+            # Un shard déjà amorcé (stratégie 'region') croît depuis ses membres
+            for nodeId in ids[assignment[ids] == shard].tolist():
+                push(nodeId)
+
+            while sizes[shard] < target:
+                nodeId = None
+                while frontier:
+                    gain, candidate = heapq.heappop(frontier)
+                    if assignment[candidate] < 0 and -gain == gains.get(candidate):
+                        nodeId = candidate
+                        break
+                if nodeId is None:
+                    while seedIndex < len(seeds) and assignment[seeds[seedIndex]] >= 0:
+                        seedIndex += 1
+                    if seedIndex == len(seeds):
+                        break
+                    nodeId = seeds[seedIndex]
+                assignment[nodeId] = shard
+                sizes[shard] += 1
+                push(nodeId)
+
+        # Reliquat éventuel (arrondis) : shard le moins chargé
+        for nodeId in unassigned:
+            if assignment[nodeId] < 0:
+                shard = int(np.argmin(sizes))
+                assignment[nodeId] = shard
+                sizes[shard] += 1
+
+    def _refine(self, assignment: np.ndarray, ids: np.ndarray, neighbors: dict, shardCount: int, capacity: int):
+        """Déplace chaque character vers le shard où il a le plus de relations, sans dépasser capacity."""
+        sizes = np.bincount(assignment[ids], minlength=shardCount)
+        for _ in range(self.refinementPasses):
+            moved = 0
+            for nodeId in ids.tolist():
+                if not neighbors[nodeId]:
+                    continue
+                counts = np.bincount(assignment[neighbors[nodeId]], minlength=shardCount)
+                current = assignment[nodeId]
+                best = int(np.argmax(counts))
+                if counts[best] > counts[current] and sizes[best] < capacity and sizes[current] > 1:
+                    assignment[nodeId] = best
+                    sizes[best] += 1
+                    sizes[current] -= 1
+                    moved += 1
+            if moved == 0:
+                break
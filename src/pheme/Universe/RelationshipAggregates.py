@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class RelationshipAggregates:
+    """
+    Somme et nombre, par character, des moyennes Sternberg (TypeRelationship.getAverage) de ses
+    relations incidentes (sortantes et entrantes, une boucle sur soi-même comptée une fois).
+
+    Branché sur un WorldStore (store.relationshipAggregates), il est prévenu de chaque relation
+    allouée ou libérée et de chaque écriture de valeurs de relation (moteur, évolution, interface)
+    et tient ses sommes à jour en O(relations modifiées). La moyenne des relations d'un character
+    (EvolutionManager.getAverageRelationship) se lit alors en O(1), celles de tous en O(N).
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.rebuild()
+
+    def rebuild(self):
+        """Recalcule toutes les sommes depuis le store (élimine les erreurs d'arrondi accumulées)."""
+        store = self.store
+        capacity = len(store.nodeAlive)
+        rows = store.edgeRows()
+        sources, targets = store.edgeSource[rows], store.edgeTarget[rows]
+        averages = self._averages(store.relationships[rows])
+        distinct = targets != sources
+        # Sur un store sans relation, bincount rend des entiers : les sommes doivent rester des flottants
+        self.sums = (np.bincount(sources, averages, minlength=capacity)
+                     + np.bincount(targets[distinct], averages[distinct], minlength=capacity)).astype(np.float64)
+        self.counts = (np.bincount(sources, minlength=capacity)
+                       + np.bincount(targets[distinct], minlength=capacity)).astype(np.int64)
+
+    @staticmethod
+    def _averages(values: np.ndarray) -> np.ndarray:
+        return (values[:, 0] + values[:, 1] + values[:, 2]) / 3.0
+
+    def _add(self, rows: np.ndarray, averages: np.ndarray, count: int):
+        """Ajoute averages (et count relations) aux deux extrémités de chaque relation rows."""
+        store = self.store
+        self._grow()
+        sources, targets = store.edgeSource[rows], store.edgeTarget[rows]
+        distinct = targets != sources
+        np.add.at(self.sums, sources, averages)
+        np.add.at(self.sums, targets[distinct], averages[distinct])
+        if count:
+            np.add.at(self.counts, sources, count)
+            np.add.at(self.counts, targets[distinct], count)
+            # Plus aucune relation : somme remise à zéro (pas de résidu d'arrondi)
+            ends = np.concatenate([sources, targets])
+            self.sums[ends[self.counts[ends] == 0]] = 0.0
+
+    def _grow(self):
+        """Suit l'agrandissement des tables de characters du store."""
+        grown = len(self.store.nodeAlive) - len(self.sums)
+        if grown > 0:
+            self.sums = np.concatenate([self.sums, np.zeros(grown)])
+            self.counts = np.concatenate([self.counts, np.zeros(grown, dtype=np.int64)])
+
+    def edgesAdded(self, rows):
+        """Relations rows allouées (extrémités déjà écrites)."""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+        self._add(rows, self._averages(self.store.relationships[rows]), 1)
+
+    def edgesRemoved(self, rows):
+        """Relations rows sur le point d'être libérées (extrémités encore écrites)."""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+        self._add(rows, -self._averages(self.store.relationships[rows]), -1)
+
+    def valuesChanged(self, rows, old: np.ndarray):
+        """Valeurs des relations rows écrites (old : valeurs d'avant, une ligne par relation), en bloc."""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+        alive = self.store.edgeAlive[rows]
+        if not alive.all():
+            rows, old = rows[alive], old.reshape(-1, 3)[alive]
+        if len(rows):
+            self._add(rows, self._averages(self.store.relationships[rows]) - self._averages(old.reshape(-1, 3)), 0)
+
+    def valueChanged(self, row: int, old):
+        """
+        Valeurs de la seule relation row écrites (old : ses trois valeurs d'avant), en O(1) : l'écart
+        des moyennes est ajouté directement aux sommes de ses deux extrémités, sans tableau temporaire.
+        """
+        store = self.store
+        if not store.edgeAlive[row]:
+            return
+        new = store.relationships[row].tolist()
+        delta = (new[0] + new[1] + new[2]) / 3.0 - (old[0] + old[1] + old[2]) / 3.0
+        source, target = int(store.edgeSource[row]), int(store.edgeTarget[row])
+        sums = self.sums
+        sums[source] += delta
+        if target != source:
+            sums[target] += delta
+
+    def average(self, nodeId: int) -> float:
+        """Moyenne des relations incidentes du character nodeId (0 s'il n'en a aucune)."""
+        if nodeId >= len(self.counts) or self.counts[nodeId] == 0:
+            return 0
+        return float(self.sums[nodeId] / self.counts[nodeId])
+
+    def averages(self, ids: np.ndarray) -> np.ndarray:
+        """Moyennes des relations incidentes des characters ids (0 pour ceux qui n'en ont aucune)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        self._grow()
+        counts = self.counts[ids]
+        result = np.zeros(len(ids))
+        np.divide(self.sums[ids], counts, out=result, where=counts > 0)
+        return result
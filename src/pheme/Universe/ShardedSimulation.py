@@ -0,0 +1,512 @@
+import multiprocessing
+import pickle
+import random
+
+import numpy as np
+
+from ..Evolution.EvolutionManager import EvolutionManager
+from ..Interactions.EngineConfiguration import EngineConfiguration
+from ..Interactions.InteractionsEngine import InteractionsEngine
+from ..Interactions.PropagationScheduler import PropagationScheduler
+from ..Relationships.TypeRelationship import TypeRelationship
+from .Partitioner import Partitioner
+
+
+class ShardedSimulation:
+    """
+    Simulation du moteur d'interactions et de l'évolution répartie sur plusieurs processus.
+
+    Le monde est découpé en shards (Partitioner) ; chaque shard tourne dans son propre processus
+    avec une réplique complète du graph et son propre InteractionsEngine, et ne traite que les
+    characters qui lui appartiennent. Le graph passé au constructeur reste la référence : il est
+    mis à jour à la fin de chaque tick.
+
+    Le coordinateur (ce processus) tient la file globale des propagations en attente
+    (PropagationScheduler) et les connaissances des characters : les répliques n'en gardent aucune.
+    À chaque tick il reprend les infos arrivées dans l'ordre exact où le moteur mono-processus les
+    traiterait, écarte les doublons et les characters déjà informés, prévoit les relations neutres
+    créées par les interactions directes et envoie à chaque shard la liste ordonnée de ses
+    traitements. Les shards renvoient leurs nouvelles propagations (échangées entre shards à la
+    frontière du tick), leurs émotions et leurs relations modifiées. Les résultats du moteur sont
+    identiques à ceux d'un seul InteractionsEngine ; l'évolution, tirée au hasard indépendamment
+    dans chaque shard, ne reproduit le résultat mono-processus qu'en distribution.
+
+    S'utilise comme un InteractionsEngine (processInteractionForCharacter, diffuseInteraction,
+    tick) ; les appels faits entre deux ticks sont groupés et exécutés au tick suivant (ou flush).
+    Le graph peut être modifié entre deux ticks : les ajouts, suppressions et renommages de
+    characters et de relations sont journalisés (Graph.enableTopologyLog) et rejoués dans les
+    répliques avant le tour suivant, les nouveaux characters rejoignant le shard de la plupart de
+    leurs voisins. Les valeurs (émotions, personnalités, relations) modifiées hors de la
+    simulation sont recopiées dans les répliques par synchronize.
+    """
+
+    def __init__(self, graph, shardCount: int = 2, method: str = 'community', assignment=None,
+                 config: EngineConfiguration = None, seed: int = None):
+        """
+        Args:
+            graph: Le graph à simuler (mis à jour en place)
+            shardCount: nombre de shards (processus)
+            method: stratégie de découpage ('community' ou 'region')
+            assignment: découpage explicite (shard de chaque id), remplace shardCount et method
+            config: configuration des moteurs (EngineConfiguration par défaut)
+            seed: graine des tirages de l'évolution dans les shards
+        """
+        self.graph = graph
+        self.config = config if config is not None else EngineConfiguration()
+        if assignment is None:
+            assignment = Partitioner(graph).partition(shardCount, method)
+        self.assignment = np.asarray(assignment, dtype=np.int64)
+        self.shardCount = int(self.assignment.max()) + 1 if len(self.assignment) else 1
+        self.seed = seed
+
+        # Appels externes en attente : (type, character ou groupe, interaction, tick)
+        self._operations = []
+        # Propagations en attente (cible : id du character), dans l'ordre du moteur mono-processus
+        self._scheduler = PropagationScheduler()
+        self._evolutions = 0
+
+        graph.dropNetworkx()
+        graph.enableTopologyLog()
+        payload = pickle.dumps((graph, self.config))
+        context = multiprocessing.get_context()
+        self._connections = []
+        self._processes = []
+        for shard in range(self.shardCount):
+            owned = np.flatnonzero(self.assignment == shard)
+            parentConnection, childConnection = context.Pipe()
+            process = context.Process(target=_runShard, args=(childConnection, payload, shard, owned, seed),
+                                      daemon=True)
+            process.start()
+            childConnection.close()
+            self._connections.append(parentConnection)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Arrête les processus des shards."""
+        self.graph.disableTopologyLog()
+        for connection in self._connections:
+            try:
+                connection.send(('stop', None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    @property
+    def pendingCount(self) -> int:
+        """Nombre de propagations en transit."""
+        return len(self._scheduler)
+
+    # === API du moteur ===
+
+    def learnAboutInteraction(self, character, interaction):
+        self._operations.append(('learn', character, interaction, None))
+
+    def processInteractionForCharacter(self, character, interaction):
+        # Inscrite au journal du graph de référence comme par InteractionsEngine
+        self.graph.store.interactions.register(interaction)
+        self._operations.append(('process', character, interaction, None))
+
+    def processInteractionForGroup(self, group, interaction):
+        self.graph.store.interactions.register(interaction)
+        # Observateurs choisis au flush : les relations créées plus tôt dans le tour en font partie
+        self._operations.append(('group', list(group), interaction, None))
+
+    def processInteractionForAll(self, interaction):
+        self.graph.store.interactions.register(interaction)
+        self._operations.append(('all', None, interaction, None))
+
+    def diffuseInteraction(self, source, interaction, current_tick: int):
+        self._operations.append(('diffuse', source, interaction, current_tick))
+
+    def flush(self):
+        """Exécute les appels en attente dans les shards et met à jour le graph de référence."""
+        self._sendTopology()
+        if not self._operations:
+            return
+        operations, self._operations = self._operations, []
+        plan = _RoundPlan(self)
+        for kind, character, interaction, tick in operations:
+            if kind == 'learn':
+                # Les connaissances ne sont tenues que par le graph de référence
+                character.learnAboutInteraction(interaction)
+                continue
+            if kind == 'group':
+                plan.group(character, interaction)
+                continue
+            if kind == 'all':
+                plan.all(interaction)
+                continue
+            if kind == 'process':
+                plan.direct(character, interaction)
+            elif not character.knows(interaction):
+                character.learnAboutInteraction(interaction)
+            plan.add(kind, character.id, interaction, tick, 1.0)
+        self._execute(plan)
+
+    def tick(self, current_tick: int):
+        """Équivalent réparti de InteractionsEngine.tick."""
+        self.flush()
+
+        due = self._scheduler.popDue(current_tick)
+        if due:
+            plan = _RoundPlan(self)
+            for targetId, interaction, strength in due:
+                target = self.graph.getNodeById(targetId)
+                if target is None or target.knows(interaction):
+                    continue
+                target.learnAboutInteraction(interaction)
+                plan.direct(target, interaction)
+                plan.add('deliver', targetId, interaction, current_tick, strength)
+            self._execute(plan)
+
+        if self.graph.isTrackingChanges:
+            self.graph.commitChanges(current_tick)
+
+    def evolve(self):
+        """
+        Évolution répartie : chaque shard fait évoluer ses characters et leurs relations sortantes
+        avec son propre générateur aléatoire, puis le graph de référence et les répliques sont resynchronisés.
+        """
+        self.flush()
+        self.synchronize()
+        self._evolutions += 1
+        for connection in self._connections:
+            connection.send(('evolve', self._evolutions))
+        results = [connection.recv() for connection in self._connections]
+
+        store = self.graph.store
+        ids = store.nodeRows()
+        emotions = store.emotions[ids].copy()
+        for deltas in (result['emotions'] for result in results):
+            emotions += deltas[ids]
+        store.writeRows('emotions', ids, np.clip(emotions, 0.0, 1.0))
+
+        # Relations créées : comme dans EvolutionManager, une seule par paire de characters
+        # (le premier shard l'emporte)
+        created = set()
+        for result in results:
+            for sourceId, targetId, values, distance in result['edges']:
+                relationship = self.graph.getEdgeById(sourceId, targetId)
+                if relationship is None:
+                    if self.graph.getEdgeById(targetId, sourceId) is None:
+                        self.graph.addEdgeById(sourceId, targetId, TypeRelationship(*values), distance)
+                        created.add((sourceId, targetId))
+                elif (sourceId, targetId) not in created:
+                    relationship.typeRelationship.setArray(values)
+        # Relations créées par les shards : recopiées (ou écartées) par synchronize, pas rejouées
+        self.graph.pullTopologyChanges()
+        self.synchronize()
+
+    def synchronize(self):
+        """
+        Recopie l'état complet du graph de référence dans toutes les répliques : changements de
+        topologie en attente, puis valeurs (les relations absentes du graph de référence sont retirées).
+        """
+        self._sendTopology()
+        store = self.graph.store
+        ids = store.nodeRows()
+        edges = self.graph.listEdge
+        state = {
+            'ids': ids,
+            'emotions': store.emotions[ids],
+            'personalities': store.personalities[ids],
+            'sources': np.array([relationship.sourceId for relationship in edges], dtype=np.int64),
+            'targets': np.array([relationship.targetId for relationship in edges], dtype=np.int64),
+            'relationships': np.array([relationship.values for relationship in edges]).reshape(-1, 3),
+            'distances': np.array([relationship.informational_distance for relationship in edges], dtype=np.int64),
+        }
+        for connection in self._connections:
+            connection.send(('synchronize', state))
+        for connection in self._connections:
+            connection.recv()
+
+    # === Coordination ===
+
+    def _sendTopology(self):
+        """Rejoue dans les répliques les changements de topologie faits depuis le tour précédent."""
+        changes = self.graph.pullTopologyChanges()
+        if not changes:
+            return
+        # Les ids libérés peuvent être réattribués : leurs propagations en attente sont annulées
+        removed = [nodeId for change in changes if change[0] == 'removeNodesById' for nodeId in change[1]]
+        if removed:
+            self._scheduler.cancelTargets(removed)
+        self._assignNewNodes()
+        for connection in self._connections:
+            connection.send(('topology', {'changes': changes, 'assignment': self.assignment}))
+        for connection in self._connections:
+            connection.recv()
+
+    def _assignNewNodes(self):
+        """Shard des characters apparus depuis le découpage : celui de la plupart de leurs voisins, sinon le moins chargé."""
+        store = self.graph.store
+        assignment = np.full(store.nodeCount, -1, dtype=np.int64)
+        count = min(len(self.assignment), store.nodeCount)
+        assignment[:count] = self.assignment[:count]
+        # Ids libérés : plus possédés par aucun shard (ils peuvent être réattribués)
+        assignment[~store.nodeAlive[:store.nodeCount]] = -1
+        ids = store.nodeRows()
+        missing = ids[assignment[ids] < 0]
+        loads = np.bincount(assignment[ids[assignment[ids] >= 0]], minlength=self.shardCount)
+        for nodeId in missing.tolist():
+            neighbors = [assignment[other] for other in self.graph._outEdges.get(nodeId, {})]
+            neighbors += [assignment[other] for other in self.graph._inEdges.get(nodeId, {})]
+            neighbors = [shard for shard in neighbors if shard >= 0]
+            if neighbors:
+                shard = int(np.bincount(neighbors, minlength=self.shardCount).argmax())
+            else:
+                shard = int(np.argmin(loads))
+            assignment[nodeId] = shard
+            loads[shard] += 1
+        self.assignment = assignment
+
+    def _execute(self, plan: '_RoundPlan'):
+        """Envoie un tour de traitements aux shards et intègre leurs résultats."""
+        # Les shards ne gardent les interactions que le temps du tour
+        interactions = []
+        for iid, interaction in enumerate(plan.interactions):
+            shipped = interaction.detached()
+            shipped.actor = None
+            shipped.target = None
+            interactions.append((iid, self._reference(interaction.actor), self._reference(interaction.target), shipped))
+
+        for shard, connection in enumerate(self._connections):
+            creations = [creation for creation in plan.creations if self.assignment[creation[1]] != shard]
+            connection.send(('run', {'interactions': interactions,
+                                     'operations': plan.operations[shard],
+                                     'creations': creations}))
+
+        store = self.graph.store
+        propagations = []
+        for connection in self._connections:
+            result = connection.recv()
+            propagations.extend(result['propagations'])
+            if len(result['ids']):
+                store.writeRows('emotions', result['ids'], result['emotions'])
+            for sourceId, targetId, values in zip(result['sources'].tolist(), result['targets'].tolist(),
+                                                  result['relationships']):
+                self.graph.getEdgeById(sourceId, targetId).typeRelationship.setArray(values)
+        # Relations créées pendant le tour : déjà reproduites par les shards (creations)
+        self.graph.pullTopologyChanges()
+
+        # Programmées dans l'ordre où le moteur mono-processus les aurait produites
+        propagations.sort(key=lambda propagation: (propagation[0], propagation[1]))
+        for _, _, arrival, targetId, iid, strength in propagations:
+            self._propagate(arrival, targetId, plan.interactions[iid], strength)
+
+    @staticmethod
+    def _reference(character):
+        """Id d'un character du graph ; un character supprimé (détaché) est envoyé tel quel."""
+        return character.id if character.id is not None else character
+
+    def _propagate(self, arrival: int, targetId: int, interaction, strength: float):
+        """
+        Programme une propagation comme InteractionsEngine.diffuseInteraction : un character déjà
+        informé est écarté, et l'arrivée la plus précoce, puis la plus forte, puis la première
+        programmée l'emporte.
+        """
+        target = self.graph.getNodeById(targetId)
+        if target is not None and target.knows(interaction):
+            return
+        self._scheduler.scheduleEarliest(arrival, targetId, interaction, strength)
+
+
+class _RoundPlan:
+    """Traitements ordonnés d'un tour, répartis par shard, et relations créées pendant le tour."""
+
+    def __init__(self, simulation: ShardedSimulation):
+        self.simulation = simulation
+        self.operations = [[] for _ in range(simulation.shardCount)]
+        self.creations = []
+        # Interactions citées par le tour, envoyées avec lui et numérotées dans l'ordre
+        self.interactions = []
+        self._ids = {}
+        self.rank = 0
+
+    def add(self, kind: str, nodeId: int, interaction, tick, strength: float):
+        iid = self._ids.get(interaction)
+        if iid is None:
+            iid = self._ids[interaction] = len(self.interactions)
+            self.interactions.append(interaction)
+        shard = self.simulation.assignment[nodeId]
+        self.operations[shard].append((self.rank, kind, nodeId, iid, tick, strength))
+        self.rank += 1
+
+    def group(self, group, interaction):
+        """
+        Traitements de processInteractionForGroup : seuls les participants et les observateurs
+        (voir InteractionsEngine) sont concernés. Les observateurs sont lus dans le graph de
+        référence, où les relations prévues plus tôt dans le tour (direct) existent déjà.
+        """
+        concerned = {character.id for character in self.simulation.graph.getObservers(interaction)}
+        for character in group:
+            if character is interaction.actor or character is interaction.target or character.id in concerned:
+                self.direct(character, interaction)
+                self.add('process', character.id, interaction, None, 1.0)
+
+    def all(self, interaction):
+        """Traitements de processInteractionForAll, dans l'ordre du moteur : participants, puis observateurs."""
+        graph = self.simulation.graph
+        actor, target = interaction.actor, interaction.target
+        if actor is target:
+            self.group(graph.listNode, interaction)
+            return
+        for participant in (actor, target):
+            if graph.getNodeById(participant.id) is participant:
+                self.direct(participant, interaction)
+                self.add('process', participant.id, interaction, None, 1.0)
+        for observer in graph.getObservers(interaction):
+            self.add('process', observer.id, interaction, None, 1.0)
+
+    def direct(self, character, interaction):
+        """Prévoit la relation neutre créée par le moteur si character participe à l'interaction."""
+        if character is interaction.actor:
+            other = interaction.target
+        elif character is interaction.target:
+            other = interaction.actor
+        else:
+            return
+        graph = self.simulation.graph
+        if graph.getNodeById(other.id) is not other:
+            return
+        if graph.getEdgeById(character.id, other.id) is None:
+            graph.addEdgeById(character.id, other.id, TypeRelationship(0.0, 0.0, 0.0))
+            self.creations.append((self.rank, character.id, other.id))
+
+
+class _Shard:
+    """
+    Côté processus d'un shard : réplique du graph et moteur limité aux characters possédés.
+    La réplique ne garde aucune connaissance : le coordinateur écarte les characters informés.
+    """
+
+    def __init__(self, graph, config, shard: int, owned: np.ndarray, seed):
+        self.graph = graph
+        for character in graph.listNode:
+            character.knownInteractions = ()
+        self.shard = shard
+        self.owned = set(owned.tolist())
+        self.seed = seed
+        self.engine = InteractionsEngine(graph)
+        self.engine.config = config
+
+    def run(self, message: dict) -> dict:
+        graph = self.graph
+        engine = self.engine
+        interactions = {}
+        for iid, actor, target, interaction in message['interactions']:
+            interaction.actor = graph.getNodeById(actor) if isinstance(actor, int) else actor
+            interaction.target = graph.getNodeById(target) if isinstance(target, int) else target
+            interactions[iid] = interaction
+
+        creations = message['creations']
+        nextCreation = 0
+        propagations = []
+        touched = {}
+        for rank, kind, nodeId, iid, tick, strength in message['operations']:
+            # Relations créées plus tôt dans le tour par les autres shards
+            while nextCreation < len(creations) and creations[nextCreation][0] < rank:
+                self._create(*creations[nextCreation][1:])
+                nextCreation += 1
+
+            character = graph.getNodeById(nodeId)
+            interaction = interactions[iid]
+            if kind == 'process':
+                engine.processInteractionForCharacter(character, interaction)
+                touched[nodeId] = None
+            elif kind == 'diffuse':
+                engine.diffuseInteraction(character, interaction, tick)
+            else:
+                engine.processInteractionForCharacter(character, interaction, strength)
+                touched[nodeId] = None
+                engine.diffuseInteraction(character, interaction, tick, strength=strength)
+            # Appris par diffuseInteraction le temps de la diffusion seulement
+            character.knownInteractions = ()
+
+            for index, (arrival, neighbor, _, relayed) in enumerate(engine.scheduler.entries()):
+                propagations.append((rank, index, arrival, neighbor.id, iid, relayed))
+            engine.scheduler.clear()
+
+        for creation in creations[nextCreation:]:
+            self._create(*creation[1:])
+        # Interactions du tour oubliées du registre de la réplique (le journal de référence est celui du coordinateur)
+        registry = graph.store.interactions
+        for interaction in interactions.values():
+            iid = registry.idOf(interaction, register=False)
+            if iid is not None:
+                registry.release(iid)
+
+        ids = np.fromiter(touched, dtype=np.int64, count=len(touched))
+        edges = [relationship for nodeId in touched for relationship in graph._outEdges[nodeId].values()]
+        return {
+            'propagations': propagations,
+            'ids': ids,
+            'emotions': graph.store.emotions[ids],
+            'sources': np.array([relationship.sourceId for relationship in edges], dtype=np.int64),
+            'targets': np.array([relationship.targetId for relationship in edges], dtype=np.int64),
+            'relationships': np.array([relationship.values for relationship in edges]).reshape(-1, 3),
+        }
+
+    def _create(self, sourceId: int, targetId: int):
+        if self.graph.getEdgeById(sourceId, targetId) is None:
+            self.graph.addEdgeById(sourceId, targetId, TypeRelationship(0.0, 0.0, 0.0))
+
+    def evolve(self, count: int) -> dict:
+        if self.seed is None:
+            random.seed()
+        else:
+            random.seed((self.seed * 1000003 + count) * 1009 + self.shard)
+
+        graph = self.graph
+        emotionsBefore = graph.store.emotions.copy()
+        valuesBefore = {key: relationship.asArray() for key, relationship in graph._edges.items()}
+        EvolutionManager(graph, scope=self.owned).evolve()
+
+        edges = []
+        for (sourceId, targetId), relationship in graph._edges.items():
+            before = valuesBefore.get((sourceId, targetId))
+            if before is None or not np.array_equal(before, relationship.values):
+                edges.append((sourceId, targetId, relationship.asArray(), relationship.informational_distance))
+        return {'emotions': graph.store.emotions - emotionsBefore, 'edges': edges}
+
+    def topology(self, message: dict):
+        self.graph.applyTopologyChanges(message['changes'])
+        self.owned = set(np.flatnonzero(message['assignment'] == self.shard).tolist())
+
+    def synchronize(self, state: dict):
+        graph = self.graph
+        graph.store.writeRows('emotions', state['ids'], state['emotions'])
+        graph.store.writeRows('personalities', state['ids'], state['personalities'])
+        pairs = set(zip(state['sources'].tolist(), state['targets'].tolist()))
+        for sourceId, targetId in [pair for pair in graph._edges if pair not in pairs]:
+            graph.removeEdgeById(sourceId, targetId)
+        for sourceId, targetId, values, distance in zip(state['sources'].tolist(), state['targets'].tolist(),
+                                                        state['relationships'], state['distances'].tolist()):
+            relationship = graph.getEdgeById(sourceId, targetId)
+            if relationship is None:
+                graph.addEdgeById(sourceId, targetId, TypeRelationship(*values), distance)
+            else:
+                relationship.typeRelationship.setArray(values)
+                relationship.informational_distance = distance
+
+
+def _runShard(connection, payload: bytes, shard: int, owned: np.ndarray, seed):
+    """Boucle d'un processus de shard : exécute les commandes reçues du coordinateur."""
+    graph, config = pickle.loads(payload)
+    state = _Shard(graph, config, shard, owned, seed)
+    while True:
+        command, argument = connection.recv()
+        if command == 'stop':
+            break
+        connection.send(getattr(state, command)(argument))
+    connection.close()
@@ -0,0 +1,181 @@
+import heapq
+import math
+
+
+class SpatialIndex:
+    """
+    Index spatial des characters positionnés : grille uniforme de cellules cubiques.
+
+    Les positions 2D sont traitées comme des positions 3D avec z = 0. Chaque requête ne parcourt
+    que les cellules proches du centre (bornées par l'étendue des cellules occupées), soit un
+    coût proportionnel au nombre de characters voisins et non au nombre total de characters.
+    """
+
+    def __init__(self, cellSize: float = 10.0):
+        self.cellSize = float(cellSize)
+        # Cellule (entiers i, j, k) -> {id: position} (ordre d'insertion conservé)
+        self._cells = {}
+        # id -> cellule courante
+        self._cellOf = {}
+        # Étendue des cellules occupées (min, max) par axe, None si l'index est vide
+        self._low = None
+        self._high = None
+
+    def __len__(self):
+        return len(self._cellOf)
+
+    def __contains__(self, nodeId):
+        return nodeId in self._cellOf
+
+    @staticmethod
+    def toPoint(position) -> tuple:
+        """Convertit une position 2D ou 3D en triplet de floats."""
+        point = tuple(float(value) for value in position)
+        return point + (0.0,) * (3 - len(point))
+
+    def _cell(self, point: tuple) -> tuple:
+        size = self.cellSize
+        return (math.floor(point[0] / size), math.floor(point[1] / size), math.floor(point[2] / size))
+
+    # === Mise à jour ===
+
+    def insert(self, nodeId: int, position):
+        """Ajoute ou déplace un character."""
+        point = self.toPoint(position)
+        cell = self._cell(point)
+        oldCell = self._cellOf.get(nodeId)
+        if oldCell is not None and oldCell != cell:
+            self._discard(nodeId, oldCell)
+        self._cells.setdefault(cell, {})[nodeId] = point
+        self._cellOf[nodeId] = cell
+
+        if self._low is None:
+            self._low = list(cell)
+            self._high = list(cell)
+        else:
+            for axis in range(3):
+                self._low[axis] = min(self._low[axis], cell[axis])
+                self._high[axis] = max(self._high[axis], cell[axis])
+
+    def move(self, nodeId: int, position):
+        self.insert(nodeId, position)
+
+    def remove(self, nodeId: int):
+        cell = self._cellOf.pop(nodeId, None)
+        if cell is not None:
+            self._discard(nodeId, cell)
+            if not self._cellOf:
+                self._low = None
+                self._high = None
+
+    def _discard(self, nodeId: int, cell: tuple):
+        members = self._cells[cell]
+        del members[nodeId]
+        if not members:
+            del self._cells[cell]
+
+    def position(self, nodeId: int):
+        """Position indexée d'un character (None s'il n'est pas positionné)."""
+        cell = self._cellOf.get(nodeId)
+        if cell is None:
+            return None
+        return self._cells[cell][nodeId]
+
+    # === Requêtes ===
+
+    def queryRadius(self, center, radius: float) -> list:
+        """
+        Ids des characters à une distance <= radius de center, du plus proche au plus lointain.
+
+        Args:
+            center: position 2D ou 3D
+            radius: rayon de recherche
+        """
+        if self._low is None or radius < 0:
+            return []
+        point = self.toPoint(center)
+        low = self._cell(tuple(value - radius for value in point))
+        high = self._cell(tuple(value + radius for value in point))
+        low = [max(low[axis], self._low[axis]) for axis in range(3)]
+        high = [min(high[axis], self._high[axis]) for axis in range(3)]
+
+        found = []
+        squaredRadius = radius * radius
+        for cell in self._cellsInBox(low, high):
+            for nodeId, other in self._cells.get(cell, {}).items():
+                squared = self._squaredDistance(point, other)
+                if squared <= squaredRadius:
+                    found.append((squared, nodeId))
+        found.sort()
+        return [nodeId for _, nodeId in found]
+
+    def queryNearest(self, center, k: int, exclude=None) -> list:
+        """
+        Ids des k characters les plus proches de center, du plus proche au plus lointain.
+
+        Les cellules sont parcourues par anneaux concentriques ; la recherche s'arrête dès que
+        l'anneau suivant ne peut plus contenir de character plus proche que le k-ième trouvé.
+
+        Args:
+            center: position 2D ou 3D
+            k: nombre de voisins voulus
+            exclude: id à ignorer (typiquement le character au centre)
+        """
+        if self._low is None or k <= 0:
+            return []
+        point = self.toPoint(center)
+        origin = self._cell(point)
+        total = len(self._cellOf) - (1 if exclude in self._cellOf else 0)
+        k = min(k, total)
+        if k <= 0:
+            return []
+
+        # Anneau maximal utile : au-delà, plus aucune cellule occupée
+        maxRing = max(max(abs(origin[axis] - self._low[axis]), abs(self._high[axis] - origin[axis]))
+                      for axis in range(3))
+
+        best = []  # tas max (distance négative) des k plus proches
+        seen = 0
+        for ring in range(maxRing + 1):
+            for cell in self._ring(origin, ring):
+                for nodeId, other in self._cells.get(cell, {}).items():
+                    if nodeId == exclude:
+                        continue
+                    seen += 1
+                    squared = self._squaredDistance(point, other)
+                    if len(best) < k:
+                        heapq.heappush(best, (-squared, -nodeId))
+                    elif squared < -best[0][0]:
+                        heapq.heapreplace(best, (-squared, -nodeId))
+            # Tout character hors des anneaux parcourus est à plus de ring × cellSize du centre
+            if len(best) == k and (seen == total or -best[0][0] <= (ring * self.cellSize) ** 2):
+                break
+
+        return [-nodeId for _, nodeId in sorted(best, reverse=True)]
+
+    def _ring(self, origin: tuple, ring: int):
+        """Cellules à distance de Tchebychev exactement ring de origin (bornées à l'étendue occupée)."""
+        low = [max(origin[axis] - ring, self._low[axis]) for axis in range(3)]
+        high = [min(origin[axis] + ring, self._high[axis]) for axis in range(3)]
+        for cell in self._cellsInBox(low, high):
+            if max(abs(cell[axis] - origin[axis]) for axis in range(3)) == ring:
+                yield cell
+
+    def _cellsInBox(self, low, high):
+        # Peu de cellules occupées par rapport à la boîte : on parcourt directement les cellules occupées
+        volume = 1
+        for axis in range(3):
+            volume *= max(0, high[axis] - low[axis] + 1)
+        if volume > len(self._cells):
+            for cell in list(self._cells):
+                if all(low[axis] <= cell[axis] <= high[axis] for axis in range(3)):
+                    yield cell
+            return
+        for i in range(low[0], high[0] + 1):
+            for j in range(low[1], high[1] + 1):
+                for k in range(low[2], high[2] + 1):
+                    yield (i, j, k)
+
+    @staticmethod
+    def _squaredDistance(a: tuple, b: tuple) -> float:
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
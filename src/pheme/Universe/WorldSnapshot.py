@@ -0,0 +1,86 @@
+import numpy as np
+
+from ..Characters.Character import Character
+from ..Relationships.Relationship import Relationship
+
+
+class WorldSnapshot:
+    """
+    Instantané en lecture seule du monde (characters, émotions, relations) à un tick donné.
+
+    Obtenu par Graph.snapshot() en O(1) : il partage les tables du WorldStore, qui ne sont
+    dupliquées que si le monde est modifié ensuite. Les Character et Relationship renvoyés sont
+    des vues sur l'instantané ; toute tentative d'écriture échoue. Les relations sont listées
+    dans l'ordre de leurs lignes. Les connaissances (knownInteractions) ne font pas partie de
+    l'instantané : ses characters n'en ont aucune.
+    """
+
+    def __init__(self, store, tick=None):
+        """
+        Args:
+            store: WorldStore figé (WorldStore.snapshot())
+            tick: tick auquel l'instantané a été pris (informatif)
+        """
+        self.store = store
+        self.tick = tick
+        self._characters = None
+        self._edges = None
+
+    # === Characters ===
+
+    @property
+    def listNode(self) -> list:
+        return list(self._characterIndex().values())
+
+    def _characterIndex(self) -> dict:
+        if self._characters is None:
+            self._characters = {nodeId: Character._view(self.store, nodeId) for nodeId in self.store.nodeRows().tolist()}
+        return self._characters
+
+    def getNode(self, name):
+        nodeId = self.store.nodeIds.get(name)
+        if nodeId is None:
+            return None
+        return self._characterIndex().get(nodeId)
+
+    def getNodeById(self, nodeId: int):
+        return self._characterIndex().get(nodeId)
+
+    def getNodeNames(self):
+        return [character.name for character in self._characterIndex().values()]
+
+    # === Relations ===
+
+    @property
+    def listEdge(self) -> list:
+        return list(self._edgeIndex().values())
+
+    def _edgeIndex(self) -> dict:
+        if self._edges is None:
+            store = self.store
+            rows = store.edgeRows()
+            sternberg = store.relationships[rows]
+            intensities = (np.abs(sternberg).sum(axis=1) / 3.0).tolist()
+            confidences = Relationship.newConfidences(sternberg).tolist()
+            self._edges = {}
+            for row, intensity, confidence in zip(rows.tolist(), intensities, confidences):
+                relationship = Relationship._view(store, row, intensity, confidence)
+                self._edges[(relationship.sourceId, relationship.targetId)] = relationship
+        return self._edges
+
+    def getEdge(self, source, target):
+        nodeIds = self.store.nodeIds
+        return self._edgeIndex().get((nodeIds.get(source), nodeIds.get(target)))
+
+    def getEdgeById(self, sourceId: int, targetId: int):
+        return self._edgeIndex().get((sourceId, targetId))
+
+    def getNeighbors(self, character) -> list:
+        """Characters vers lesquels character avait une relation sortante."""
+        indptr, targets, _ = self.store.outAdjacency()
+        return [self._characterIndex()[nodeId] for nodeId in targets[indptr[character.id]:indptr[character.id + 1]].tolist()]
+
+    def getInNeighbors(self, character) -> list:
+        """Characters qui avaient une relation vers character."""
+        indptr, sources, _ = self.store.inAdjacency()
+        return [self._characterIndex()[nodeId] for nodeId in sources[indptr[character.id]:indptr[character.id + 1]].tolist()]
@@ -0,0 +1,608 @@
+import copy
+
+import numpy as np
+
+from .ChangeSet import ChangeSet
+from ..Interactions.InteractionRegistry import InteractionRegistry
+
+
+class WorldStore:
+    """
+    Stockage colonne de l'état du monde.
+
+    Une ligne par character (personnalité N×5, émotions N×6) et une ligne par relation
+    (Sternberg E×3, source, cible, distance informationnelle). Les objets Character, Personality,
+    Emotions, Relationship et TypeRelationship rattachés au store sont des vues sur ces lignes.
+    Les lignes libérées sont réutilisées ; les masques nodeAlive/edgeAlive indiquent les lignes occupées.
+
+    Les characters peuvent avoir une position (positions N×3, hasPosition) ; si un SpatialIndex
+    est branché (spatialIndex), il est tenu à jour à chaque écriture de position. De même, un
+    ArrivalIndex branché (arrivalIndex) est prévenu des changements de distance informationnelle,
+    un MemoryExpiry branché (memoryExpiry) des interactions apprises par les characters, un
+    PersonalityModulation branché (personalityModulation) de toute écriture de personnalité et un
+    RelationshipAggregates branché (relationshipAggregates) de toute relation allouée, libérée ou
+    modifiée.
+
+    Les interactions connues des characters sont numérotées dans le registre du store (interactions).
+
+    La ligne d'un character est son identifiant entier (id). La table d'interning nodeNames/nodeIds
+    associe id et nom : renommer un character ne touche qu'à cette table. Un nom référencé par une
+    relation avant d'être ajouté au graph reçoit un id réservé (ligne non vivante).
+
+    snapshot() fige l'état courant en O(1) par copie sur écriture : les tables sont partagées
+    avec l'instantané et le store ne duplique une table qu'au moment de la modifier.
+    """
+
+    PERSONALITY_SIZE = 5
+    EMOTIONS_SIZE = 6
+    RELATIONSHIP_SIZE = 3
+    POSITION_SIZE = 3
+
+    NODE_TABLES = ('personalities', 'emotions', 'nodeAlive', 'positions', 'hasPosition')
+    EDGE_TABLES = ('relationships', 'edgeSource', 'edgeTarget', 'informationalDistances', 'edgeAlive')
+
+    def __init__(self, nodeCapacity: int = 16, edgeCapacity: int = 16):
+        nodeCapacity = max(1, nodeCapacity)
+        edgeCapacity = max(1, edgeCapacity)
+
+        self.personalities = np.zeros((nodeCapacity, self.PERSONALITY_SIZE))
+        self.emotions = np.zeros((nodeCapacity, self.EMOTIONS_SIZE))
+        self.nodeAlive = np.zeros(nodeCapacity, dtype=bool)
+        self.positions = np.zeros((nodeCapacity, self.POSITION_SIZE))
+        self.hasPosition = np.zeros(nodeCapacity, dtype=bool)
+
+        self.relationships = np.zeros((edgeCapacity, self.RELATIONSHIP_SIZE))
+        self.edgeSource = np.full(edgeCapacity, -1, dtype=np.int64)
+        self.edgeTarget = np.full(edgeCapacity, -1, dtype=np.int64)
+        self.informationalDistances = np.ones(edgeCapacity, dtype=np.int64)
+        self.edgeAlive = np.zeros(edgeCapacity, dtype=bool)
+
+        # Interning : id -> nom (None si ligne libre) et nom -> id
+        self.nodeNames = []
+        self.nodeIds = {}
+
+        # Lignes utilisées au moins une fois et lignes libérées réutilisables
+        self.nodeCount = 0
+        self.edgeCount = 0
+        self._freeNodes = []
+        self._freeEdges = []
+
+        self._outAdjacency = None
+        self._inAdjacency = None
+
+        # Registre des interactions connues des characters (ids de leurs connaissances)
+        self.interactions = InteractionRegistry(self)
+
+        # Index spatial optionnel, tenu à jour par setPosition/setPositions
+        self.spatialIndex = None
+        # Index des délais d'arrivée optionnel, prévenu par setInformationalDistance
+        self.arrivalIndex = None
+        # Oubli des interactions optionnel, prévenu par Character.learnAboutInteraction
+        self.memoryExpiry = None
+        # Cache des modulations par la personnalité optionnel, prévenu des écritures de personnalités
+        self.personalityModulation = None
+        # Moyennes des relations par character optionnelles, tenues à jour à chaque écriture de relation
+        self.relationshipAggregates = None
+
+        # Tables partagées avec un instantané (copiées à la prochaine écriture)
+        self._shared = set()
+
+        # Journal des modifications {table: {ligne: valeur avant modification}}, None si désactivé
+        self._changeLog = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_changeLog'] = None
+        state['arrivalIndex'] = None
+        state['memoryExpiry'] = None
+        state['personalityModulation'] = None
+        state['relationshipAggregates'] = None
+        return state
+
+    # === Allocation des lignes ===
+
+    def internNode(self, name) -> int:
+        """Id associé à un nom (un id réservé, non vivant, est créé si le nom est inconnu)."""
+        nodeId = self.nodeIds.get(name)
+        if nodeId is None:
+            self._writableNames()
+            if self._freeNodes:
+                nodeId = self._freeNodes.pop()
+            else:
+                if self.nodeCount == len(self.nodeAlive):
+                    self._growNodes(2 * self.nodeCount)
+                nodeId = self.nodeCount
+                self.nodeCount += 1
+                self.nodeNames.append(None)
+            self._recordName(nodeId)
+            self.nodeNames[nodeId] = name
+            self.nodeIds[name] = nodeId
+        return nodeId
+
+    def allocateNode(self, name) -> int:
+        """Id (vivant) du character nommé name."""
+        nodeId = self.internNode(name)
+        self.write('nodeAlive', nodeId, True)
+        self.invalidateAdjacency()
+        return nodeId
+
+    def allocateNodes(self, names) -> np.ndarray:
+        """Ids (vivants) de plusieurs characters, en une seule croissance des tables."""
+        names = list(names)
+        needed = self.nodeCount + len(names) - len(self._freeNodes)
+        if needed > len(self.nodeAlive):
+            self._growNodes(max(2 * len(self.nodeAlive), needed))
+        ids = np.fromiter((self.internNode(name) for name in names), dtype=np.int64, count=len(names))
+        self.writeRows('nodeAlive', ids, True)
+        self.invalidateAdjacency()
+        return ids
+
+    def releaseNode(self, nodeId: int):
+        """Libère l'id et le nom d'un character (ou d'un id réservé)."""
+        self.write('nodeAlive', nodeId, False)
+        self.write('personalities', nodeId, 0.0)
+        self.write('emotions', nodeId, 0.0)
+        self.setPosition(nodeId, None)
+        self._writableNames()
+        self._recordName(nodeId)
+        del self.nodeIds[self.nodeNames[nodeId]]
+        self.nodeNames[nodeId] = None
+        self._freeNodes.append(nodeId)
+        self.interactions.log.forgetCharacter(nodeId)
+        self.invalidateAdjacency()
+
+    def renameNodes(self, mapping: dict):
+        """Renomme des characters ({id: nouveau nom}) en O(1) par character."""
+        self._writableNames()
+        for nodeId in mapping:
+            self._recordName(nodeId)
+            del self.nodeIds[self.nodeNames[nodeId]]
+        for nodeId, name in mapping.items():
+            self.nodeNames[nodeId] = name
+            self.nodeIds[name] = nodeId
+
+    def allocateEdge(self, sourceRow: int, targetRow: int, informational_distance: int = 1) -> int:
+        if self._freeEdges:
+            row = self._freeEdges.pop()
+        else:
+            if self.edgeCount == len(self.edgeAlive):
+                self._growEdges(2 * self.edgeCount)
+            row = self.edgeCount
+            self.edgeCount += 1
+        self.write('edgeAlive', row, True)
+        self.write('edgeSource', row, sourceRow)
+        self.write('edgeTarget', row, targetRow)
+        self.write('informationalDistances', row, informational_distance)
+        if self.relationshipAggregates is not None:
+            self.relationshipAggregates.edgesAdded(row)
+        self.invalidateAdjacency()
+        return row
+
+    def setInformationalDistance(self, row: int, informational_distance: int):
+        """Distance informationnelle d'une relation (l'ArrivalIndex branché est prévenu)."""
+        old = int(self.informationalDistances[row])
+        self.write('informationalDistances', row, informational_distance)
+        if self.arrivalIndex is not None and old != informational_distance and self.edgeAlive[row]:
+            self.arrivalIndex.edgeDistanceChanged(int(self.edgeSource[row]), int(self.edgeTarget[row]),
+                                                  old, informational_distance)
+
+    def releaseEdge(self, row: int):
+        if self.relationshipAggregates is not None:
+            self.relationshipAggregates.edgesRemoved(row)
+        self.write('edgeAlive', row, False)
+        self.write('edgeSource', row, -1)
+        self.write('edgeTarget', row, -1)
+        self.write('relationships', row, 0.0)
+        self._freeEdges.append(row)
+        self.invalidateAdjacency()
+
+    def allocateEdges(self, sourceRows: np.ndarray, targetRows: np.ndarray,
+                      informational_distances: np.ndarray) -> np.ndarray:
+        """Alloue une ligne de relation par couple (source, cible) d'un coup."""
+        count = len(sourceRows)
+        reused = [self._freeEdges.pop() for _ in range(min(count, len(self._freeEdges)))]
+        fresh = count - len(reused)
+        if self.edgeCount + fresh > len(self.edgeAlive):
+            self._growEdges(max(2 * len(self.edgeAlive), self.edgeCount + fresh))
+        rows = np.concatenate([np.array(reused, dtype=np.int64),
+                               np.arange(self.edgeCount, self.edgeCount + fresh, dtype=np.int64)])
+        self.edgeCount += fresh
+        self.writeRows('edgeAlive', rows, True)
+        self.writeRows('edgeSource', rows, sourceRows)
+        self.writeRows('edgeTarget', rows, targetRows)
+        self.writeRows('informationalDistances', rows, informational_distances)
+        if self.relationshipAggregates is not None:
+            self.relationshipAggregates.edgesAdded(rows)
+        self.invalidateAdjacency()
+        return rows
+
+    def _growNodes(self, capacity: int):
+        # Les tables agrandies sont des copies : plus rien à partager avec les instantanés
+        self._shared.difference_update(self.NODE_TABLES)
+        self.personalities = self._grow(self.personalities, capacity)
+        self.emotions = self._grow(self.emotions, capacity)
+        self.nodeAlive = self._grow(self.nodeAlive, capacity)
+        self.positions = self._grow(self.positions, capacity)
+        self.hasPosition = self._grow(self.hasPosition, capacity)
+
+    def _growEdges(self, capacity: int):
+        self._shared.difference_update(self.EDGE_TABLES)
+        self.relationships = self._grow(self.relationships, capacity)
+        self.edgeSource = self._grow(self.edgeSource, capacity, fill=-1)
+        self.edgeTarget = self._grow(self.edgeTarget, capacity, fill=-1)
+        self.informationalDistances = self._grow(self.informationalDistances, capacity, fill=1)
+        self.edgeAlive = self._grow(self.edgeAlive, capacity)
+
+    @staticmethod
+    def _grow(array: np.ndarray, capacity: int, fill=0) -> np.ndarray:
+        grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    # === Écritures ===
+
+    # Toute écriture passe par ces méthodes : une table partagée avec un instantané est d'abord copiée.
+
+    def write(self, table: str, row: int, values):
+        """Écrit une ligne complète d'une table ('personalities', 'emotions', 'relationships', ...)."""
+        if self._changeLog is not None:
+            self._recordRow(table, row)
+        if table == 'personalities' and self.personalityModulation is not None:
+            self.personalityModulation.invalidate(row)
+        if table == 'relationships' and self.relationshipAggregates is not None:
+            old = self.relationships[row].tolist()
+            self._writable(table)[row] = values
+            self.relationshipAggregates.valueChanged(row, old)
+            return
+        self._writable(table)[row] = values
+
+    def writeRows(self, table: str, rows: np.ndarray, values):
+        """Écrit plusieurs lignes d'une table en une opération."""
+        if self._changeLog is not None:
+            for row in np.asarray(rows).reshape(-1).tolist():
+                self._recordRow(table, row)
+        if table == 'personalities' and self.personalityModulation is not None:
+            self.personalityModulation.invalidate(rows)
+        if table == 'relationships' and self.relationshipAggregates is not None:
+            old = self.relationships[rows]
+            self._writable(table)[rows] = values
+            self.relationshipAggregates.valuesChanged(rows, old)
+            return
+        self._writable(table)[rows] = values
+
+    def writeField(self, table: str, row: int, column: int, value: float):
+        """Écrit une seule colonne d'une ligne."""
+        if self._changeLog is not None:
+            self._recordRow(table, row)
+        if table == 'personalities' and self.personalityModulation is not None:
+            self.personalityModulation.invalidate(row)
+        if table == 'relationships' and self.relationshipAggregates is not None:
+            old = self.relationships[row].tolist()
+            self._writable(table)[row, column] = value
+            self.relationshipAggregates.valueChanged(row, old)
+            return
+        self._writable(table)[row, column] = value
+
+    def _writable(self, table: str) -> np.ndarray:
+        if table in self._shared:
+            self._shared.discard(table)
+            setattr(self, table, getattr(self, table).copy())
+        return getattr(self, table)
+
+    def _writableNames(self):
+        if 'nodeNames' in self._shared:
+            self._shared.discard('nodeNames')
+            self.nodeNames = list(self.nodeNames)
+            self.nodeIds = dict(self.nodeIds)
+
+    # === Suivi des modifications ===
+
+    def enableChangeTracking(self):
+        """Commence à enregistrer les lignes modifiées (et leur valeur d'avant) à chaque écriture."""
+        if self._changeLog is None:
+            self._changeLog = {table: {} for table in self.NODE_TABLES + self.EDGE_TABLES + ('nodeNames',)}
+
+    def disableChangeTracking(self):
+        self._changeLog = None
+
+    def _recordRow(self, table: str, row: int):
+        log = self._changeLog[table]
+        if row not in log:
+            value = getattr(self, table)[row]
+            log[row] = value.copy() if isinstance(value, np.ndarray) else value.item()
+
+    def _recordName(self, nodeId: int):
+        if self._changeLog is not None:
+            log = self._changeLog['nodeNames']
+            if nodeId not in log:
+                log[nodeId] = self.nodeNames[nodeId]
+
+    def collectChanges(self, tick=None) -> ChangeSet:
+        """Modifications enregistrées depuis le dernier appel (le journal est ensuite vidé)."""
+        changes = ChangeSet(tick)
+        if self._changeLog is None:
+            return changes
+        log = self._changeLog
+        self._changeLog = {table: {} for table in log}
+        self._collectNodes(changes, log)
+        self._collectEdges(changes, log)
+        return changes
+
+    def _old(self, log: dict, table: str, row: int):
+        if row in log[table]:
+            return log[table][row]
+        value = getattr(self, table)[row]
+        return value.copy() if isinstance(value, np.ndarray) else value.item()
+
+    def _position(self, hasPosition, position):
+        return tuple(position.tolist()) if hasPosition else None
+
+    def _collectNodes(self, changes: ChangeSet, log: dict):
+        ids = set()
+        for table in self.NODE_TABLES + ('nodeNames',):
+            ids.update(log[table])
+        for nodeId in sorted(ids):
+            wasAlive = bool(self._old(log, 'nodeAlive', nodeId))
+            isAlive = bool(self.nodeAlive[nodeId])
+            oldName = log['nodeNames'].get(nodeId, self.nodeNames[nodeId])
+            if wasAlive and not isAlive:
+                changes.removedNodes.append(nodeId)
+                changes.names[nodeId] = oldName
+                continue
+            if not isAlive:
+                continue
+            name = self.nodeNames[nodeId]
+            old = {
+                'emotions': self._old(log, 'emotions', nodeId),
+                'personality': self._old(log, 'personalities', nodeId),
+                'position': self._position(self._old(log, 'hasPosition', nodeId), self._old(log, 'positions', nodeId)),
+            }
+            new = {
+                'emotions': self.emotions[nodeId].copy(),
+                'personality': self.personalities[nodeId].copy(),
+                'position': self._position(self.hasPosition[nodeId], self.positions[nodeId]),
+            }
+            if not wasAlive:
+                changes.addedNodes.append(nodeId)
+                changes.nodes[nodeId] = {field: (None, value) for field, value in new.items()}
+            else:
+                fields = {field: (old[field], new[field]) for field in new if not _same(old[field], new[field])}
+                if fields:
+                    changes.nodes[nodeId] = fields
+                if oldName != name:
+                    changes.renamedNodes[nodeId] = (oldName, name)
+            changes.names[nodeId] = name
+
+    def _collectEdges(self, changes: ChangeSet, log: dict):
+        rows = set()
+        for table in self.EDGE_TABLES:
+            rows.update(log[table])
+        removed = {}
+        added = {}
+        for row in sorted(rows):
+            wasAlive = bool(self._old(log, 'edgeAlive', row))
+            isAlive = bool(self.edgeAlive[row])
+            oldPair = (self._old(log, 'edgeSource', row), self._old(log, 'edgeTarget', row))
+            newPair = (int(self.edgeSource[row]), int(self.edgeTarget[row]))
+            old = {'relationship': self._old(log, 'relationships', row),
+                   'informational_distance': self._old(log, 'informationalDistances', row)}
+            new = {'relationship': self.relationships[row].copy(),
+                   'informational_distance': int(self.informationalDistances[row])}
+            if wasAlive and isAlive and oldPair == newPair:
+                fields = {field: (old[field], new[field]) for field in new if not _same(old[field], new[field])}
+                if fields:
+                    changes.edges[newPair] = fields
+                continue
+            if wasAlive:
+                removed[oldPair] = old
+            if isAlive:
+                added[newPair] = new
+
+        # Une relation supprimée puis recréée dans la même période est une modification
+        for pair, new in added.items():
+            old = removed.pop(pair, None)
+            if old is None:
+                changes.addedEdges.append(pair)
+                changes.edges[pair] = {field: (None, value) for field, value in new.items()}
+            else:
+                fields = {field: (old[field], new[field]) for field in new if not _same(old[field], new[field])}
+                if fields:
+                    changes.edges[pair] = fields
+        changes.removedEdges.extend(removed)
+
+        for sourceId, targetId in list(changes.edges) + changes.removedEdges:
+            for nodeId in (sourceId, targetId):
+                if nodeId not in changes.names:
+                    changes.names[nodeId] = self.nodeNames[nodeId] if nodeId < len(self.nodeNames) else None
+
+    # === Instantanés ===
+
+    def snapshot(self) -> 'WorldStore':
+        """
+        Copie figée du store en O(1) : les tables sont partagées (vues en lecture seule) et
+        ne seront dupliquées, table par table, qu'à la prochaine écriture du store.
+        """
+        frozen = WorldStore.__new__(WorldStore)
+        frozen.__dict__.update(self.__dict__)
+        for table in self.NODE_TABLES + self.EDGE_TABLES:
+            view = getattr(self, table).view()
+            view.flags.writeable = False
+            setattr(frozen, table, view)
+        frozen._freeNodes = ()
+        frozen._freeEdges = ()
+        frozen._shared = set()
+        frozen.interactions = InteractionRegistry(frozen)
+        frozen.spatialIndex = None
+        frozen.arrivalIndex = None
+        frozen.memoryExpiry = None
+        frozen.personalityModulation = None
+        frozen.relationshipAggregates = None
+        frozen._changeLog = None
+        self._shared.update(self.NODE_TABLES + self.EDGE_TABLES + ('nodeNames',))
+        return frozen
+
+    def setPosition(self, nodeId: int, position):
+        """Position 2D ou 3D d'un character (None pour le retirer de l'espace)."""
+        if position is None:
+            if self.hasPosition[nodeId]:
+                self.write('hasPosition', nodeId, False)
+                self.write('positions', nodeId, 0.0)
+                if self.spatialIndex is not None:
+                    self.spatialIndex.remove(nodeId)
+            return
+        values = np.zeros(self.POSITION_SIZE)
+        position = np.asarray(position, dtype=float)
+        values[:len(position)] = position
+        self.write('positions', nodeId, values)
+        self.write('hasPosition', nodeId, True)
+        if self.spatialIndex is not None:
+            self.spatialIndex.insert(nodeId, values)
+
+    def setPositions(self, ids: np.ndarray, positions):
+        """Positions (N×2 ou N×3) de plusieurs characters en une écriture."""
+        positions = np.asarray(positions, dtype=float).reshape(len(ids), -1)
+        values = np.zeros((len(ids), self.POSITION_SIZE))
+        values[:, :positions.shape[1]] = positions
+        self.writeRows('positions', ids, values)
+        self.writeRows('hasPosition', ids, True)
+        if self.spatialIndex is not None:
+            for nodeId, point in zip(ids.tolist(), values.tolist()):
+                self.spatialIndex.insert(nodeId, point)
+
+    def getPosition(self, nodeId: int):
+        """Copie de la position d'un character (None s'il n'en a pas)."""
+        if not self.hasPosition[nodeId]:
+            return None
+        return self.positions[nodeId].copy()
+
+    # === Requêtes globales ===
+
+    def nodeRows(self) -> np.ndarray:
+        """Indices des lignes de characters occupées."""
+        return np.flatnonzero(self.nodeAlive[:self.nodeCount])
+
+    def edgeRows(self) -> np.ndarray:
+        """Indices des lignes de relations occupées."""
+        return np.flatnonzero(self.edgeAlive[:self.edgeCount])
+
+    def invalidateAdjacency(self):
+        self._outAdjacency = None
+        self._inAdjacency = None
+
+    def outAdjacency(self):
+        """
+        Adjacence sortante au format CSR : (indptr, voisins, relations).
+        Les relations sortantes de la ligne i sont relations[indptr[i]:indptr[i + 1]].
+        """
+        if self._outAdjacency is None:
+            self._outAdjacency = self._buildAdjacency(self.edgeSource, self.edgeTarget)
+        return self._outAdjacency
+
+    def inAdjacency(self):
+        """Adjacence entrante au format CSR : (indptr, sources, relations)."""
+        if self._inAdjacency is None:
+            self._inAdjacency = self._buildAdjacency(self.edgeTarget, self.edgeSource)
+        return self._inAdjacency
+
+    def _buildAdjacency(self, keys: np.ndarray, others: np.ndarray):
+        rows = self.edgeRows()
+        rows = rows[self.nodeAlive[self.edgeSource[rows]] & self.nodeAlive[self.edgeTarget[rows]]]
+        order = np.argsort(keys[rows], kind='stable')
+        edges = rows[order]
+        counts = np.bincount(keys[edges], minlength=self.nodeCount)
+        indptr = np.zeros(self.nodeCount + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return indptr, others[edges], edges
+
+
+def _same(old, new) -> bool:
+    if isinstance(old, np.ndarray):
+        return np.array_equal(old, new)
+    return old == new
+
+
+class StoreView:
+    """
+    Base des objets dont les valeurs sont un vecteur numpy : un tableau propre tant que l'objet
+    est isolé, une ligne d'une table du WorldStore une fois rattaché au monde.
+    """
+
+    _table = None
+
+    def _initValues(self, values):
+        self._store = None
+        self._row = None
+        self._values = np.array(values, dtype=float)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Vue (sans copie) sur les valeurs courantes."""
+        if self._store is not None:
+            return getattr(self._store, self._table)[self._row]
+        return self._values
+
+    def asArray(self) -> np.ndarray:
+        """Copie des valeurs courantes."""
+        return self.values.copy()
+
+    def setArray(self, values):
+        """Remplace toutes les valeurs (sans clamp)."""
+        if self._store is not None:
+            self._store.write(self._table, self._row, values)
+        else:
+            self._values[:] = values
+
+    def _setField(self, column: int, value: float):
+        if self._store is not None:
+            self._store.writeField(self._table, self._row, column, value)
+        else:
+            self._values[column] = value
+
+    @classmethod
+    def _view(cls, store: WorldStore, row: int):
+        """Crée directement une vue sur une ligne déjà remplie du store (sans validation ni copie)."""
+        view = cls.__new__(cls)
+        view._store = store
+        view._row = row
+        view._values = None
+        return view
+
+    def detached(self):
+        """Copie isolée (non rattachée au store) de l'objet."""
+        clone = copy.copy(self)
+        clone._values = self.values.copy()
+        clone._store = None
+        clone._row = None
+        return clone
+
+    def _bind(self, store: WorldStore, row: int):
+        """Rattache l'objet à une ligne du store (les valeurs courantes y sont copiées)."""
+        store.write(self._table, row, self.values)
+        self._store = store
+        self._row = row
+        self._values = None
+
+    def _unbind(self):
+        """Détache l'objet du store en conservant une copie de ses valeurs."""
+        if self._store is not None:
+            self._values = self.values.copy()
+            self._store = None
+            self._row = None
+
+    def _isBound(self) -> bool:
+        return self._store is not None
+
+
+class StoreField:
+    """Attribut float lu et écrit dans la colonne `column` du vecteur d'un StoreView."""
+
+    def __init__(self, column: int):
+        self.column = column
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return float(instance.values[self.column])
+
+    def __set__(self, instance, value):
+        instance._setField(self.column, value)
@@ -0,0 +1,99 @@
+import contextlib
+import io
+
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Universe.EventSink import EventSink, setEventSink, printEvent
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+
+
+def build_graph():
+    graph = Graph()
+    for name in ["Alice", "Bob", "Charlie"]:
+        graph.addNode(name, Personality(), Emotions(happiness=0.5, sadness=0.5))
+    graph.addEdge("Charlie", "Alice", TypeRelationship(0.3, 0.2, 0.1))
+    return graph
+
+
+def test_silencieux():
+    """Test : sans récepteur, aucune sortie console et émotions mises à jour en place"""
+    print("=" * 50)
+    print("TEST 1: Moteur silencieux")
+    print("=" * 50)
+
+    setEventSink(None)
+    graph = build_graph()
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    emotions = bob.emotions
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        engine = InteractionsEngine(graph)
+        engine.processInteractionForAll(Interactions.helped(alice, bob, 0.0))
+        bob.changePersonality(Personality(0.1, 0.2, 0.3, 0.4, 0.5))
+    assert output.getvalue() == ""
+    assert bob.emotions is emotions and bob.emotions.happiness > 0.5
+    print("Moteur silencieux OK")
+
+    print()
+
+
+def test_recepteur():
+    """Test des événements structurés, des niveaux et de l'échantillonnage"""
+    print("=" * 50)
+    print("TEST 2: Récepteur d'événements")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    engine = InteractionsEngine(graph)
+
+    sink = EventSink()
+    setEventSink(sink)
+    try:
+        before = bob.emotions.values.copy()
+        engine.processInteractionForAll(Interactions.insulted(alice, bob, 0.0))
+        kinds = [event['kind'] for event in sink.events]
+        assert kinds.count('emotions') == 3
+        event = next(event for event in sink.events if event.get('character') == "Bob")
+        assert np.array_equal(event['before'], before) and np.array_equal(event['after'], bob.emotions.values)
+        # Observateurs traités en bloc : un seul événement groupé
+        grouped = [event for event in sink.events if 'ids' in event]
+        assert len(grouped) == 1 and grouped[0]['ids'].tolist() == [graph.getNode("Charlie").id]
+
+        bob.changePersonality(Personality(0.1, 0.2, 0.3, 0.4, 0.5))
+        assert sink.events[-1]['kind'] == 'personality'
+
+        # Niveau et échantillonnage
+        warnings = EventSink(level=EventSink.WARNING)
+        setEventSink(warnings)
+        bob.changeEmotions(Emotions(happiness=0.1))
+        assert len(warnings.events) == 0
+        muted = EventSink(sampling=0.0)
+        setEventSink(muted)
+        bob.changeEmotions(Emotions(happiness=0.2))
+        assert len(muted.events) == 0
+
+        output = io.StringIO()
+        setEventSink(EventSink(handler=printEvent))
+        with contextlib.redirect_stdout(output):
+            bob.changeEmotions(Emotions(happiness=0.3))
+        assert output.getvalue().startswith("[emotions] character=Bob")
+    finally:
+        setEventSink(None)
+    print("Récepteur d'événements OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_silencieux()
+    test_recepteur()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,59 @@
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Evolution.EvolutionManager import EvolutionManager
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+
+
+def build_graph(count: int = 50, edges: int = 300) -> Graph:
+    rng = np.random.default_rng(7)
+    names = [f"C{index}" for index in range(count)]
+    graph = Graph()
+    personalities = rng.uniform(-1.0, 1.0, (count, 5))
+    personalities[0] = 0.0  # personnalité nulle : similarité 0.5
+    graph.addNodes(names, personalities=personalities)
+    pairs = sorted({(int(a), int(b)) for a, b in rng.integers(0, count, (edges, 2)) if a != b})
+    graph.addEdges([names[a] for a, _ in pairs], [names[b] for _, b in pairs],
+                   rng.uniform(-1.0, 1.0, (len(pairs), 3)))
+    return graph
+
+
+def test_derive():
+    """Test de la dérive vectorisée des relations"""
+    print("=" * 50)
+    print("TEST 1: Dérive des relations")
+    print("=" * 50)
+
+    graph = build_graph()
+    store = graph.store
+    before = {key: relationship.values.copy() for key, relationship in graph._edges.items()}
+
+    rows = EvolutionManager(graph, rng=np.random.default_rng(3)).updateRelationships()
+    noise = np.random.default_rng(3).uniform(-0.1, 0.1, len(rows))
+
+    # Même formule que le parcours relation par relation (getMixPersonality, getMix, update)
+    for row, variance in zip(rows.tolist(), noise):
+        source = graph.getNodeById(int(store.edgeSource[row]))
+        target = graph.getNodeById(int(store.edgeTarget[row]))
+        personality = (Personality.getMixPersonality(source.personality, target.personality) - 0.5) * 0.1
+        change = max(-1.0, min(1.0, personality + variance))
+        expected = TypeRelationship(*before[(source.id, target.id)])
+        expected.update(change)
+        assert np.allclose(store.relationships[row], expected.values)
+    assert len(rows) == len(graph.listEdge)
+
+    # Scope : seules les relations sortantes des characters gérés
+    scoped = EvolutionManager(graph, scope={1, 2, 3}, rng=np.random.default_rng(0)).updateRelationships()
+    assert set(store.edgeSource[scoped].tolist()) <= {1, 2, 3}
+    print("Dérive des relations OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_derive()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
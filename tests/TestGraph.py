@@ -0,0 +1,352 @@
+import heapq
+import random
+
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Relationships.Relationship import Relationship
+from src.pheme.Relationships.TypeRelationship import newRelatioship_Friendly, newRelatioship_Unfriendly
+
+
+def build_graph():
+    graph = Graph()
+    for name in ["Alice", "Bob", "Charlie", "Diana"]:
+        graph.addNode(name, Personality(), Emotions())
+    graph.addEdge("Alice", "Bob", newRelatioship_Friendly())
+    graph.addEdge("Alice", "Charlie", newRelatioship_Unfriendly(), informational_distance=3)
+    graph.addEdge("Bob", "Alice", newRelatioship_Friendly())
+    graph.addEdge("Diana", "Alice", newRelatioship_Friendly())
+    return graph
+
+
+def test_index():
+    """Test des index nom -> character et (source, cible) -> relation"""
+    print("=" * 50)
+    print("TEST 1: Index du graph")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice = graph.getNode("Alice")
+
+    assert alice.name == "Alice"
+    assert graph.getNode("Nobody") is None
+    assert graph.getEdge("Alice", "Charlie").informational_distance == 3
+    assert graph.getEdge("Charlie", "Alice") is None
+    assert [c.name for c in graph.getNeighbors(alice)] == ["Bob", "Charlie"]
+    assert [c.name for c in graph.getInNeighbors(alice)] == ["Bob", "Diana"]
+
+    # Ajouter une relation existante la remplace
+    graph.addEdge("Alice", "Bob", newRelatioship_Unfriendly())
+    assert len([e for e in graph.listEdge if e.source == "Alice" and e.target == "Bob"]) == 1
+    print("Index OK")
+
+    print()
+
+
+def test_suppression():
+    """Test de la cohérence des index après suppressions"""
+    print("=" * 50)
+    print("TEST 2: Suppressions")
+    print("=" * 50)
+
+    graph = build_graph()
+    graph.removeEdge("Alice", "Bob")
+    assert graph.getEdge("Alice", "Bob") is None
+    assert [c.name for c in graph.getInNeighbors(graph.getNode("Bob"))] == []
+
+    graph.removeNode(graph.getNode("Alice"))
+    assert graph.getNode("Alice") is None
+    assert graph.getEdge("Bob", "Alice") is None
+    assert graph.getNeighbors(graph.getNode("Diana")) == []
+    assert graph.listEdge == []
+    print("Suppressions OK")
+
+    print()
+
+
+def test_renommage():
+    """Test du renommage d'un personnage"""
+    print("=" * 50)
+    print("TEST 3: Renommage")
+    print("=" * 50)
+
+    graph = build_graph()
+    graph.updateNode("Alice", "Alicia", Personality(), Emotions())
+
+    alicia = graph.getNode("Alicia")
+    assert graph.getNode("Alice") is None
+    assert graph.getEdge("Alicia", "Bob") is not None
+    assert graph.getEdge("Diana", "Alicia") is not None
+    assert sorted(c.name for c in graph.getNeighbors(alicia)) == ["Bob", "Charlie"]
+    assert sorted(c.name for c in graph.getInNeighbors(alicia)) == ["Bob", "Diana"]
+    assert graph.getEdge("Alicia", "Charlie").informational_distance == 3
+
+    # Nom déjà pris : erreur, et aucun des deux characters n'est modifié
+    bob = graph.getNode("Bob")
+    before = (alicia.emotions.values.copy(), bob.emotions.values.copy())
+    try:
+        graph.updateNode("Alicia", "Bob", Personality(), Emotions(happiness=1.0))
+        assert False
+    except ValueError:
+        pass
+    assert graph.getNode("Alicia") is alicia and graph.getNode("Bob") is bob
+    assert np.array_equal(alicia.emotions.values, before[0]) and np.array_equal(bob.emotions.values, before[1])
+    print("Renommage OK")
+
+    print()
+
+
+def test_operations_groupees():
+    """Test des suppressions et renommages groupés"""
+    print("=" * 50)
+    print("TEST 4: Opérations groupées")
+    print("=" * 50)
+
+    graph = build_graph()
+    bob = graph.getNode("Bob")
+    graph.renameNodes({"Alice": "Bob", "Bob": "Alice"})
+
+    assert graph.getNode("Alice") is bob
+    assert graph.getEdge("Bob", "Alice").target == "Alice"
+    assert graph.getEdge("Bob", "Charlie").informational_distance == 3
+    assert graph.getEdge("Diana", "Bob") is not None
+    assert set(graph.toNetworkx().edges()) == {(e.source, e.target) for e in graph.listEdge}
+
+    graph.removeNodes([graph.getNode("Bob"), graph.getNode("Charlie")])
+    assert graph.getNodeNames() == ["Alice", "Diana"]  # les ids (donc l'ordre) survivent au renommage
+    assert graph.listEdge == []
+    assert graph.getNeighbors(graph.getNode("Diana")) == []
+    print("Opérations groupées OK")
+
+    print()
+
+
+def test_miroir_networkx():
+    """Test du miroir networkx construit et resynchronisé à la demande"""
+    print("=" * 50)
+    print("TEST 5: Miroir networkx")
+    print("=" * 50)
+
+    graph = build_graph()
+    assert graph._nxGraph is None  # rien n'est construit tant que personne ne le lit
+
+    nxGraph = graph.toNetworkx()
+    assert set(nxGraph.nodes()) == {"Alice", "Bob", "Charlie", "Diana"}
+    assert nxGraph.edges["Alice", "Charlie"]["informational_distance"] == 3
+
+    graph.updateNode("Alice", "Alicia", Personality(), Emotions())
+    graph.removeEdge("Bob", "Alicia")
+    graph.addNode("Eve", Personality(), Emotions())
+    graph.updateEdge("Diana", "Alicia", newRelatioship_Unfriendly())
+
+    nxGraph = graph.toNetworkx()
+    assert set(nxGraph.nodes()) == set(graph.getNodeNames())
+    assert set(nxGraph.edges()) == {(e.source, e.target) for e in graph.listEdge}
+    assert nxGraph.nodes["Alicia"]["emotions"] is graph.getNode("Alicia").emotions
+    print("Miroir networkx OK")
+
+    print()
+
+
+def test_chargement_groupe():
+    """Test du chargement d'un monde depuis des colonnes"""
+    print("=" * 50)
+    print("TEST 6: Chargement groupé")
+    print("=" * 50)
+
+    names = [f"C{i}" for i in range(1000)]
+    personalities = np.random.uniform(-1.0, 1.0, (1000, 5))
+    emotions = np.random.uniform(0.0, 1.0, (1000, 6))
+    sources = np.arange(999)
+    targets = np.arange(1, 1000)
+    sternberg = np.random.uniform(-1.0, 1.0, (999, 3))
+    sternberg[0] = [2.0, -3.0, 0.5]  # hors bornes : clampé
+
+    graph = Graph.fromColumns(names, personalities, emotions, sources, targets, sternberg,
+                              informational_distances=np.full(999, 2))
+
+    c10 = graph.getNode("C10")
+    assert np.allclose(c10.personality.asArray(), personalities[10])
+    assert np.allclose(c10.emotions.asArray(), emotions[10])
+    assert [c.name for c in graph.getNeighbors(c10)] == ["C11"]
+    assert [c.name for c in graph.getInNeighbors(c10)] == ["C9"]
+
+    edge = graph.getEdge("C0", "C1")
+    assert (edge.typeRelationship.privacy, edge.typeRelationship.commitment) == (1.0, -1.0)
+    assert edge.informational_distance == 2
+    assert edge.confidence == Relationship("C0", "C1", edge.typeRelationship).confidence
+
+    # Les relations peuvent aussi être désignées par nom, et s'ajouter au monde existant
+    graph.addNodes(["Eve"], validated=True)
+    graph.addEdges(["Eve", "C5"], ["C5", "Eve"], [[0.5, 0.5, 0.5], [0.1, 0.1, 0.1]])
+    assert graph.getEdge("C5", "Eve").typeRelationship.nom == "Connaissance"
+    assert len(graph.listEdge) == 1001
+    print("Chargement groupé OK")
+
+    print()
+
+
+def test_identifiants():
+    """Test des ids entiers et de la table d'interning des noms"""
+    print("=" * 50)
+    print("TEST 7: Identifiants")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice = graph.getNode("Alice")
+    bob = graph.getNode("Bob")
+    relationship = graph.getEdge("Alice", "Bob")
+
+    assert graph.getNodeById(alice.id) is alice
+    assert graph.getEdgeById(alice.id, bob.id) is relationship
+    assert (relationship.sourceId, relationship.targetId) == (alice.id, bob.id)
+
+    # Renommer ne change ni l'id ni les relations, seulement le nom résolu
+    graph.renameNodes({"Alice": "Alicia"})
+    assert alice.id == graph.getNodeId("Alicia") and alice.name == "Alicia"
+    assert relationship.source == "Alicia"
+    assert graph.getEdge("Alicia", "Bob") is relationship
+
+    # Une relation vers un nom inconnu réserve un id, libéré avec sa dernière relation
+    graph.addEdge("Bob", "Eve", newRelatioship_Friendly())
+    eveId = graph.store.nodeIds["Eve"]
+    assert graph.getNode("Eve") is None
+    assert [c.name for c in graph.getNeighbors(bob)] == ["Alicia"]
+    graph.addNode("Eve", Personality(), Emotions())
+    assert graph.getNode("Eve").id == eveId
+    assert [c.name for c in graph.getNeighbors(bob)] == ["Alicia", "Eve"]
+
+    graph.addEdge("Charlie", "Frank", newRelatioship_Friendly())
+    graph.removeEdge("Charlie", "Frank")
+    assert "Frank" not in graph.store.nodeIds
+    print("Identifiants OK")
+
+    print()
+
+
+def test_flux_modifications():
+    """Test du ChangeSet produit à chaque tick"""
+    print("=" * 50)
+    print("TEST 8: Flux des modifications")
+    print("=" * 50)
+
+    graph = build_graph()
+    received = []
+    graph.enableChangeTracking()
+    graph.subscribeChanges(received.append)
+
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    oldHappiness = alice.emotions.happiness
+    alice.emotions.happiness = 0.75
+    alice.emotions.happiness = 0.8  # seule la valeur de début de période compte
+    graph.getEdge("Alice", "Bob").typeRelationship.privacy = -0.5
+    graph.addEdge("Bob", "Charlie", newRelatioship_Friendly())
+    graph.removeEdge("Diana", "Alice")
+    graph.renameNodes({"Charlie": "Charles"})
+
+    changes = graph.commitChanges(tick=1)
+    assert received == [changes] and graph.pullChanges() == [changes]
+    assert changes.nodes[alice.id]["emotions"][0][0] == oldHappiness
+    assert changes.nodes[alice.id]["emotions"][1][0] == 0.8
+    assert list(changes.nodes) == [alice.id]
+    assert changes.edges[(alice.id, bob.id)]["relationship"][1][0] == -0.5
+    charlesId = graph.getNodeId("Charles")
+    assert changes.addedEdges == [(bob.id, charlesId)]
+    assert changes.removedEdges == [(graph.getNodeId("Diana"), alice.id)]
+    assert changes.renamedNodes == {charlesId: ("Charlie", "Charles")}
+    assert changes.names[charlesId] == "Charles"
+
+    # Période suivante : une écriture qui ne change rien n'apparaît pas
+    alice.emotions.happiness = 0.8
+    graph.removeNode(graph.getNode("Diana"))
+    changes = graph.commitChanges(tick=2)
+    assert changes.nodes == {} and changes.removedNodes == [3] and changes.names[3] == "Diana"
+    print("Flux des modifications OK")
+
+    print()
+
+
+def reference_delays(graph, source):
+    """Dijkstra de référence, recalculé de zéro."""
+    delays = {source.id: 0}
+    heap = [(0, source.id)]
+    while heap:
+        delay, nodeId = heapq.heappop(heap)
+        if delay > delays[nodeId]:
+            continue
+        for relationship in graph.getOutEdges(graph.getNodeById(nodeId)):
+            if graph.getNodeById(relationship.targetId) is None:
+                continue
+            arrival = delay + relationship.informational_distance
+            if arrival < delays.get(relationship.targetId, float("inf")):
+                delays[relationship.targetId] = arrival
+                heapq.heappush(heap, (arrival, relationship.targetId))
+    return delays
+
+
+def test_delais_arrivee():
+    """Test des délais d'arrivée des infos, tenus à jour quand la topologie change"""
+    print("=" * 50)
+    print("TEST 9: Délais d'arrivée")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob, charlie, diana = (graph.getNode(name) for name in ["Alice", "Bob", "Charlie", "Diana"])
+    assert graph.getInformationDelay(alice, charlie) == 3
+    assert graph.getInformationDelay(diana, charlie) == 4
+    assert graph.getInformationDelay(charlie, alice) is None
+    assert [c.name for c in graph.getInformedWithin(diana, 2)] == ["Diana", "Alice", "Bob"]
+
+    graph.addEdge("Bob", "Charlie", newRelatioship_Friendly())
+    assert graph.getInformationDelay(diana, charlie) == 3
+    graph.getEdge("Alice", "Bob").informational_distance = 5
+    assert graph.getInformationDelay(diana, charlie) == 4
+    graph.removeEdge("Alice", "Charlie")
+    assert graph.getInformationDelay(diana, charlie) == 7
+    graph.removeNode(bob)
+    assert graph.getInformationDelay(diana, charlie) is None
+
+    # Modifications aléatoires : les caches restent égaux à un calcul complet
+    rng = random.Random(3)
+    graph = Graph()
+    names = [f"C{i}" for i in range(25)]
+    for name in names:
+        graph.addNode(name, Personality(), Emotions())
+    for _ in range(300):
+        action = rng.random()
+        a, b = rng.sample(names, 2)
+        if action < 0.5:
+            graph.addEdge(a, b, newRelatioship_Friendly(), informational_distance=rng.randint(1, 5))
+        elif action < 0.75 and graph.listEdge:
+            edge = rng.choice(graph.listEdge)
+            graph.removeEdge(edge.source, edge.target)
+        elif graph.listEdge:
+            rng.choice(graph.listEdge).informational_distance = rng.randint(1, 5)
+        if rng.random() < 0.05 and graph.getNode(a) is not None:
+            graph.removeNode(graph.getNode(a))
+        elif rng.random() < 0.05 and graph.getNode(a) is None:
+            graph.addNode(a, Personality(), Emotions())
+        source = graph.getNode(rng.choice(names))
+        if source is not None:
+            assert graph.arrivalIndex.delays(source.id) == reference_delays(graph, source)
+    print("Délais d'arrivée OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_index()
+    test_suppression()
+    test_renommage()
+    test_operations_groupees()
+    test_miroir_networkx()
+    test_chargement_groupe()
+    test_identifiants()
+    test_flux_modifications()
+    test_delais_arrivee()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,123 @@
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.Interaction import Interaction
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+
+
+def build_graph():
+    graph = Graph()
+    for name in ["Alice", "Bob"]:
+        graph.addNode(name, Personality(), Emotions())
+    return graph
+
+
+def test_tables():
+    """Test des tables précalculées par type d'interaction"""
+    print("=" * 50)
+    print("TEST 1: Tables des types")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    engine = InteractionsEngine(graph)
+    config = engine.config
+    kernels = engine.kernels
+
+    for description, factory in [("killed", Interactions.killed), ("helped", Interactions.helped),
+                                 ("laughed at", Interactions.laughed_at)]:
+        interaction = factory(alice, bob, 0.0)
+        assert interaction.kind == Interactions.KINDS[description]
+
+        # Cible et acteur (valence atténuée)
+        actor_vector = interaction.values.copy()
+        actor_vector[4] *= config.actor_valence_attenuation
+        for is_actor, vector in [(False, interaction.values), (True, actor_vector)]:
+            emotion, relationship, associated = kernels.direct(interaction, is_actor)
+            assert np.array_equal(emotion, config.interaction_to_emotion_direct @ vector)
+            assert np.array_equal(relationship, config.interaction_to_relationship_direct @ vector)
+            assert np.allclose(associated, (config.interaction_to_relationship_direct *
+                                            config.indirect_relationship_attenuation) @ vector)
+
+        # Observateur, info affaiblie
+        emotion, relationship = kernels.indirect(interaction, 0.5)
+        assert np.allclose(emotion, (config.interaction_to_emotion_direct *
+                                     config.indirect_emotion_attenuation) @ (interaction.values * 0.5))
+        assert np.allclose(relationship, (config.interaction_to_relationship_direct *
+                                          config.indirect_relationship_attenuation) @ (interaction.values * 0.5))
+
+    # Interaction libre ou modifiée : calcul par les matrices
+    custom = Interaction(alice, bob, "poked", 0.0, 0.1, 0.2, 0.3, 0.4, 0.5)
+    assert custom.kind is None
+    modified = Interactions.helped(alice, bob, 0.0)
+    modified.valence = -0.5
+    assert modified.kind is None
+    emotion, _, _ = kernels.direct(modified, False)
+    assert np.array_equal(emotion, config.interaction_to_emotion_direct @ modified.values)
+    print("Tables des types OK")
+
+    print()
+
+
+def test_recompilation():
+    """Test de la recompilation des tables quand la configuration change"""
+    print("=" * 50)
+    print("TEST 2: Recompilation")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    engine = InteractionsEngine(graph)
+    interaction = Interactions.insulted(alice, bob, 0.0)
+    kernels = engine.kernels
+    assert engine.kernels is kernels
+
+    engine.config.actor_valence_attenuation = 1.0
+    assert engine.kernels is not kernels
+    emotion, _, _ = engine.kernels.direct(interaction, True)
+    assert np.array_equal(emotion, engine.config.interaction_to_emotion_direct @ interaction.values)
+
+    # Modification en place d'une matrice : signalée par markChanged
+    engine.config.interaction_to_emotion_direct = engine.config.interaction_to_emotion_direct.copy()
+    kernels = engine.kernels
+    engine.config.interaction_to_emotion_direct[0] = 0.0
+    engine.config.markChanged()
+    assert engine.kernels is not kernels
+    emotion, _, _ = engine.kernels.direct(interaction, False)
+    assert emotion[0] == 0.0
+    print("Recompilation OK")
+
+    print()
+
+
+def test_moteur():
+    """Test : le moteur donne les mêmes résultats que les formules sur le vecteur"""
+    print("=" * 50)
+    print("TEST 3: Traitement par le moteur")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    engine = InteractionsEngine(graph)
+    interaction = Interactions.hugged(alice, bob, 0.0)
+
+    before = bob.emotions.values.copy()
+    expected = engine._apply_emotion_change_direct(before, interaction.values, bob.personality.values)
+    engine.processInteractionForCharacter(bob, interaction)
+    assert np.allclose(bob.emotions.values, np.clip(expected, 0.0, 1.0))
+    print("Traitement par le moteur OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_tables()
+    test_recompilation()
+    test_moteur()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
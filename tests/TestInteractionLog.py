@@ -0,0 +1,153 @@
+import os
+import tempfile
+
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.InteractionLog import InteractionLog
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+
+
+def test_journal():
+    """Test de l'historique en colonnes des interactions"""
+    print("=" * 50)
+    print("TEST 1: Journal des interactions")
+    print("=" * 50)
+
+    log = InteractionLog(capacity=2)
+    log.append(0, 1, 1.0, "helped", [0.1, 0.5, 0.3, 0.0, 0.8])
+    log.append(1, 0, 2.0, "insulted", [0.4, -0.6, 0.5, 0.0, -0.7])
+    log.append(0, 2, 5.0, "insulted", [0.4, -0.6, 0.5, 0.0, -0.7])
+    log.append(0, 1, 9.0, "killed", [0.9, -1.0, 1.0, 1.0, -1.0])
+    assert len(log) == 4 and log.descriptions == ["helped", "insulted", "killed"]
+
+    assert log.query(actor=0).tolist() == [0, 2, 3]
+    assert log.query(target=0).tolist() == [1]
+    assert log.query(actor=0, target=1).tolist() == [0, 3]
+    assert log.query(start=2.0, end=5.0).tolist() == [1, 2]
+    assert log.query(description="insulted").tolist() == [1, 2]
+    assert log.query(description="hugged").tolist() == []
+
+    # Actes hostiles de 0 depuis le tick 3
+    rows = log.query(actor=0, start=3.0)
+    assert rows[log.valences(rows) < 0].tolist() == [2, 3]
+
+    # Ticks ajoutés dans le désordre : parcours vectorisé
+    log.append(2, 0, 4.0, "hugged", [0.0, 0.8, 0.4, 1.0, 0.7])
+    assert log.query(start=3.0, end=6.0).tolist() == [2, 4]
+
+    path = os.path.join(tempfile.mkdtemp(), "journal.npz")
+    log.save(path)
+    loaded = InteractionLog.load(path)
+    assert np.array_equal(loaded.rows, log.rows)
+    assert loaded.query(actor=0, description="insulted").tolist() == [2]
+    print("Journal des interactions OK")
+
+    print()
+
+
+def test_registre():
+    """Test : toute interaction apprise est inscrite au journal du registre du graph (ligne = id)"""
+    print("=" * 50)
+    print("TEST 2: Journal du registre")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ["Alice", "Bob"]:
+        graph.addNode(name, Personality(), Emotions())
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    interaction = Interactions.insulted(alice, bob, 42.0)
+    bob.learnAboutInteraction(interaction)
+
+    registry = graph.store.interactions
+    iid = registry.idOf(interaction)
+    log = registry.log
+    row = log.rows[iid]
+    assert row['actor'] == alice.id and row['target'] == bob.id and row['tick'] == 42.0
+    assert log.descriptions[row['description']] == interaction.description
+    assert np.array_equal(row['vector'], interaction.values)
+    assert log.query(actor=alice.id, target=bob.id, start=42.0).tolist() == [iid]
+
+    # Id d'Alice libéré puis réutilisé : le nouveau character n'hérite pas de ses lignes,
+    # qui gardent l'id d'Alice et restent accessibles par les anciens titulaires
+    aliceId = alice.id
+    graph.removeNode(alice)
+    graph.addNode("Zoé", Personality(), Emotions())
+    zoe = graph.getNode("Zoé")
+    assert zoe.id == aliceId
+    assert log.query(actor=aliceId).tolist() == [] and log.rows[iid]['actor'] == aliceId
+    assert log.query(actor=aliceId, target=bob.id, released=True).tolist() == [iid]
+
+    later = Interactions.helped(zoe, bob, 50.0)
+    bob.learnAboutInteraction(later)
+    laterId = registry.idOf(later)
+    assert log.query(actor=zoe.id).tolist() == [laterId]
+    assert log.query(actor=aliceId, released=True).tolist() == [iid]
+    assert log.query(actor=bob.id, target=aliceId).tolist() == []
+
+    # Relu depuis un fichier : les lignes des anciens titulaires restent séparées
+    path = os.path.join(tempfile.mkdtemp(), "registre.npz")
+    log.save(path)
+    loaded = InteractionLog.load(path)
+    assert loaded.query(actor=aliceId).tolist() == [laterId]
+    assert loaded.query(actor=aliceId, released=True).tolist() == [iid]
+    print("Journal du registre OK")
+
+    print()
+
+
+def test_interactions_traitees():
+    """Test : toute interaction traitée par le moteur est inscrite au journal, une seule fois"""
+    print("=" * 50)
+    print("TEST 3: Journal des interactions traitées")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ["Alice", "Bob", "Charlie"]:
+        graph.addNode(name, Personality(), Emotions())
+    graph.addEdge("Charlie", "Alice", TypeRelationship(0.5, 0.5, 0.5))
+    alice, bob, charlie = (graph.getNode(name) for name in ["Alice", "Bob", "Charlie"])
+    engine = InteractionsEngine(graph)
+    log = graph.store.interactions.log
+
+    # Personne n'apprend ces interactions : elles sont journalisées quand même
+    broadcast = Interactions.insulted(alice, bob, 1.0)
+    engine.processInteractionForAll(broadcast)
+    engine.processInteractionForAll(broadcast)
+    engine.processInteractions([Interactions.killed(alice, charlie, 2.0), Interactions.helped(bob, alice, 3.0)])
+    engine.processInteractionForCharacter(bob, Interactions.hugged(charlie, bob, 4.0))
+    assert len(log) == 4
+    assert not any(character.knownInteractions for character in graph.listNode)
+
+    # Actes hostiles d'Alice
+    rows = log.query(actor=alice.id)
+    assert rows[log.valences(rows) < 0].tolist() == [0, 1]
+    assert [log.descriptions[code] for code in log.rows['description']] == ["insulted", "killed", "helped", "hugged"]
+
+    # Une interaction traitée puis apprise garde sa ligne
+    bob.learnAboutInteraction(broadcast)
+    assert len(log) == 4 and graph.store.interactions.idOf(broadcast) == 0
+
+    # Oubli activé : libérée du registre une fois trop vieille, même sans personne pour la connaître
+    engine.enableMemoryExpiry(5.0)
+    lonely = Interactions.praised(charlie, bob, 6.0)
+    engine.processInteractionForAll(lonely)
+    engine.tick(20)
+    assert len(graph.store.interactions) == 0 and len(log) == 5
+    print("Journal des interactions traitées OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_journal()
+    test_registre()
+    test_interactions_traitees()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,209 @@
+import gc
+import weakref
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions import Interactions
+from src.pheme.Characters.Character import Character
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+
+
+def build_graph():
+    graph = Graph()
+    for name in ["Alice", "Bob", "Charlie"]:
+        graph.addNode(name, Personality(), Emotions())
+    return graph
+
+
+def test_identifiants():
+    """Test des ids denses attribués aux interactions par le registre de chaque graph"""
+    print("=" * 50)
+    print("TEST 1: Ids des interactions")
+    print("=" * 50)
+
+    graph = build_graph()
+    registry = graph.store.interactions
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    first = Interactions.helped(alice, bob, 1.0)
+    second = Interactions.insulted(bob, alice, 2.0)
+    # Numérotées quand un character du graph les apprend
+    assert len(registry) == 0 and registry.idOf(first, register=False) is None
+    bob.learnAboutInteraction(second)
+    alice.learnAboutInteraction(first)
+    assert registry.idOf(second) == 0 and registry.idOf(first) == 1
+    assert registry.get(1) is first and registry.timestamps[0] == 2.0
+
+    # Un autre graph a ses propres ids
+    other = build_graph()
+    other.getNode("Charlie").learnAboutInteraction(first)
+    assert other.store.interactions.idOf(first) == 0 and other.getNode("Charlie").knows(first)
+    assert not graph.getNode("Charlie").knows(first)
+
+    # Character hors graph : son propre registre
+    loner = Character("Seul", Personality(), Emotions())
+    loner.learnAboutInteraction(second)
+    assert loner.knows(second) and not loner.knows(first) and list(loner.knownInteractions) == [second]
+
+    # Libérée : l'objet n'est plus gardé, l'id n'est pas réattribué
+    registry.release(0)
+    assert registry.get(0) is None and len(registry) == 1
+    assert registry.idOf(second) == 2
+    print("Ids des interactions OK")
+
+    print()
+
+
+def test_connaissances():
+    """Test des connaissances compactes des characters"""
+    print("=" * 50)
+    print("TEST 2: Connaissances")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob, charlie = graph.getNode("Alice"), graph.getNode("Bob"), graph.getNode("Charlie")
+    interactions = [Interactions.helped(alice, bob, float(t)) for t in range(5)]
+
+    # Apprises dans le désordre, stockées triées et sans doublon
+    for index in (3, 0, 4, 3):
+        alice.learnAboutInteraction(interactions[index])
+    assert not alice.learnAboutInteraction(interactions[0])
+    registry = graph.store.interactions
+    assert alice.knownInteractionIds().tolist() == sorted(registry.idOf(interactions[i]) for i in (0, 3, 4))
+    assert alice.knows(interactions[3]) and not alice.knows(interactions[1])
+    assert interactions[4] in alice.knownInteractions and interactions[2] not in alice.knownInteractions
+    assert len(alice.knownInteractions) == 3
+    # Par id croissant : dans l'ordre où le graph les a découvertes
+    assert list(alice.knownInteractions) == [interactions[3], interactions[0], interactions[4]]
+    assert alice.knownInteractionsSince(3.0) == [interactions[3], interactions[4]]
+
+    bob.learnAboutInteraction(interactions[3])
+    assert graph.getKnowers(interactions[3]) == [alice, bob]
+    assert graph.getKnowers(interactions[1]) == []
+
+    alice.forgetInteractionsOlderThan(4.0, 1.0)
+    assert list(alice.knownInteractions) == [interactions[3], interactions[4]]
+
+    # Compatibilité : les connaissances restent assignables
+    charlie.knownInteractions = {interactions[2], interactions[1]}
+    assert set(charlie.knownInteractions) == {interactions[1], interactions[2]}
+    charlie.knownInteractions = set()
+    assert not charlie.knownInteractions
+    print("Connaissances OK")
+
+    print()
+
+
+def test_oubli():
+    """Test de l'oubli des interactions anciennes à chaque tick"""
+    print("=" * 50)
+    print("TEST 3: Oubli des interactions")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob, charlie = graph.getNode("Alice"), graph.getNode("Bob"), graph.getNode("Charlie")
+    old = Interactions.helped(alice, bob, 0.0)
+    alice.learnAboutInteraction(old)
+
+    engine = InteractionsEngine(graph)
+    memory = engine.enableMemoryExpiry(3)
+    assert len(memory) == 1 and memory.nextExpiry() == 3.0
+
+    recent = Interactions.insulted(bob, charlie, 2.0)
+    for character in (alice, bob, charlie):
+        character.learnAboutInteraction(recent)
+    assert len(memory) == 2
+
+    # Une interaction datée de now - 3 est gardée, comme forgetInteractionsOlderThan
+    engine.tick(3)
+    assert alice.knows(old)
+    engine.tick(4)
+    assert not alice.knows(old) and alice.knows(recent)
+    assert len(memory) == 1
+    engine.tick(6)
+    assert not any(character.knownInteractions for character in (alice, bob, charlie))
+    assert len(memory) == 0 and memory.nextExpiry() is None
+    # Oubliées de tous : le registre du graph ne les garde plus
+    assert len(graph.store.interactions) == 0
+
+    # Réapprise après son oubli, l'interaction est de nouveau oubliée au tick suivant
+    bob.learnAboutInteraction(recent)
+    assert memory(7) == 1 and not bob.knows(recent)
+
+    engine.disableMemoryExpiry()
+    bob.learnAboutInteraction(recent)
+    engine.tick(8)
+    assert bob.knows(recent)
+
+    # Character supprimé : pas retenu par l'oubli, son id réattribué ne gêne pas
+    memory = engine.enableMemoryExpiry(3)
+    graph.addNode("Eve", Personality(), Emotions())
+    eve = graph.getNode("Eve")
+    late = Interactions.praised(alice, bob, 10.0)
+    eve.learnAboutInteraction(late)
+    alice.learnAboutInteraction(late)
+    removed, removedId = weakref.ref(eve), eve.id
+    graph.removeNode(eve)
+    del eve
+    gc.collect()
+    assert removed() is None
+    graph.addNode("Diana", Personality(), Emotions())
+    diana = graph.getNode("Diana")
+    assert diana.id == removedId
+    assert memory(14) == 2 and not alice.knows(late) and not diana.knownInteractions
+    assert graph.store.interactions.idOf(late, register=False) is None
+    print("Oubli des interactions OK")
+
+    print()
+
+
+def test_qui_sait():
+    """Test : getKnowers (index du registre) suit suppressions, ids réutilisés et oublis"""
+    print("=" * 50)
+    print("TEST 4: Qui connaît une interaction")
+    print("=" * 50)
+
+    graph = build_graph()
+    alice, bob, charlie = graph.getNode("Alice"), graph.getNode("Bob"), graph.getNode("Charlie")
+    rumour = Interactions.insulted(alice, bob, 1.0)
+    other = Interactions.helped(bob, charlie, 2.0)
+
+    def scan(interaction):
+        return {character.id for character in graph.listNode if character.knows(interaction)}
+
+    for character in (charlie, alice, bob):
+        character.learnAboutInteraction(rumour)
+    charlie.learnAboutInteraction(other)
+    assert graph.getKnowers(rumour) == [charlie, alice, bob]
+
+    # Supprimé puis id réutilisé par un character qui ne la connaît pas, puis qui l'apprend
+    removedId = alice.id
+    graph.removeNode(alice)
+    graph.addNode("Diana", Personality(), Emotions())
+    diana = graph.getNode("Diana")
+    assert diana.id == removedId
+    assert {character.id for character in graph.getKnowers(rumour)} == scan(rumour) == {charlie.id, bob.id}
+    diana.learnAboutInteraction(rumour)
+    assert graph.getKnowers(rumour) == [charlie, bob, diana]
+
+    # Oubli et connaissances réassignées
+    bob.forgetInteractionsOlderThan(10.0, 1.0)
+    charlie.knownInteractions = {other}
+    for interaction in (rumour, other):
+        assert {character.id for character in graph.getKnowers(interaction)} == scan(interaction)
+    assert graph.getKnowers(rumour) == [diana]
+    assert graph.getKnowers(Interactions.kissed(bob, charlie, 3.0)) == []
+    print("Qui connaît une interaction OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_identifiants()
+    test_connaissances()
+    test_oubli()
+    test_qui_sait()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,88 @@
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions import Interactions
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+
+
+def test_cache():
+    """Test du cache des modulations par la personnalité"""
+    print("=" * 50)
+    print("TEST 1: Modulations par la personnalité")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ["Alice", "Bob"]:
+        graph.addNode(name, Personality(), Emotions())
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    engine = InteractionsEngine(graph)
+    config = engine.config
+    modulation = engine.personalityModulation
+    assert graph.store.personalityModulation is modulation
+
+    def expected_compatibility():
+        return (config.personality_to_relationship @ alice.personality.values +
+                config.personality_to_relationship @ bob.personality.values) * config.personality_compatibility_weight
+
+    assert np.allclose(modulation.emotion(alice), config.personality_modulation @ alice.personality.values)
+    assert np.allclose(modulation.relationship(bob), config.personality_to_relationship @ bob.personality.values)
+    assert np.allclose(modulation.compatibility(alice, bob), expected_compatibility())
+
+    # Changement de personnalité (ou d'un trait) : vecteurs recalculés
+    alice.changePersonality(Personality(0.9, -0.9, 0.9, -0.9, 0.9))
+    assert np.allclose(modulation.emotion(alice), config.personality_modulation @ alice.personality.values)
+    assert np.allclose(modulation.compatibility(alice, bob), expected_compatibility())
+    bob.personality.neuroticism = -0.8
+    assert np.allclose(modulation.relationship(bob), config.personality_to_relationship @ bob.personality.values)
+    assert np.allclose(modulation.compatibility(alice, bob), expected_compatibility())
+
+    # Characters ajoutés après la création du cache
+    graph.addNodes([f"N{index}" for index in range(40)])
+    newcomer = graph.getNode("N39")
+    assert np.allclose(modulation.emotion(newcomer), config.personality_modulation @ newcomer.personality.values)
+
+    # Changement de configuration : nouveau cache
+    config.personality_compatibility_weight = 1.0
+    assert engine.personalityModulation is not modulation
+    assert np.allclose(engine.personalityModulation.compatibility(alice, bob), expected_compatibility())
+    print("Modulations par la personnalité OK")
+
+    print()
+
+
+def test_moteur():
+    """Test : une interaction traitée avec le cache donne le même résultat que les formules"""
+    print("=" * 50)
+    print("TEST 2: Traitement par le moteur")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ["Alice", "Bob"]:
+        graph.addNode(name, Personality(), Emotions())
+    alice, bob = graph.getNode("Alice"), graph.getNode("Bob")
+    graph.addEdge("Bob", "Alice", TypeRelationship(0.2, 0.1, 0.0))
+    engine = InteractionsEngine(graph)
+    engine.personalityModulation
+    bob.changePersonality(Personality(0.1, 0.2, 0.3, 0.4, 0.5))
+
+    interaction = Interactions.praised(alice, bob, 0.0)
+    relationship = graph.getEdgeById(bob.id, alice.id)
+    expected = engine._apply_relationship_change_direct(relationship.values.copy(), interaction.values,
+                                                        bob.personality.values, alice.personality.values)
+    engine.processInteractionForCharacter(bob, interaction)
+    assert np.allclose(relationship.values, expected)
+    print("Traitement par le moteur OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_cache()
+    test_moteur()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,179 @@
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+from src.pheme.Evolution.EvolutionManager import EvolutionManager
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+
+
+def build_graph(count: int = 60, edges: int = 400) -> Graph:
+    rng = np.random.default_rng(13)
+    names = [f"C{index}" for index in range(count)]
+    graph = Graph()
+    graph.addNodes(names, personalities=rng.uniform(-1.0, 1.0, (count, 5)),
+                   emotions=rng.uniform(0.0, 1.0, (count, 6)))
+    pairs = sorted({(int(a), int(b)) for a, b in rng.integers(0, count, (edges, 2)) if a != b})
+    graph.addEdges([names[a] for a, _ in pairs], [names[b] for _, b in pairs],
+                   rng.uniform(-1.0, 1.0, (len(pairs), 3)))
+    return graph
+
+
+def brute_average(graph: Graph, character) -> float:
+    """Moyenne des relations sortantes puis entrantes (boucle comptée une fois), relation par relation."""
+    averages = [relationship.typeRelationship.getAverage() for relationship in graph.getOutEdges(character)]
+    averages += [relationship.typeRelationship.getAverage() for relationship in graph.getInEdges(character)
+                 if relationship.sourceId != character.id]
+    return sum(averages) / len(averages) if averages else 0
+
+
+def check(graph: Graph):
+    aggregates = graph.relationshipAggregates
+    for character in graph.listNode:
+        assert np.isclose(aggregates.average(character.id), brute_average(graph, character))
+
+
+def test_mises_a_jour():
+    """Test : les moyennes suivent ajouts, suppressions et modifications de relations"""
+    print("=" * 50)
+    print("TEST 1: Mises à jour incrémentales")
+    print("=" * 50)
+
+    graph = build_graph()
+    check(graph)
+
+    # Ajouts (un par un, en bloc, boucle sur soi-même), suppressions
+    graph.addEdge("C0", "C59", TypeRelationship(0.9, 0.8, 0.7))
+    graph.addEdge("C3", "C3", TypeRelationship(-0.6, -0.2, 0.1))
+    graph.addEdges(["C1", "C2"], ["C4", "C5"], np.array([[0.5, 0.5, 0.5], [-0.4, 0.0, 0.2]]))
+    for relationship in graph.listEdge[:40]:
+        graph.removeEdge(relationship.source, relationship.target)
+    graph.addEdge("C7", "C8", TypeRelationship(0.2, 0.2, 0.2))
+    check(graph)
+
+    # Modifications champ par champ, ligne complète, suppression d'un character
+    relationship = graph.listEdge[10]
+    relationship.typeRelationship.privacy = -0.9
+    relationship.typeRelationship.update(0.5)
+    graph.listEdge[11].typeRelationship.setArray([0.1, 0.2, 0.3])
+    graph.removeNode(graph.getNode("C6"))
+    check(graph)
+
+    # Character sans relation : 0
+    graph.addNode("Seul", Personality(), Emotions())
+    assert graph.relationshipAggregates.average(graph.getNode("Seul").id) == 0
+    print("Mises à jour incrémentales OK")
+
+    print()
+
+
+def test_graph_vide():
+    """Test : moyennes exactes quand les agrégats sont créés avant toute relation"""
+    print("=" * 50)
+    print("TEST 3: Agrégats créés sur un graph sans relation")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ("A", "B", "C", "D"):
+        graph.addNode(name, Personality(), Emotions())
+    aggregates = graph.relationshipAggregates
+
+    graph.addEdge("A", "B", TypeRelationship(0.9, 0.6, 0.4))
+    graph.addEdge("B", "C", TypeRelationship(0.5, 0.5, 0.5))
+    graph.addEdge("C", "A", TypeRelationship(0.7, 0.8, 0.9))
+    graph.addEdge("D", "C", TypeRelationship(0.3, 0.2, 0.1))
+    graph.getEdge("B", "C").typeRelationship.setArray([0.2, -0.1, 0.6])
+    graph.removeEdge("D", "C")
+    check(graph)
+
+    sums, counts = aggregates.sums.copy(), aggregates.counts.copy()
+    aggregates.rebuild()
+    assert np.allclose(sums, aggregates.sums)
+    assert np.array_equal(counts, aggregates.counts)
+    print("Graph sans relation OK")
+
+    print()
+
+
+def test_ecriture_unitaire():
+    """Test : une relation écrite seule met les sommes à jour en O(1), sans passer par les tableaux"""
+    print("=" * 50)
+    print("TEST 4: Écriture d'une seule relation")
+    print("=" * 50)
+
+    graph = build_graph()
+    aggregates = graph.relationshipAggregates
+    calls = []
+    aggregates._add = lambda *args: calls.append('_add')
+    aggregates._grow = lambda: calls.append('_grow')
+
+    relationship = graph.listEdge[5]
+    relationship.typeRelationship.privacy = -0.7
+    relationship.typeRelationship.passion = 0.4
+    relationship.typeRelationship.setArray([0.3, -0.2, 0.9])
+    graph.listEdge[6].typeRelationship.update(0.2)
+    assert calls == []
+    del aggregates._add, aggregates._grow
+    check(graph)
+
+    sums = aggregates.sums.copy()
+    aggregates.rebuild()
+    assert np.allclose(sums, aggregates.sums)
+    print("Écriture d'une seule relation OK")
+
+    print()
+
+
+def test_evolution():
+    """Test : moyennes exactes après moteur et évolution, émotions vectorisées conformes"""
+    print("=" * 50)
+    print("TEST 2: Évolution des émotions")
+    print("=" * 50)
+
+    graph = build_graph()
+    graph.relationshipAggregates
+    engine = InteractionsEngine(graph)
+    c = graph.getNode
+    engine.processInteractionForAll(Interactions.insulted(c("C1"), c("C2"), 0.0))
+    engine.processInteractions([Interactions.helped(c("C3"), c("C4"), 1.0),
+                                Interactions.praised(c("C5"), c("C1"), 1.0)])
+    manager = EvolutionManager(graph, rng=np.random.default_rng(1))
+    manager.updateRelationships()
+    check(graph)
+
+    # Même formule que Emotions.updateEmotions, character par character
+    expected = {}
+    for character in graph.listNode:
+        emotions = Emotions(*character.emotions.values)
+        emotions.updateEmotions(manager.decayEmotion)
+        average = brute_average(graph, character)
+        if average > 0.3 or average < -0.2:
+            emotions.updateEmotions(average)
+        expected[character.id] = emotions.values.copy()
+    ids = manager.updateEmotions()
+    assert len(ids) == len(graph.listNode)
+    for character in graph.listNode:
+        assert np.allclose(character.emotions.values, expected[character.id])
+
+    # Scope : seuls les characters gérés changent
+    before = graph.store.emotions.copy()
+    scoped = EvolutionManager(graph, scope={1, 2, 3}).updateEmotions()
+    assert sorted(scoped.tolist()) == [1, 2, 3]
+    others = np.setdiff1d(graph.store.nodeRows(), scoped)
+    assert np.array_equal(graph.store.emotions[others], before[others])
+    print("Évolution des émotions OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_mises_a_jour()
+    test_evolution()
+    test_graph_vide()
+    test_ecriture_unitaire()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,270 @@
+import contextlib
+import io
+
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+from src.pheme.Interactions.PropagationScheduler import PropagationScheduler
+
+
+def test_file_par_tick():
+    """Test de la file des propagations rangée par tick d'arrivée"""
+    print("=" * 50)
+    print("TEST 1: File des propagations")
+    print("=" * 50)
+
+    scheduler = PropagationScheduler()
+    assert len(scheduler) == 0 and scheduler.nextArrival() is None
+    scheduler.schedule(5, "B", "i1")
+    scheduler.schedule(3, "C", "i2")
+    scheduler.schedule(5, "D", "i3")
+    scheduler.schedule(4, "E", "i4")
+    assert len(scheduler) == 4
+    assert scheduler.nextArrival() == 3
+    assert [entry[1] for entry in scheduler.entries()] == ["B", "C", "D", "E"]
+
+    assert scheduler.popDue(2) == []
+    # Ticks sautés : l'ordre de programmation est conservé
+    assert scheduler.popDue(5) == [("B", "i1", 1.0), ("C", "i2", 1.0), ("D", "i3", 1.0), ("E", "i4", 1.0)]
+    assert len(scheduler) == 0 and scheduler.nextArrival() is None
+    print("File des propagations OK")
+
+    print()
+
+
+def test_moteur():
+    """Test de la diffusion par le moteur avec la file par tick"""
+    print("=" * 50)
+    print("TEST 2: Diffusion dans le moteur")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ("Alice", "Bob", "Charlie", "Diana"):
+        graph.addNode(name, Personality(), Emotions())
+    graph.addEdge("Alice", "Bob", TypeRelationship(0.5, 0.5, 0.5), informational_distance=1)
+    graph.addEdge("Bob", "Charlie", TypeRelationship(0.5, 0.5, 0.5), informational_distance=2)
+    graph.addEdge("Alice", "Diana", TypeRelationship(0.5, 0.5, 0.5), informational_distance=3)
+
+    engine = InteractionsEngine(graph)
+    alice, bob, charlie, diana = (graph.getNode(name) for name in ("Alice", "Bob", "Charlie", "Diana"))
+    interaction = Interactions.helped(alice, bob, 0.0)
+    alice.learnAboutInteraction(interaction)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.diffuseInteraction(alice, interaction, 0)
+        assert engine.queueDepth == 2
+        assert engine.nextArrivalTick == 1
+        engine.tick(1)
+        assert interaction in bob.knownInteractions
+        assert interaction not in charlie.knownInteractions
+        # Bob a relayé l'info vers Charlie (arrivée au tick 3), Diana l'attend aussi au tick 3
+        pending = {target.name: tick for tick, target, _ in engine.pending_propagations}
+        assert pending["Charlie"] == 3 and pending["Diana"] == 3
+        engine.tick(3)
+
+    assert interaction in charlie.knownInteractions and interaction in diana.knownInteractions
+    assert engine.queueDepth == 0 and engine.nextArrivalTick is None
+
+    # Compatibilité : la liste des propagations reste assignable
+    engine.pending_propagations = [(7, charlie, interaction)]
+    assert engine.queueDepth == 1 and engine.nextArrivalTick == 7
+    print("Diffusion dans le moteur OK")
+
+    print()
+
+
+def test_frontiere():
+    """Test de la frontière : chaque character n'attend une info qu'une fois, à l'arrivée la plus précoce"""
+    print("=" * 50)
+    print("TEST 3: Frontière de diffusion")
+    print("=" * 50)
+
+    scheduler = PropagationScheduler()
+    assert scheduler.scheduleEarliest(6, "B", "i1")
+    assert not scheduler.scheduleEarliest(6, "B", "i1")
+    assert not scheduler.scheduleEarliest(8, "B", "i1")
+    assert scheduler.scheduleEarliest(4, "B", "i1")
+    assert scheduler.scheduleEarliest(5, "B", "i2")
+    assert len(scheduler) == 2
+    assert scheduler.scheduledArrival("B", "i1") == 4
+    assert scheduler.popDue(10) == [("B", "i1", 1.0), ("B", "i2", 1.0)]
+    assert len(scheduler) == 0 and scheduler.scheduledArrival("B", "i1") is None
+
+    # Annulation des attentes d'une cible (character supprimé)
+    scheduler.scheduleEarliest(3, "B", "i1")
+    scheduler.scheduleEarliest(3, "C", "i1")
+    scheduler.scheduleEarliest(4, "B", "i2")
+    scheduler.cancelTargets(["B"])
+    assert len(scheduler) == 1 and scheduler.scheduledArrival("B", "i1") is None
+    assert scheduler.scheduleEarliest(5, "B", "i1")
+    assert scheduler.popDue(10) == [("C", "i1", 1.0), ("B", "i1", 1.0)]
+
+    # Graph dense : la Source touche tous les relais, qui touchent tous les autres
+    graph = Graph()
+    graph.addNode("Source", Personality(), Emotions())
+    relays = [f"R{i}" for i in range(10)]
+    others = [f"O{i}" for i in range(10)]
+    for name in relays + others:
+        graph.addNode(name, Personality(), Emotions())
+    for i, relay in enumerate(relays):
+        graph.addEdge("Source", relay, TypeRelationship(0.5, 0.5, 0.5), informational_distance=1)
+        for j, other in enumerate(others):
+            graph.addEdge(relay, other, TypeRelationship(0.5, 0.5, 0.5), informational_distance=1 + (i + j) % 4)
+
+    engine = InteractionsEngine(graph)
+    source = graph.getNode("Source")
+    interaction = Interactions.praised(source, graph.getNode("R0"), 0.0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.diffuseInteraction(source, interaction, 0)
+        engine.tick(1)
+        # Une seule attente par character malgré les 10 chemins
+        assert engine.queueDepth <= len(others) + 1
+        assert all(engine.scheduler.scheduledArrival(graph.getNode(other), interaction) == 2 for other in others)
+        for tick in range(2, 6):
+            engine.tick(tick)
+    assert all(interaction in character.knownInteractions for character in graph.listNode)
+    print("Frontière de diffusion OK")
+
+    print()
+
+
+def test_diffusion_directe():
+    """Test de la diffusion programmée d'un coup par l'index des délais d'arrivée"""
+    print("=" * 50)
+    print("TEST 4: Diffusion directe")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ("Alice", "Bob", "Charlie", "Diana", "Eve"):
+        graph.addNode(name, Personality(), Emotions())
+    graph.addEdge("Alice", "Bob", TypeRelationship(0.5, 0.5, 0.5), informational_distance=1)
+    graph.addEdge("Bob", "Charlie", TypeRelationship(0.5, 0.5, 0.5), informational_distance=2)
+    graph.addEdge("Alice", "Charlie", TypeRelationship(0.5, 0.5, 0.5), informational_distance=4)
+    graph.addEdge("Charlie", "Diana", TypeRelationship(0.5, 0.5, 0.5), informational_distance=1)
+
+    engine = InteractionsEngine(graph)
+    alice, charlie, diana, eve = (graph.getNode(name) for name in ("Alice", "Charlie", "Diana", "Eve"))
+    assert engine.estimateArrivalTick(alice, diana, 10) == 14
+    assert engine.estimateArrivalTick(alice, eve, 10) is None
+    assert [c.name for c in engine.whoKnowsBy(alice, 10, 13)] == ["Alice", "Bob", "Charlie"]
+
+    interaction = Interactions.helped(alice, graph.getNode("Bob"), 10.0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.broadcastInteraction(alice, interaction, 10)
+        assert engine.queueDepth == 3
+        assert engine.scheduler.scheduledArrival(diana, interaction) == 14
+        for tick in range(11, 15):
+            engine.tick(tick)
+            # Même résultat que le bouche-à-oreille : informés au tick estimé
+            assert {c.name for c in engine.whoKnowsBy(alice, 10, tick)} == \
+                {c.name for c in graph.listNode if interaction in c.knownInteractions}
+    assert engine.queueDepth == 0 and interaction not in eve.knownInteractions
+    # Dernière arrivée passée : l'annonce n'est plus retenue par le moteur
+    assert not engine._broadcasts and not engine.scheduler.hasPending(interaction)
+    print("Diffusion directe OK")
+
+    print()
+
+
+def test_attenuation():
+    """Test de l'atténuation de la force d'une info à chaque relais"""
+    print("=" * 50)
+    print("TEST 5: Atténuation du bouche-à-oreille")
+    print("=" * 50)
+
+    scheduler = PropagationScheduler()
+    scheduler.scheduleEarliest(3, "B", "i1", 0.4)
+    assert not scheduler.scheduleEarliest(3, "B", "i1", 0.3)
+    assert scheduler.scheduleEarliest(3, "B", "i1", 0.6)
+    assert scheduler.popDue(3) == [("B", "i1", 0.6)]
+
+    # Chaîne de relations : l'info s'éteint au bout de quelques relais
+    graph = Graph()
+    names = [f"C{i}" for i in range(12)]
+    for name in names:
+        graph.addNode(name, Personality(), Emotions())
+    for source, target in zip(names, names[1:]):
+        graph.addEdge(source, target, TypeRelationship(0.5, 0.5, 0.5))
+    graph.addEdge("C0", "C11", TypeRelationship(0.5, 0.5, 0.5))
+    # C11 connaît C0 (l'acteur) : il réagit à l'info reçue
+    graph.addEdge("C11", "C0", TypeRelationship(0.5, 0.5, 0.5))
+
+    engine = InteractionsEngine(graph)
+    first = graph.getNode("C0")
+    interaction = Interactions.insulted(first, graph.getNode("C1"), 0.0)
+    factor = engine._relay_strength(graph.getEdge("C0", "C1"), 1.0)
+    assert 0.0 < factor < 1.0
+    hops = 1
+    while factor ** (hops + 1) >= engine.config.propagation_strength_threshold:
+        hops += 1
+
+    witness = graph.getNode("C11")
+    before = witness.emotions.values.copy()
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.diffuseInteraction(first, interaction, 0)
+        for tick in range(1, 20):
+            engine.tick(tick)
+    informed = [name for name in names if interaction in graph.getNode(name).knownInteractions]
+    assert informed == names[:hops + 1] + ["C11"]
+
+    # Les effets indirects sont proportionnels à la force reçue (C11 l'a reçue à la force factor)
+    reference = InteractionsEngine(graph)._apply_emotion_change_indirect(before, interaction.values * factor,
+                                                                          witness.personality.values)
+    assert np.allclose(witness.emotions.values, np.clip(reference, 0.0, 1.0))
+    print("Atténuation du bouche-à-oreille OK")
+
+    print()
+
+
+def test_participant_supprime():
+    """Test : un participant supprimé pendant que l'info est en route n'interrompt pas le moteur"""
+    print("=" * 50)
+    print("TEST 6: Participant supprimé avant l'arrivée de l'info")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ("Alice", "Bob", "Charlie"):
+        graph.addNode(name, Personality(), Emotions())
+    graph.addEdge("Alice", "Bob", TypeRelationship(0.5, 0.5, 0.5), informational_distance=2)
+
+    engine = InteractionsEngine(graph)
+    alice, bob, charlie = (graph.getNode(name) for name in ("Alice", "Bob", "Charlie"))
+    interaction = Interactions.insulted(alice, bob, 0.0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.diffuseInteraction(alice, interaction, 0)
+        graph.removeNode(alice)
+        before = bob.emotions.values.copy()
+        engine.tick(2)
+    # Bob réagit à l'insulte, sans relation créée vers l'acteur disparu
+    assert interaction in bob.knownInteractions
+    assert not np.array_equal(bob.emotions.values, before)
+    assert graph.listEdge == []
+
+    # Même chose en lot
+    other = Interactions.helped(bob, charlie, 1.0)
+    charlie_before = charlie.emotions.values.copy()
+    graph.removeNode(bob)
+    engine.processInteractions([interaction, other])
+    assert not np.array_equal(charlie.emotions.values, charlie_before)
+    assert graph.listEdge == []
+    print("Participant supprimé OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_file_par_tick()
+    test_moteur()
+    test_frontiere()
+    test_diffusion_directe()
+    test_attenuation()
+    test_participant_supprime()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,227 @@
+import contextlib
+import io
+import random
+
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Universe.Partitioner import Partitioner
+from src.pheme.Universe.ShardedSimulation import ShardedSimulation
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+
+
+def build_world(seed=1, count=40, edgeCount=160):
+    rng = random.Random(seed)
+    graph = Graph()
+    for i in range(count):
+        graph.addNode(f"C{i}", Personality(*[rng.uniform(-1, 1) for _ in range(5)]),
+                      Emotions(*[rng.random() for _ in range(6)]))
+    edges = set()
+    while len(edges) < edgeCount:
+        a, b = rng.randrange(count), rng.randrange(count)
+        if a != b and (a, b) not in edges:
+            edges.add((a, b))
+            graph.addEdge(f"C{a}", f"C{b}", TypeRelationship(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1)),
+                          informational_distance=rng.randint(1, 4))
+    return graph, rng
+
+
+def mutate_world(graph, rng, tick):
+    """Modifie la topologie et les valeurs du graph entre deux ticks."""
+    if tick == 5:
+        # Relations supprimées et characters supprimés (leurs ids seront réutilisés)
+        for relationship in rng.sample(graph.listEdge, 15):
+            graph.removeEdgeById(relationship.sourceId, relationship.targetId)
+        graph.removeNodes(rng.sample(graph.listNode, 3))
+        # Id réutilisé tout de suite : les infos en route vers l'ancien character ne lui arrivent pas
+        graph.addNode("N4", Personality(0.1, -0.4, 0.6, 0.2, -0.1), Emotions(0.5, 0.5, 0.5, 0.5, 0.5, 0.5))
+        for other in rng.sample(graph.listNode, 3):
+            if other.name != "N4":
+                graph.addEdge(other.name, "N4", TypeRelationship(0.2, 0.2, 0.2), informational_distance=2)
+    elif tick == 8:
+        # Nouveaux characters reliés au reste, un par un et en bloc
+        graph.addNode("N0", Personality(0.5, 0.2, -0.3, 0.1, 0.0), Emotions(*[rng.random() for _ in range(6)]))
+        graph.addNodes(["N1", "N2", "N3"], personalities=np.full((3, 5), 0.3), emotions=np.full((3, 6), 0.4))
+        names = [character.name for character in graph.listNode]
+        for name in ("N0", "N1", "N2", "N3"):
+            for other in rng.sample(names, 4):
+                if other != name and graph.getEdge(name, other) is None:
+                    graph.addEdge(name, other, TypeRelationship(0.4, -0.2, 0.6), informational_distance=rng.randint(1, 3))
+                    graph.addEdge(other, name, TypeRelationship(0.1, 0.3, -0.5), informational_distance=1)
+    elif tick == 11:
+        graph.renameNodes({"N1": "Renommé"})
+        graph.removeEdge(graph.listEdge[0].source, graph.listEdge[0].target)
+        graph.listNode[2].emotions.happiness = 0.9
+        graph.listEdge[3].typeRelationship.setArray([0.9, 0.9, 0.9])
+
+
+def run_world(sharded, mutate=False):
+    """Même scénario d'interactions joué par un InteractionsEngine ou une ShardedSimulation."""
+    graph, rng = build_world()
+    engine = ShardedSimulation(graph, shardCount=3) if sharded else InteractionsEngine(graph)
+    catalogue = [Interactions.killed, Interactions.helped, Interactions.kissed, Interactions.insulted,
+                 Interactions.hugged, Interactions.praised, Interactions.comforted, Interactions.laughed_at]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for tick in range(1, 20):
+            for k in range(3):
+                actor, target = rng.sample(graph.listNode, 2)
+                interaction = rng.choice(catalogue)(actor, target, float(tick))
+                actor.learnAboutInteraction(interaction)
+                target.learnAboutInteraction(interaction)
+                engine.processInteractionForCharacter(actor, interaction)
+                engine.processInteractionForCharacter(target, interaction)
+                if k == 0:
+                    engine.processInteractionForAll(interaction)
+                else:
+                    engine.diffuseInteraction(actor, interaction, tick)
+                    engine.diffuseInteraction(target, interaction, tick)
+            engine.tick(tick)
+            if mutate:
+                mutate_world(graph, rng, tick)
+                if sharded:
+                    engine.synchronize()
+    if sharded:
+        engine.close()
+    return graph
+
+
+def run_hub_world(sharded):
+    """
+    Un même acteur enchaîne les interactions dans un tour : les relations créées par les
+    premières (cible -> acteur) font des cibles précédentes des observateurs des suivantes.
+    """
+    graph, rng = build_world(seed=3, count=30, edgeCount=40)
+    engine = ShardedSimulation(graph, shardCount=3) if sharded else InteractionsEngine(graph)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for tick in range(1, 10):
+            actor = rng.choice(graph.listNode)
+            for k in range(4):
+                target = rng.choice([character for character in graph.listNode if character is not actor])
+                interaction = Interactions.insulted(actor, target, float(tick))
+                if k % 2:
+                    engine.processInteractionForGroup(graph.listNode, interaction)
+                else:
+                    engine.processInteractionForAll(interaction)
+                engine.diffuseInteraction(actor, interaction, tick)
+            engine.tick(tick)
+    if sharded:
+        engine.close()
+    return graph
+
+
+def test_partition():
+    """Test du découpage en shards (communautés et régions)"""
+    print("=" * 50)
+    print("TEST 1: Découpage")
+    print("=" * 50)
+
+    # Deux cliques reliées par un seul pont
+    graph = Graph()
+    for i in range(20):
+        graph.addNode(f"C{i}", Personality(), Emotions(), position=(i // 10 * 100.0 + i % 10, 0.0))
+    for group in (range(10), range(10, 20)):
+        for a in group:
+            for b in group:
+                if a != b:
+                    graph.addEdge(f"C{a}", f"C{b}", TypeRelationship(0.5, 0.5, 0.5))
+    graph.addEdge("C0", "C10", TypeRelationship(0.5, 0.5, 0.5))
+
+    partitioner = Partitioner(graph)
+    for method in ("community", "region"):
+        assignment = partitioner.partition(2, method)
+        assert sorted(np.bincount(assignment).tolist()) == [10, 10]
+        assert partitioner.cutSize(assignment) == 1
+    print("Découpage OK")
+
+    print()
+
+
+def test_meme_resultat():
+    """Test : la simulation répartie reproduit exactement le moteur mono-processus"""
+    print("=" * 50)
+    print("TEST 2: Résultats identiques au moteur mono-processus")
+    print("=" * 50)
+
+    reference = run_world(sharded=False)
+    sharded = run_world(sharded=True)
+    check_same(reference, sharded)
+    print("Résultats identiques OK")
+
+    print()
+
+
+def test_observateurs_du_tour():
+    """Test : les relations créées plus tôt dans le tour comptent pour les observateurs"""
+    print("=" * 50)
+    print("TEST 5: Observateurs apparus pendant le tour")
+    print("=" * 50)
+
+    check_same(run_hub_world(sharded=False), run_hub_world(sharded=True))
+    print("Observateurs du tour OK")
+
+    print()
+
+
+def check_same(reference, sharded):
+    assert np.array_equal(reference.store.emotions[reference.store.nodeRows()],
+                          sharded.store.emotions[sharded.store.nodeRows()])
+    assert [(e.source, e.target) for e in reference.listEdge] == [(e.source, e.target) for e in sharded.listEdge]
+    for expected, relationship in zip(reference.listEdge, sharded.listEdge):
+        assert np.array_equal(expected.values, relationship.values)
+    for expected, character in zip(reference.listNode, sharded.listNode):
+        assert len(expected.knownInteractions) == len(character.knownInteractions)
+
+
+def test_graph_modifie():
+    """Test : graph modifié entre deux ticks (relations et characters ajoutés ou supprimés)"""
+    print("=" * 50)
+    print("TEST 4: Graph modifié entre deux ticks")
+    print("=" * 50)
+
+    reference = run_world(sharded=False, mutate=True)
+    sharded = run_world(sharded=True, mutate=True)
+    assert [character.name for character in reference.listNode] == [character.name for character in sharded.listNode]
+    assert "Renommé" in [character.name for character in sharded.listNode]
+    check_same(reference, sharded)
+    print("Graph modifié OK")
+
+    print()
+
+
+def test_evolution_repartie():
+    """Test de l'évolution exécutée dans les shards"""
+    print("=" * 50)
+    print("TEST 3: Évolution répartie")
+    print("=" * 50)
+
+    graph, _ = build_world(seed=2, count=30, edgeCount=60)
+    initial = {(e.sourceId, e.targetId) for e in graph.listEdge}
+    with contextlib.redirect_stdout(io.StringIO()), ShardedSimulation(graph, shardCount=2, seed=5) as simulation:
+        simulation.evolve()
+
+    pairs = {(e.sourceId, e.targetId) for e in graph.listEdge}
+    created = pairs - initial
+    assert created
+    # Au plus une relation créée par paire de characters, comme EvolutionManager
+    assert all((target, source) not in pairs for source, target in created)
+    emotions = graph.store.emotions[graph.store.nodeRows()]
+    assert np.all((emotions >= 0.0) & (emotions <= 1.0))
+    print("Évolution répartie OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_partition()
+    test_meme_resultat()
+    test_evolution_repartie()
+    test_graph_modifie()
+    test_observateurs_du_tour()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Universe.SpatialIndex import SpatialIndex
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Interactions.Interaction import Interaction
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+
+
+def test_requetes():
+    """Test des requêtes par rayon et k plus proches voisins contre un parcours exhaustif"""
+    print("=" * 50)
+    print("TEST 1: Requêtes spatiales")
+    print("=" * 50)
+
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-100.0, 100.0, (500, 3))
+    index = SpatialIndex(cellSize=7.0)
+    for nodeId, point in enumerate(points):
+        index.insert(nodeId, point)
+
+    for center in rng.uniform(-120.0, 120.0, (20, 3)):
+        distances = np.linalg.norm(points - center, axis=1)
+        expected = [int(i) for i in np.argsort(distances, kind='stable') if distances[i] <= 25.0]
+        assert index.queryRadius(center, 25.0) == expected
+        assert index.queryNearest(center, 5) == [int(i) for i in np.argsort(distances, kind='stable')[:5]]
+
+    # Déplacements et suppressions
+    index.move(0, (1000.0, 1000.0, 1000.0))
+    index.remove(1)
+    assert index.queryNearest((1000.0, 1000.0), 1) == [0]
+    assert 1 not in index and len(index) == 499
+    assert index.queryNearest((0.0, 0.0, 0.0), 1000)[-1] == 0
+    print("Requêtes spatiales OK")
+
+    print()
+
+
+def test_graph_spatial():
+    """Test des positions de characters maintenues par le graph"""
+    print("=" * 50)
+    print("TEST 2: Positions dans le graph")
+    print("=" * 50)
+
+    graph = Graph(cellSize=5.0)
+    graph.addNode("Alice", Personality(), Emotions(), position=(0.0, 0.0))
+    graph.addNode("Bob", Personality(), Emotions(), position=(3.0, 4.0))
+    graph.addNode("Charlie", Personality(), Emotions(), position=(30.0, 0.0))
+    graph.addNode("Diana", Personality(), Emotions())  # hors de l'espace
+    alice, bob, charlie = graph.getNode("Alice"), graph.getNode("Bob"), graph.getNode("Charlie")
+
+    assert alice.position == (0.0, 0.0, 0.0)
+    assert [c.name for c in graph.getNodesInRadius(alice, 10.0)] == ["Bob"]
+    assert [c.name for c in graph.getNearestNodes("Alice", 2)] == ["Bob", "Charlie"]
+    assert graph.getPhysicalDistance(alice, bob) == 5.0
+    assert graph.getSpatialInformationalDistance(alice, charlie, speed=4.0) == 8
+    assert graph.getPhysicalDistance(alice, graph.getNode("Diana")) is None
+
+    # Déplacer un character met l'index à jour ; le supprimer l'en retire
+    charlie.position = (1.0, 1.0, 0.0)
+    assert [c.name for c in graph.getNodesInRadius((0.0, 0.0), 2.0)] == ["Alice", "Charlie"]
+    graph.removeNode(bob)
+    assert [c.name for c in graph.getNearestNodes(alice, 5)] == ["Charlie"]
+
+    # Chargement groupé avec positions
+    ids = graph.addNodes(["Eve", "Frank"], positions=[[2.0, 0.0], [50.0, 50.0]])
+    assert graph.getNodeById(int(ids[1])).position == (50.0, 50.0, 0.0)
+    assert [c.name for c in graph.getNodesInRadius(alice, 2.0)] == ["Charlie", "Eve"]
+
+    # Témoins d'une interaction
+    engine = InteractionsEngine(graph)
+    interaction = Interaction(alice, charlie, "salut", 0.0)
+    assert [c.name for c in engine.getBystanders(interaction, 2.5)] == ["Eve"]
+    assert math.isclose(graph.getPhysicalDistance(charlie, graph.getNode("Eve")), math.sqrt(2.0))
+    print("Positions dans le graph OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_requetes()
+    test_graph_spatial()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,134 @@
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Interactions import Interactions
+from src.pheme.Interactions.Interaction import Interaction
+from src.pheme.Interactions.InteractionsEngine import InteractionsEngine
+
+
+def build_town(seed: int, count: int = 200, edges: int = 1500, spread: float = 1.0) -> Graph:
+    """Graph aléatoire ; spread < 1 garde émotions et relations loin de leurs bornes."""
+    rng = np.random.default_rng(seed)
+    names = [f"C{index}" for index in range(count)]
+    graph = Graph()
+    graph.addNodes(names, personalities=rng.uniform(-1.0, 1.0, (count, 5)),
+                   emotions=0.5 + rng.uniform(-0.5, 0.5, (count, 6)) * spread)
+    pairs = {(int(a), int(b)) for a, b in rng.integers(0, count, (edges, 2)) if a != b}
+    sources = [names[a] for a, _ in sorted(pairs)]
+    targets = [names[b] for _, b in sorted(pairs)]
+    graph.addEdges(sources, targets, rng.uniform(-1.0, 1.0, (len(sources), 3)) * spread)
+    return graph
+
+
+def state(graph: Graph):
+    store = graph.store
+    edges = sorted((relationship.sourceId, relationship.targetId, tuple(relationship.values.tolist()))
+                   for relationship in graph.listEdge)
+    return store.emotions[store.nodeRows()].copy(), edges
+
+
+def test_diffusion_vectorisee():
+    """Test : processInteractionForAll vectorisé donne les mêmes résultats que le parcours character par character"""
+    print("=" * 50)
+    print("TEST 1: Diffusion vectorisée")
+    print("=" * 50)
+
+    scalar, vectorized = build_town(1), build_town(1)
+    scalar_engine, vectorized_engine = InteractionsEngine(scalar), InteractionsEngine(vectorized)
+
+    for step, (actor, target) in enumerate([("C0", "C1"), ("C5", "C0"), ("C17", "C42"), ("C3", "C3")]):
+        for graph, engine in ((scalar, scalar_engine), (vectorized, vectorized_engine)):
+            a, t = graph.getNode(actor), graph.getNode(target)
+            interaction = Interactions.insulted(a, t, float(step)) if step % 2 else \
+                Interaction(a, t, "waved", float(step), 0.1, 0.4, 0.2, 0.0, 0.3)
+            if engine is scalar_engine:
+                engine.processInteractionForGroup(graph.listNode, interaction)
+            else:
+                engine.processInteractionForAll(interaction)
+
+        scalar_emotions, scalar_edges = state(scalar)
+        vectorized_emotions, vectorized_edges = state(vectorized)
+        assert np.array_equal(scalar_emotions, vectorized_emotions)
+        assert scalar_edges == vectorized_edges
+    print("Diffusion vectorisée OK")
+
+    print()
+
+
+def test_lot():
+    """Test du traitement d'un lot d'interactions d'un même tick"""
+    print("=" * 50)
+    print("TEST 2: Lot d'interactions")
+    print("=" * 50)
+
+    def burst(graph):
+        c = graph.getNode
+        return [Interactions.helped(c("C0"), c("C1"), 5.0), Interactions.insulted(c("C2"), c("C0"), 5.0),
+                Interactions.praised(c("C1"), c("C7"), 5.0), Interactions.helped(c("C0"), c("C1"), 5.0),
+                Interaction(c("C9"), c("C9"), "sighed", 5.0, 0.0, 0.0, 0.1, 0.0, -0.1)]
+
+    # Loin des bornes : identique au traitement une par une, dans l'ordre
+    sequential, batched = build_town(3, spread=0.2), build_town(3, spread=0.2)
+    sequential_engine, batched_engine = InteractionsEngine(sequential), InteractionsEngine(batched)
+    for interaction in burst(sequential):
+        sequential_engine.processInteractionForAll(interaction)
+    batched_engine.processInteractions(burst(batched))
+    sequential_emotions, sequential_edges = state(sequential)
+    batched_emotions, batched_edges = state(batched)
+    assert np.array_equal(sequential_emotions, batched_emotions)
+    assert sequential_edges == batched_edges
+
+    # Reproductible, et clampé en fin de lot
+    first, second = build_town(4), build_town(4)
+    for graph in (first, second):
+        c = graph.getNode
+        InteractionsEngine(graph).processInteractions(
+            [Interactions.killed(c("C3"), c("C4"), 1.0) for _ in range(10)] + burst(graph),
+            strengths=[0.5] * 15)
+    assert np.array_equal(state(first)[0], state(second)[0]) and state(first)[1] == state(second)[1]
+    emotions, edges = state(first)
+    assert emotions.min() >= 0.0 and emotions.max() <= 1.0
+    assert all(-1.0 <= value <= 1.0 for _, _, values in edges for value in values)
+    print("Lot d'interactions OK")
+
+    print()
+
+
+def test_observateurs():
+    """Test des observateurs d'une interaction trouvés par les relations entrantes"""
+    print("=" * 50)
+    print("TEST 3: Observateurs")
+    print("=" * 50)
+
+    reference, indexed = build_town(5), build_town(5)
+    reference_engine, indexed_engine = InteractionsEngine(reference), InteractionsEngine(indexed)
+
+    actor, target = indexed.getNode("C10"), indexed.getNode("C20")
+    interaction = Interactions.threatened(actor, target, 0.0)
+    observers = indexed.getObservers(interaction)
+    expected = [character for character in indexed.listNode if character is not actor and character is not target
+                and (indexed_engine._has_relationship(character, actor)
+                     or indexed_engine._has_relationship(character, target))]
+    assert sorted(character.id for character in observers) == sorted(character.id for character in expected)
+    assert len(observers) > 0
+
+    # Traitement par groupe limité aux characters concernés : mêmes résultats
+    group = reference.listNode[::2] + [reference.getNode("C10")]
+    reference_interaction = Interactions.threatened(reference.getNode("C10"), reference.getNode("C20"), 0.0)
+    for character in group:
+        reference_engine.processInteractionForCharacter(character, reference_interaction)
+    indexed_engine.processInteractionForGroup(indexed.listNode[::2] + [actor], interaction)
+    assert np.array_equal(state(reference)[0], state(indexed)[0]) and state(reference)[1] == state(indexed)[1]
+    print("Observateurs OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_diffusion_vectorisee()
+    test_lot()
+    test_observateurs()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)
@@ -0,0 +1,160 @@
+import numpy as np
+
+from src.pheme.Universe.Graph import Graph
+from src.pheme.Characters.Personality import Personality
+from src.pheme.Characters.Emotions import Emotions
+from src.pheme.Relationships.TypeRelationship import TypeRelationship
+from src.pheme.Interactions import Interactions
+
+
+def test_vues():
+    """Test des objets rattachés au store (vues sur les lignes)"""
+    print("=" * 50)
+    print("TEST 1: Vues sur le store")
+    print("=" * 50)
+
+    graph = Graph()
+    emotions = Emotions(happiness=0.4, fear=0.2)
+    graph.addNode("Alice", Personality(openness=0.5), emotions)
+    alice = graph.getNode("Alice")
+    row = alice._row
+
+    # L'objet passé au graph devient une vue sur sa ligne
+    assert alice.emotions is emotions
+    emotions.happiness = 0.9
+    assert graph.store.emotions[row, 0] == 0.9
+    graph.store.emotions[row, 3] = 0.7
+    assert emotions.fear == 0.7
+    assert np.shares_memory(alice.emotions.values, graph.store.emotions)
+
+    # Remplacer les émotions écrit dans la même ligne
+    alice.emotions = Emotions(sadness=1.0)
+    assert graph.store.emotions[row, 1] == 1.0
+    assert emotions.happiness == 0.9  # l'ancien objet est détaché avec ses valeurs
+    print("Vues OK")
+
+    print()
+
+
+def test_croissance_et_suppression():
+    """Test de la croissance des tables et de la réutilisation des lignes"""
+    print("=" * 50)
+    print("TEST 2: Croissance et suppression")
+    print("=" * 50)
+
+    graph = Graph()
+    for i in range(100):
+        graph.addNode(f"C{i}", Personality(), Emotions(happiness=i / 100))
+    for i in range(99):
+        graph.addEdge(f"C{i}", f"C{i + 1}", TypeRelationship(0.1, 0.2, i / 100), informational_distance=2)
+
+    assert graph.getNode("C42").emotions.happiness == 0.42
+    assert graph.getEdge("C42", "C43").typeRelationship.passion == 0.42
+    assert graph.getEdge("C42", "C43").informational_distance == 2
+    assert len(graph.store.nodeRows()) == 100
+    assert len(graph.store.edgeRows()) == 99
+
+    c50 = graph.getNode("C50")
+    freedRow = c50._row
+    graph.removeNode(c50)
+    assert c50.emotions.happiness == 0.5  # détaché avec ses valeurs
+    assert len(graph.store.nodeRows()) == 99
+    assert len(graph.store.edgeRows()) == 97
+
+    graph.addNode("New", Personality(), Emotions(anger=0.3))
+    assert graph.getNode("New")._row == freedRow  # ligne libérée réutilisée
+    assert graph.getNode("New").emotions.anger == 0.3
+    print("Croissance et suppression OK")
+
+    print()
+
+
+def test_adjacence_csr():
+    """Test de l'adjacence CSR construite depuis le store"""
+    print("=" * 50)
+    print("TEST 3: Adjacence CSR")
+    print("=" * 50)
+
+    graph = Graph()
+    for name in ["A", "B", "C"]:
+        graph.addNode(name, Personality(), Emotions())
+    graph.addEdge("A", "B", TypeRelationship(0.5, 0.5, 0.5))
+    graph.addEdge("A", "C", TypeRelationship(-0.5, 0.0, 0.0))
+    graph.addEdge("C", "A", TypeRelationship(0.0, 0.0, 0.0))
+
+    store = graph.store
+    a, b, c = (graph.getNode(name)._row for name in ["A", "B", "C"])
+    indptr, targets, edges = store.outAdjacency()
+    assert sorted(targets[indptr[a]:indptr[a + 1]]) == sorted([b, c])
+    assert indptr[b + 1] - indptr[b] == 0
+    assert np.allclose(store.relationships[edges[indptr[c]:indptr[c + 1]]], [[0.0, 0.0, 0.0]])
+
+    indptr, sources, _ = store.inAdjacency()
+    assert list(sources[indptr[a]:indptr[a + 1]]) == [c]
+
+    graph.removeEdge("A", "B")
+    indptr, targets, _ = store.outAdjacency()
+    assert list(targets[indptr[a]:indptr[a + 1]]) == [c]
+    print("Adjacence CSR OK")
+
+    print()
+
+
+def test_instantanes():
+    """Test des instantanés copie-sur-écriture"""
+    print("=" * 50)
+    print("TEST 4: Instantanés")
+    print("=" * 50)
+
+    graph = Graph()
+    graph.addNode("Alice", Personality(), Emotions(happiness=0.5))
+    graph.addNode("Bob", Personality(), Emotions(happiness=0.1))
+    graph.addEdge("Alice", "Bob", TypeRelationship(0.5, 0.5, 0.5))
+    interaction = Interactions.helped(graph.getNode("Alice"), graph.getNode("Bob"), 1.0)
+    graph.getNode("Alice").learnAboutInteraction(interaction)
+
+    snapshot = graph.snapshot(tick=3)
+    # Pris en O(1) : aucune table n'est copiée tant que le monde ne change pas
+    assert np.shares_memory(snapshot.store.emotions, graph.store.emotions)
+
+    graph.getNode("Alice").emotions.happiness = 0.9
+    graph.renameNodes({"Bob": "Robert"})
+    graph.addNode("Charlie", Personality(), Emotions())
+    graph.getEdge("Alice", "Robert").typeRelationship.privacy = -1.0
+
+    # Seules les tables modifiées ont été dupliquées
+    assert not np.shares_memory(snapshot.store.emotions, graph.store.emotions)
+    assert np.shares_memory(snapshot.store.edgeSource, graph.store.edgeSource)
+
+    assert snapshot.tick == 3
+    assert snapshot.getNodeNames() == ["Alice", "Bob"]
+    assert snapshot.getNode("Alice").emotions.happiness == 0.5
+    assert snapshot.getEdge("Alice", "Bob").typeRelationship.privacy == 0.5
+    assert [c.name for c in snapshot.getNeighbors(snapshot.getNode("Alice"))] == ["Bob"]
+    assert graph.getNode("Alice").emotions.happiness == 0.9
+
+    # Les connaissances ne sont pas dans l'instantané
+    assert not snapshot.getNode("Alice").knownInteractions
+    assert not snapshot.getNode("Alice").knows(interaction)
+    assert graph.getNode("Alice").knows(interaction)
+
+    # L'instantané est en lecture seule
+    try:
+        snapshot.getNode("Bob").emotions.happiness = 1.0
+        assert False
+    except ValueError:
+        pass
+    print("Instantanés OK")
+
+    print()
+
+
+if __name__ == "__main__":
+    test_vues()
+    test_croissance_et_suppression()
+    test_adjacence_csr()
+    test_instantanes()
+
+    print("=" * 50)
+    print("Tous les tests sont terminés avec succès !")
+    print("=" * 50)